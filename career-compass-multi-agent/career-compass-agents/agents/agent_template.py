@@ -0,0 +1,44 @@
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from strands import Agent
+
+
+class AgentTemplate:
+    """
+    Recipe for a Strands Agent: shared model, system prompt and agent settings
+    Calling the template runs the prompt on a fresh agent, so no conversation
+    accumulates between requests. Building an agent from a shared model is cheap
+    (well under a millisecond); the model and its pooled client are reused
+    """
+
+    def __init__(self, model, system_prompt: str, **agent_kwargs):
+        self.model = model
+        self.system_prompt = system_prompt
+        self.agent_kwargs = agent_kwargs
+
+    def create(self, messages: Optional[List[Dict[str, Any]]] = None) -> Agent:
+        """A new agent, optionally seeded with an earlier conversation"""
+        return Agent(
+            model=self.model,
+            system_prompt=self.system_prompt,
+            messages=messages,
+            **self.agent_kwargs
+        )
+
+    def __call__(self, prompt, **invoke_kwargs):
+        """Stateless call: same signature and result as calling a Strands Agent"""
+        return self.create()(prompt, **invoke_kwargs)
+
+    @contextmanager
+    def conversation(self, messages: Optional[List[Dict[str, Any]]] = None):
+        """
+        Explicitly scoped multi-turn conversation; history is dropped on exit
+            with template.conversation() as agent:
+                agent("first question"); agent("follow-up")
+        """
+        agent = self.create(messages)
+        try:
+            yield agent
+        finally:
+            agent.messages.clear()
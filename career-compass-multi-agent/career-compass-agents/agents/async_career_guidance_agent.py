@@ -0,0 +1,136 @@
+import os
+import sys
+import asyncio
+from typing import Dict, List, Any, Optional
+
+# Add parent directory to Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from config import AgentConfig
+from agents.career_guidance_agent import CareerGuidanceBase
+from agents.history_manager import ConversationHistoryManager
+from agents.mcp_tools.async_knowledge_base_tool import AsyncKnowledgeBaseTool, LoopLocalClients
+
+
+class AsyncCareerGuidanceAgent(CareerGuidanceBase):
+    """
+    asyncio version of CareerGuidanceAgent
+    process_query has the same arguments and result dict but is awaited, so one event
+    loop can keep many sessions' Bedrock calls in flight on a single thread
+
+    Clients are opened lazily with aioboto3, per event loop, unless bedrock_runtime /
+    bedrock_agent_runtime (any objects with coroutine converse / retrieve methods) are
+    injected. Use as `async with AsyncCareerGuidanceAgent(...) as agent:` or call
+    close() when done; the agent can be reused across asyncio.run() calls
+    """
+
+    def __init__(
+        self,
+        knowledge_base_id: str,
+        region: str = "us-west-2",
+        kb_mode: str = "retrieve_and_generate",
+        local_retriever=None,
+        tool_timeout_seconds: float = 30.0,
+        history_manager: Optional[ConversationHistoryManager] = None,
+        bedrock_runtime=None,
+        bedrock_agent_runtime=None
+    ):
+        self.config = AgentConfig()
+        self.region = region
+        self.tool_timeout_seconds = tool_timeout_seconds
+        self.history_manager = history_manager or ConversationHistoryManager()
+        self.system_prompt = self.SYSTEM_PROMPT
+
+        self._clients = LoopLocalClients(region)
+        self.bedrock_runtime = bedrock_runtime
+
+        self.kb_tool = AsyncKnowledgeBaseTool(
+            knowledge_base_id=knowledge_base_id,
+            region=region,
+            mode=kb_mode,
+            local_retriever=local_retriever,
+            bedrock_agent_runtime=bedrock_agent_runtime
+        )
+
+    async def __aenter__(self) -> "AsyncCareerGuidanceAgent":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.kb_tool.close()
+        await self._clients.close()
+
+    async def _runtime(self):
+        if self.bedrock_runtime is not None:
+            return self.bedrock_runtime
+        return await self._clients.get('bedrock-runtime')
+
+    async def _handle_tool_use(self, tool_use_block: Dict) -> Dict:
+        """Handle tool execution"""
+        tool_input = tool_use_block['input']
+
+        if tool_use_block['name'] == self.kb_tool.name:
+            result = await self.kb_tool.execute(
+                query=tool_input['query'],
+                max_results=tool_input.get('max_results', 5)
+            )
+            return self._tool_result(tool_use_block, result)
+
+        return self._tool_error(tool_use_block, "Tool not found")
+
+    async def _run_tool_use(self, tool_use: Dict) -> Dict:
+        print(f"🔧 Agent using tool: {tool_use['name']}")
+        print(f"   Input: {tool_use['input']}")
+        try:
+            tool_result = await asyncio.wait_for(self._handle_tool_use(tool_use), self.tool_timeout_seconds)
+        except asyncio.TimeoutError:
+            print(f"⏱️ Tool {tool_use['name']} timed out after {self.tool_timeout_seconds}s")
+            tool_result = self._tool_error(tool_use, f"Tool timed out after {self.tool_timeout_seconds} seconds")
+        except Exception as e:
+            print(f"Error executing tool {tool_use['name']}: {str(e)}")
+            tool_result = self._tool_error(tool_use, f"Tool failed: {str(e)}")
+        return {"toolResult": tool_result}
+
+    async def process_query(
+        self,
+        user_query: str,
+        conversation_history: Optional[List[Dict]] = None,
+        max_iterations: int = 5
+    ) -> Dict[str, Any]:
+        """Process user query with agentic loop"""
+
+        messages = self._start_conversation(user_query, conversation_history)
+        iteration = 0
+        runtime = await self._runtime()
+
+        while iteration < max_iterations:
+            iteration += 1
+
+            response = await runtime.converse(**self._converse_request(messages))
+
+            stop_reason = response['stopReason']
+            output_message = response['output']['message']
+            messages.append(output_message)
+
+            if stop_reason != 'tool_use':
+                return self._final_result(stop_reason, output_message, messages, iteration)
+
+            # gather keeps the original toolUse order
+            tool_results = await asyncio.gather(*[
+                self._run_tool_use(tool_use) for tool_use in self._tool_uses(output_message)
+            ])
+            messages.append({
+                "role": "user",
+                "content": list(tool_results)
+            })
+
+        return self._timeout_result(messages, iteration)
+
+    async def chat(self, user_query: str) -> str:
+        """Simple chat interface"""
+        result = await self.process_query(user_query)
+        return result['response']
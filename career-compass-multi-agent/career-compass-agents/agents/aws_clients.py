@@ -0,0 +1,121 @@
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+# One pool per (service, region) shared by every agent, sized for concurrent sessions.
+# tcp_keepalive keeps idle pooled connections alive between Bedrock calls so they are
+# reused instead of paying a fresh TCP + TLS handshake
+DEFAULT_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=120,
+    retries={"mode": "adaptive", "max_attempts": 8}
+)
+
+
+class ClientRegistry:
+    """
+    Process-wide cache of boto3 sessions, clients and Strands BedrockModels
+    boto3 clients are thread-safe, so one client per (service, region) serves every
+    agent and thread. Resources are not thread-safe and are created per caller, but
+    from the cached session so service models are only loaded once
+    """
+
+    _default: Optional["ClientRegistry"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, client_config: Optional[Config] = None):
+        self.client_config = client_config or DEFAULT_CLIENT_CONFIG
+        self._sessions: Dict[str, boto3.Session] = {}
+        self._clients: Dict[Tuple[str, str], Any] = {}
+        self._models: Dict[Tuple, Any] = {}
+        self._lock = threading.RLock()
+        self.stats = {"clients_created": 0, "clients_reused": 0, "models_created": 0, "models_reused": 0}
+
+    @classmethod
+    def default(cls) -> "ClientRegistry":
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    @classmethod
+    def reset_default(cls) -> None:
+        """Drop the shared registry (tests, or after credentials change)"""
+        with cls._default_lock:
+            cls._default = None
+
+    def session(self, region: str) -> boto3.Session:
+        # boto3.Session construction is not thread-safe; build under the lock
+        with self._lock:
+            session = self._sessions.get(region)
+            if session is None:
+                session = self._sessions[region] = boto3.Session(region_name=region)
+            return session
+
+    def client(self, service_name: str, region: str):
+        key = (service_name, region)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = self.session(region).client(service_name, config=self.client_config)
+                self.stats["clients_created"] += 1
+            else:
+                self.stats["clients_reused"] += 1
+            return client
+
+    def resource(self, service_name: str, region: str):
+        with self._lock:
+            return self.session(region).resource(service_name, config=self.client_config)
+
+    def bedrock_model(
+        self,
+        region: str,
+        model_id: str = "us.amazon.nova-pro-v1:0",
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        top_p: float = 0.9
+    ):
+        """Strands BedrockModel shared by every agent with the same inference settings"""
+        from strands.models import BedrockModel
+
+        key = (region, model_id, temperature, max_tokens, top_p)
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = self._models[key] = BedrockModel(
+                    boto_session=self.session(region),
+                    boto_client_config=self.client_config,
+                    model_id=model_id,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    top_p=top_p
+                )
+                self.stats["models_created"] += 1
+            else:
+                self.stats["models_reused"] += 1
+            return model
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["clients"] = sorted(f"{service}@{region}" for service, region in self._clients)
+            return stats
+
+
+def get_client(service_name: str, region: str):
+    """Shared pooled boto3 client"""
+    return ClientRegistry.default().client(service_name, region)
+
+
+def get_resource(service_name: str, region: str):
+    """boto3 resource built on the shared session and pool settings"""
+    return ClientRegistry.default().resource(service_name, region)
+
+
+def get_bedrock_model(region: str, **settings):
+    """Shared Strands BedrockModel for these inference settings"""
+    return ClientRegistry.default().bedrock_model(region, **settings)
@@ -1,8 +1,9 @@
-import boto3
 import json
 import os
 import sys
-from typing import Dict, List, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Any, Optional, Iterator
 
 # Add parent directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -10,29 +11,18 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
 from config import AgentConfig
-from agents.mcp_tools.knowledge_base_tool import KnowledgeBaseTool
+from agents.mcp_tools.knowledge_base_tool import KnowledgeBaseTool, KnowledgeBaseToolOutput
+from agents.history_manager import ConversationHistoryManager
+from agents.aws_clients import get_client
 
-class CareerGuidanceAgent:
+class CareerGuidanceBase:
     """
-    Career Guidance Agent using Bedrock Knowledge Base
-    Follows Lab 2 workshop pattern with MCP tools
+    Request building and response handling shared by CareerGuidanceAgent and
+    AsyncCareerGuidanceAgent, which differ only in how Bedrock and the tool are called
+    Subclasses set config, system_prompt, kb_tool and history_manager
     """
     
-    def __init__(self, knowledge_base_id: str, region: str = "us-west-2"):
-        self.config = AgentConfig()
-        self.region = region
-        
-        self.bedrock_runtime = boto3.client(
-            'bedrock-runtime',
-            region_name=region
-        )
-        
-        self.kb_tool = KnowledgeBaseTool(
-            knowledge_base_id=knowledge_base_id,
-            region=region
-        )
-        
-        self.system_prompt = """You are a Career Guidance AI Assistant specializing in helping students with:
+    SYSTEM_PROMPT = """You are a Career Guidance AI Assistant specializing in helping students with:
         - Career path exploration and job descriptions
         - Interview preparation and tips
         - University recommendations for higher studies
@@ -51,35 +41,194 @@ class CareerGuidanceAgent:
         """Create tool configuration for Bedrock"""
         return [self.kb_tool.to_tool_definition()]
     
+    def _converse_request(self, messages: List[Dict]) -> Dict[str, Any]:
+        """Arguments for converse / converse_stream on the current transcript"""
+        self.history_manager.compact(messages)
+        return {
+            "modelId": self.config.BEDROCK_MODEL_ID,
+            "messages": messages,
+            "system": [{"text": self.system_prompt}],
+            "inferenceConfig": {
+                "temperature": self.config.TEMPERATURE,
+                "maxTokens": self.config.MAX_TOKENS,
+                "topP": self.config.TOP_P
+            },
+            "toolConfig": {
+                "tools": self._create_tool_config()
+            }
+        }
+    
+    @staticmethod
+    def _start_conversation(user_query: str, conversation_history: Optional[List[Dict]]) -> List[Dict]:
+        messages = conversation_history or []
+        messages.append({
+            "role": "user",
+            "content": [{"text": user_query}]
+        })
+        return messages
+    
+    @staticmethod
+    def _tool_uses(output_message: Dict) -> List[Dict]:
+        return [block['toolUse'] for block in output_message['content'] if 'toolUse' in block]
+    
+    @staticmethod
+    def _tool_result(tool_use_block: Dict, result: KnowledgeBaseToolOutput) -> Dict:
+        return {
+            "toolUseId": tool_use_block['toolUseId'],
+            "content": [
+                {
+                    "json": {
+                        "answer": result.answer,
+                        "sources": result.sources,
+                        "confidence": result.confidence
+                    }
+                }
+            ]
+        }
+    
+    @staticmethod
+    def _tool_error(tool_use_block: Dict, text: str) -> Dict:
+        return {
+            "toolUseId": tool_use_block['toolUseId'],
+            "content": [{"text": text}],
+            "status": "error"
+        }
+    
+    @staticmethod
+    def _final_result(stop_reason: str, output_message: Dict, messages: List[Dict], iteration: int) -> Dict[str, Any]:
+        """Result dict for a turn that did not ask for tools"""
+        if stop_reason == 'end_turn':
+            return {
+                "response": "".join(block.get('text', '') for block in output_message['content']),
+                "conversation_history": messages,
+                "iterations": iteration,
+                "status": "success"
+            }
+        return {
+            "response": f"Unexpected stop reason: {stop_reason}",
+            "conversation_history": messages,
+            "iterations": iteration,
+            "status": "error"
+        }
+    
+    @staticmethod
+    def _timeout_result(messages: List[Dict], iteration: int) -> Dict[str, Any]:
+        return {
+            "response": "Maximum iterations reached without completion",
+            "conversation_history": messages,
+            "iterations": iteration,
+            "status": "timeout"
+        }
+
+
+class CareerGuidanceAgent(CareerGuidanceBase):
+    """
+    Career Guidance Agent using Bedrock Knowledge Base
+    Follows Lab 2 workshop pattern with MCP tools
+    """
+    
+    def __init__(
+        self,
+        knowledge_base_id: str,
+        region: str = "us-west-2",
+        kb_mode: str = "retrieve_and_generate",
+        local_retriever=None,
+        max_tool_workers: int = 4,
+        tool_timeout_seconds: float = 30.0,
+        history_manager: Optional[ConversationHistoryManager] = None
+    ):
+        self.config = AgentConfig()
+        self.region = region
+        
+        # toolUse blocks from one model turn run concurrently on this pool; close() shuts it down
+        self.tool_timeout_seconds = tool_timeout_seconds
+        self.tool_executor = ThreadPoolExecutor(
+            max_workers=max_tool_workers,
+            thread_name_prefix="career-guidance-tool"
+        )
+        
+        # Keeps the resent transcript inside a token budget on long sessions
+        self.history_manager = history_manager or ConversationHistoryManager()
+        
+        # Shared pooled client; constructed once per process
+        self.bedrock_runtime = get_client('bedrock-runtime', region)
+        
+        # kb_mode="retrieve" returns ranked passages and lets this agent's model write
+        # the answer, instead of generating once in the tool and again here
+        self.kb_tool = KnowledgeBaseTool(
+            knowledge_base_id=knowledge_base_id,
+            region=region,
+            mode=kb_mode,
+            local_retriever=local_retriever
+        )
+        
+        self.system_prompt = self.SYSTEM_PROMPT
+    
+    def close(self) -> None:
+        """Shut down the tool pool without waiting for tools that are still running"""
+        self.tool_executor.shutdown(wait=False, cancel_futures=True)
+    
+    def __del__(self):
+        executor = getattr(self, "tool_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
     def _handle_tool_use(self, tool_use_block: Dict) -> Dict:
         """Handle tool execution"""
-        tool_name = tool_use_block['name']
         tool_input = tool_use_block['input']
         
-        if tool_name == self.kb_tool.name:
+        if tool_use_block['name'] == self.kb_tool.name:
             result = self.kb_tool.execute(
                 query=tool_input['query'],
                 max_results=tool_input.get('max_results', 5)
             )
-            
-            return {
-                "toolUseId": tool_use_block['toolUseId'],
-                "content": [
-                    {
-                        "json": {
-                            "answer": result.answer,
-                            "sources": result.sources,
-                            "confidence": result.confidence
-                        }
-                    }
-                ]
-            }
+            return self._tool_result(tool_use_block, result)
         
-        return {
-            "toolUseId": tool_use_block['toolUseId'],
-            "content": [{"text": "Tool not found"}],
-            "status": "error"
-        }
+        return self._tool_error(tool_use_block, "Tool not found")
+    
+    def _run_tool_uses(self, tool_uses: List[Dict], input_errors: Optional[Dict[str, str]] = None) -> List[Dict]:
+        """
+        Execute every toolUse from one turn concurrently, each with its own timeout
+        Results come back in the same order as tool_uses
+        
+        A timeout only abandons the tool: Python threads cannot be interrupted, so a
+        call that is already running keeps its worker until it returns. The clock
+        starts at submission, so tools queued behind hung ones time out and are
+        cancelled before they start rather than piling up
+        
+        input_errors maps toolUseId -> reason for tool uses whose input could not be
+        parsed; those get an error result without running
+        """
+        input_errors = input_errors or {}
+        futures = []
+        for tool_use in tool_uses:
+            if tool_use['toolUseId'] in input_errors:
+                futures.append((tool_use, None, None))
+                continue
+            print(f"🔧 Agent using tool: {tool_use['name']}")
+            print(f"   Input: {tool_use['input']}")
+            futures.append((tool_use, time.monotonic(), self.tool_executor.submit(self._handle_tool_use, tool_use)))
+        
+        tool_results = []
+        for tool_use, submitted_at, future in futures:
+            if future is None:
+                tool_results.append({"toolResult": self._tool_error(
+                    tool_use, f"Tool failed: {input_errors[tool_use['toolUseId']]}"
+                )})
+                continue
+            remaining = self.tool_timeout_seconds - (time.monotonic() - submitted_at)
+            try:
+                tool_result = future.result(timeout=max(remaining, 0))
+            except FutureTimeoutError:
+                future.cancel()
+                print(f"⏱️ Tool {tool_use['name']} timed out after {self.tool_timeout_seconds}s")
+                tool_result = self._tool_error(tool_use, f"Tool timed out after {self.tool_timeout_seconds} seconds")
+            except Exception as e:
+                print(f"Error executing tool {tool_use['name']}: {str(e)}")
+                tool_result = self._tool_error(tool_use, f"Tool failed: {str(e)}")
+            tool_results.append({"toolResult": tool_result})
+        
+        return tool_results
     
     def process_query(
         self,
@@ -89,32 +238,14 @@ class CareerGuidanceAgent:
     ) -> Dict[str, Any]:
         """Process user query with agentic loop"""
         
-        messages = conversation_history or []
+        messages = self._start_conversation(user_query, conversation_history)
         iteration = 0
         
-        # Add initial user message
-        messages.append({
-            "role": "user",
-            "content": [{"text": user_query}]
-        })
-        
         while iteration < max_iterations:
             iteration += 1
             
             # Invoke model with current conversation
-            response = self.bedrock_runtime.converse(
-                modelId=self.config.BEDROCK_MODEL_ID,
-                messages=messages,
-                system=[{"text": self.system_prompt}],
-                inferenceConfig={
-                    "temperature": self.config.TEMPERATURE,
-                    "maxTokens": self.config.MAX_TOKENS,
-                    "topP": self.config.TOP_P
-                },
-                toolConfig={
-                    "tools": self._create_tool_config()
-                }
-            )
+            response = self.bedrock_runtime.converse(**self._converse_request(messages))
             
             stop_reason = response['stopReason']
             output_message = response['output']['message']
@@ -122,55 +253,131 @@ class CareerGuidanceAgent:
             # Add assistant response to conversation
             messages.append(output_message)
             
-            if stop_reason == 'tool_use':
-                tool_results = []
-                
-                for content_block in output_message['content']:
-                    if 'toolUse' in content_block:
-                        tool_use = content_block['toolUse']
-                        print(f"🔧 Agent using tool: {tool_use['name']}")
-                        print(f"   Input: {tool_use['input']}")
-                        
-                        tool_result = self._handle_tool_use(tool_use)
-                        tool_results.append({"toolResult": tool_result})
+            if stop_reason != 'tool_use':
+                return self._final_result(stop_reason, output_message, messages, iteration)
+            
+            # Add tool results as user message
+            messages.append({
+                "role": "user",
+                "content": self._run_tool_uses(self._tool_uses(output_message))
+            })
+        
+        return self._timeout_result(messages, iteration)
+    
+    def _read_stream(self, stream) -> Iterator[Dict[str, Any]]:
+        """
+        Turn converse_stream events into text deltas, then one final "message" event
+        carrying the assembled assistant message, stop reason and any tool inputs
+        that were not valid JSON (e.g. cut off by a max_tokens stop)
+        """
+        blocks: Dict[int, Dict[str, Any]] = {}
+        stop_reason = None
+        
+        for event in stream:
+            if 'contentBlockStart' in event:
+                start = event['contentBlockStart']
+                tool_use = start.get('start', {}).get('toolUse')
+                if tool_use:
+                    blocks[start['contentBlockIndex']] = {
+                        "toolUse": {"toolUseId": tool_use['toolUseId'], "name": tool_use['name']},
+                        "input_json": ""
+                    }
+            
+            elif 'contentBlockDelta' in event:
+                index = event['contentBlockDelta']['contentBlockIndex']
+                delta = event['contentBlockDelta']['delta']
+                if 'text' in delta:
+                    block = blocks.setdefault(index, {"text": ""})
+                    block['text'] += delta['text']
+                    yield {"type": "text", "text": delta['text']}
+                elif 'toolUse' in delta:
+                    blocks[index]['input_json'] += delta['toolUse'].get('input', '')
+            
+            elif 'messageStop' in event:
+                stop_reason = event['messageStop']['stopReason']
+        
+        content = []
+        input_errors: Dict[str, str] = {}
+        for index in sorted(blocks):
+            block = blocks[index]
+            if 'toolUse' in block:
+                try:
+                    block['toolUse']['input'] = json.loads(block['input_json'] or "{}")
+                except ValueError as e:
+                    # Keep the block so the transcript still pairs it with a toolResult
+                    block['toolUse']['input'] = {}
+                    input_errors[block['toolUse']['toolUseId']] = f"incomplete tool input ({str(e)})"
+                content.append({"toolUse": block['toolUse']})
+            else:
+                content.append({"text": block['text']})
+        
+        yield {
+            "type": "message",
+            "message": {"role": "assistant", "content": content},
+            "stop_reason": stop_reason,
+            "input_errors": input_errors
+        }
+    
+    def stream_query(
+        self,
+        user_query: str,
+        conversation_history: Optional[List[Dict]] = None,
+        max_iterations: int = 5
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming variant of process_query built on converse_stream
+        
+        Yields events as they happen:
+            {"type": "text", "text": delta}            partial answer text
+            {"type": "tool_use", "name", "input"}      a tool is being called mid-answer
+            {"type": "done", "response", "conversation_history", "iterations", "status"}
+        """
+        
+        messages = self._start_conversation(user_query, conversation_history)
+        iteration = 0
+        
+        while iteration < max_iterations:
+            iteration += 1
+            
+            response = self.bedrock_runtime.converse_stream(**self._converse_request(messages))
+            
+            output_message, stop_reason, input_errors = None, None, {}
+            for event in self._read_stream(response['stream']):
+                if event['type'] == 'message':
+                    output_message, stop_reason = event['message'], event['stop_reason']
+                    input_errors = event['input_errors']
+                else:
+                    yield event
+            
+            messages.append(output_message)
+            
+            # A truncated tool call still gets an error result so the model can recover
+            if stop_reason == 'tool_use' or input_errors:
+                tool_uses = self._tool_uses(output_message)
+                for tool_use in tool_uses:
+                    if tool_use['toolUseId'] not in input_errors:
+                        yield {"type": "tool_use", "name": tool_use['name'], "input": tool_use['input']}
                 
-                # Add tool results as user message
                 messages.append({
                     "role": "user",
-                    "content": tool_results
+                    "content": self._run_tool_uses(tool_uses, input_errors)
                 })
-                
                 continue
             
-            elif stop_reason == 'end_turn':
-                final_response = ""
-                for content_block in output_message['content']:
-                    if 'text' in content_block:
-                        final_response += content_block['text']
-                
-                return {
-                    "response": final_response,
-                    "conversation_history": messages,
-                    "iterations": iteration,
-                    "status": "success"
-                }
-            
-            else:
-                return {
-                    "response": f"Unexpected stop reason: {stop_reason}",
-                    "conversation_history": messages,
-                    "iterations": iteration,
-                    "status": "error"
-                }
+            yield dict(self._final_result(stop_reason, output_message, messages, iteration), type="done")
+            return
         
-        return {
-            "response": "Maximum iterations reached without completion",
-            "conversation_history": messages,
-            "iterations": iteration,
-            "status": "timeout"
-        }
+        yield dict(self._timeout_result(messages, iteration), type="done")
     
     def chat(self, user_query: str) -> str:
         """Simple chat interface"""
         result = self.process_query(user_query)
-        return result['response']
\ No newline at end of file
+        return result['response']
+    
+    def chat_stream(self, user_query: str) -> Iterator[str]:
+        """Simple streaming chat interface: yields answer text as it is generated"""
+        for event in self.stream_query(user_query):
+            if event['type'] == 'text':
+                yield event['text']
+            elif event['type'] == 'done' and event['status'] != 'success':
+                yield event['response']
\ No newline at end of file
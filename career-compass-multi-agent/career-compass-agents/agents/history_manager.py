@@ -0,0 +1,142 @@
+import re
+import json
+from typing import Dict, List, Optional, Callable
+
+_CITATION_PATTERN = re.compile(r"\[(\d+)\]|\bsource\s+#?(\d+)", re.IGNORECASE)
+
+
+def estimate_tokens(messages: List[Dict]) -> int:
+    """Rough token count of a converse message list (~4 characters per token)"""
+    return len(json.dumps(messages, default=str)) // 4
+
+
+def _is_turn_start(message: Dict) -> bool:
+    """A user message with text (not tool results) opens a new turn"""
+    return message['role'] == 'user' and any('text' in block for block in message['content'])
+
+
+def _shorten(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit].rsplit(" ", 1)[0] + " ..."
+
+
+def extractive_summary(turns: List[List[Dict]], max_chars: int = 300) -> str:
+    """Default summarizer: each turn's question and the start of its answer"""
+    lines = []
+    for turn in turns:
+        question = " ".join(block['text'] for block in turn[0]['content'] if 'text' in block)
+        answer = " ".join(
+            block['text'] for message in turn if message['role'] == 'assistant'
+            for block in message['content'] if 'text' in block
+        )
+        lines.append(f"- Q: {_shorten(question, 150)} | A: {_shorten(answer, max_chars)}")
+    return "\n".join(lines)
+
+
+class ConversationHistoryManager:
+    """
+    Keeps a converse transcript inside a token budget
+
+    Applied before every model call, in order of increasing information loss:
+    1. Tool results of turns older than keep_recent_turns are reduced to a short
+       answer plus the IDs of the sources the assistant actually cited
+    2. While still over budget, the oldest turns are folded into one running summary
+       (extractive by default; pass summarizer= to use a model instead)
+    The most recent keep_recent_turns turns are never modified
+    """
+
+    SUMMARY_PREFIX = "Summary of the earlier conversation:"
+
+    def __init__(
+        self,
+        max_input_tokens: int = 4000,
+        keep_recent_turns: int = 2,
+        max_summary_chars: int = 2000,
+        summarizer: Optional[Callable[[List[List[Dict]]], str]] = None
+    ):
+        self.max_input_tokens = max_input_tokens
+        self.keep_recent_turns = keep_recent_turns
+        self.max_summary_chars = max_summary_chars
+        self.summarizer = summarizer or extractive_summary
+
+    def _split_turns(self, messages: List[Dict]) -> List[List[Dict]]:
+        turns: List[List[Dict]] = []
+        for message in messages:
+            if not turns or _is_turn_start(message):
+                turns.append([])
+            turns[-1].append(message)
+        return turns
+
+    def _cited_ids(self, turn: List[Dict]) -> set:
+        text = " ".join(
+            block['text'] for message in turn if message['role'] == 'assistant'
+            for block in message['content'] if 'text' in block
+        )
+        return {int(first or second) for first, second in _CITATION_PATTERN.findall(text)}
+
+    def _trim_tool_results(self, turn: List[Dict]) -> None:
+        cited = self._cited_ids(turn)
+        for message in turn:
+            if message['role'] != 'user':
+                continue
+            for block in message['content']:
+                result = block.get('toolResult')
+                if not result:
+                    continue
+                for item in result.get('content', []):
+                    payload = item.get('json')
+                    if not isinstance(payload, dict) or 'sources' not in payload:
+                        continue
+                    source_ids = []
+                    for source in payload['sources']:
+                        if 'id' in source:
+                            if source['id'] in cited:
+                                source_ids.append(source['id'])
+                        else:
+                            uri = source.get('location', {}).get('uri')
+                            if uri and uri not in source_ids:
+                                source_ids.append(uri)
+                    item['json'] = {
+                        "answer": _shorten(payload.get('answer', ''), 200),
+                        "source_ids": source_ids,
+                        "confidence": payload.get('confidence')
+                    }
+
+    def _summary_turn(self, summary: str) -> List[Dict]:
+        return [
+            {"role": "user", "content": [{"text": f"{self.SUMMARY_PREFIX}\n{summary}"}]},
+            {"role": "assistant", "content": [{"text": "Understood, I will keep that context in mind."}]}
+        ]
+
+    def compact(self, messages: List[Dict]) -> List[Dict]:
+        """Compact messages in place (so the caller's history stays bounded) and return it"""
+        if estimate_tokens(messages) <= self.max_input_tokens:
+            return messages
+
+        turns = self._split_turns(messages)
+        summary = None
+        if turns and turns[0][0]['content'][0].get('text', '').startswith(self.SUMMARY_PREFIX):
+            summary = turns.pop(0)[0]['content'][0]['text'][len(self.SUMMARY_PREFIX):].strip()
+
+        older = turns[:-self.keep_recent_turns] if self.keep_recent_turns else turns
+        recent = turns[len(older):]
+        for turn in older:
+            self._trim_tool_results(turn)
+
+        def assemble() -> List[Dict]:
+            head = self._summary_turn(summary) if summary else []
+            return head + [message for turn in older + recent for message in turn]
+
+        compacted = assemble()
+        while older and estimate_tokens(compacted) > self.max_input_tokens:
+            # Fold the oldest half of the remaining old turns at once; fewer summarizer calls
+            folded, older = older[:max(1, len(older) // 2)], older[max(1, len(older) // 2):]
+            new_summary = self.summarizer(folded)
+            summary = f"{summary}\n{new_summary}" if summary else new_summary
+            if len(summary) > self.max_summary_chars:
+                # Keep the newest part of the running summary
+                summary = "...\n" + summary[-self.max_summary_chars:].split("\n", 1)[-1]
+            compacted = assemble()
+
+        messages[:] = compacted
+        return messages
@@ -0,0 +1,89 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+
+
+def _stem(token: str) -> str:
+    """Conservative suffix strip so "interviews"/"interviewing" share a key"""
+    if len(token) > 5 and token.endswith("ing"):
+        return token[:-3]
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def normalize_query(query: str, stem: bool = False) -> str:
+    """Case, punctuation and whitespace folded; word order is kept"""
+    tokens = _TOKEN_PATTERN.findall(query.lower())
+    if stem:
+        tokens = [_stem(token) for token in tokens]
+    return " ".join(tokens)
+
+
+class IntentCache:
+    """
+    LRU memo of query -> intent keyed on the normalized query
+    One process-wide instance (shared()) serves every Streamlit session, so popular
+    questions skip classification entirely
+    """
+
+    _shared: Optional["IntentCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_entries: int = 4096, stem: bool = True):
+        self.max_entries = max_entries
+        self.stem = stem
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @classmethod
+    def shared(cls) -> "IntentCache":
+        """Process-wide cache used when an orchestrator is not given one"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def clear_shared(cls) -> None:
+        with cls._shared_lock:
+            cls._shared = None
+
+    def key(self, query: str) -> str:
+        return normalize_query(query, self.stem)
+
+    def get(self, query: str) -> Optional[str]:
+        key = self.key(query)
+        with self._lock:
+            intent = self._entries.get(key)
+            if intent is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return intent
+
+    def put(self, query: str, intent: str) -> None:
+        key = self.key(query)
+        if not key:
+            return
+        with self._lock:
+            self._entries[key] = intent
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+            stats["entries"] = len(self._entries)
+            return stats
@@ -0,0 +1,153 @@
+import os
+import re
+import json
+import zlib
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+INTENTS = ["CAREER_GUIDANCE", "RESUME_ANALYSIS", "JOB_MATCHING", "MULTI_AGENT"]
+
+DEFAULT_SAMPLES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "intent_samples.jsonl"
+)
+
+_WORD_PATTERN = re.compile(r"[a-z0-9+#/]+")
+_RESUME = re.compile(r"\b(resume|résumé|resumes|cv|cvs|curriculum vitae)\b")
+_JOBS = re.compile(r"\b(jobs?|openings?|vacanc(y|ies)|positions?|listings?|hiring|internships?)\b")
+# Only verbs that ask for matching; find/show/list/apply also appear in resume and career questions
+_MATCH = re.compile(r"\b(match\w*|recommend\w*|suggest\w*|suit\w*|qualified)\b")
+
+
+def load_samples(path: str = DEFAULT_SAMPLES_PATH) -> List[Tuple[str, str]]:
+    """(query, label) pairs from a JSONL file"""
+    with open(path, encoding="utf-8") as handle:
+        return [(row["query"], row["label"]) for row in map(json.loads, handle) if row.get("query")]
+
+
+def keyword_intent(query: str) -> Optional[str]:
+    """
+    Keyword rules for the common cases; None when no rule applies
+    A resume mention plus a job-matching request is MULTI_AGENT. The result is a
+    feature for HashedNgramModel, not a verdict: "list internships on my resume"
+    fires the rules too
+    """
+    text = query.lower()
+    mentions_resume = bool(_RESUME.search(text))
+    wants_jobs = bool(_JOBS.search(text)) and bool(_MATCH.search(text))
+
+    if mentions_resume and wants_jobs:
+        return "MULTI_AGENT"
+    if mentions_resume and not _JOBS.search(text):
+        return "RESUME_ANALYSIS"
+    if wants_jobs and not mentions_resume:
+        return "JOB_MATCHING"
+    return None
+
+
+class HashedNgramModel:
+    """
+    Multinomial logistic regression over hashed word uni/bigrams, character trigrams
+    and the keyword_intent rule that fires, so the labeled samples decide how much
+    a rule is worth. Small enough to train in milliseconds and score a query in microseconds
+    """
+
+    def __init__(self, dimensions: int = 4096, labels: Optional[List[str]] = None):
+        self.dimensions = dimensions
+        self.labels = labels or list(INTENTS)
+        self.weights = np.zeros((len(self.labels), dimensions), dtype=np.float32)
+        self.bias = np.zeros(len(self.labels), dtype=np.float32)
+
+    def features(self, query: str) -> Dict[int, float]:
+        words = _WORD_PATTERN.findall(query.lower())
+        grams = list(words)
+        grams += [f"{a} {b}" for a, b in zip(words, words[1:])]
+        for word in words:
+            padded = f"#{word}#"
+            grams += [f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2)]
+        rule_intent = keyword_intent(query)
+        if rule_intent is not None:
+            grams.append(f"rule:{rule_intent}")
+
+        counts: Dict[int, float] = {}
+        for gram in grams:
+            bucket = zlib.crc32(gram.encode("utf-8")) % self.dimensions
+            counts[bucket] = counts.get(bucket, 0.0) + 1.0
+        norm = sum(value * value for value in counts.values()) ** 0.5 or 1.0
+        return {bucket: value / norm for bucket, value in counts.items()}
+
+    def _matrix(self, queries: List[str]) -> np.ndarray:
+        matrix = np.zeros((len(queries), self.dimensions), dtype=np.float32)
+        for row, query in enumerate(queries):
+            for bucket, value in self.features(query).items():
+                matrix[row, bucket] = value
+        return matrix
+
+    def fit(self, samples: List[Tuple[str, str]], epochs: int = 300, learning_rate: float = 2.0, l2: float = 1e-4):
+        """Full-batch gradient descent on the softmax cross-entropy"""
+        features = self._matrix([query for query, _ in samples])
+        targets = np.zeros((len(samples), len(self.labels)), dtype=np.float32)
+        for row, (_, label) in enumerate(samples):
+            targets[row, self.labels.index(label)] = 1.0
+
+        for _ in range(epochs):
+            probabilities = self._softmax(features @ self.weights.T + self.bias)
+            error = (probabilities - targets) / len(samples)
+            self.weights -= learning_rate * (error.T @ features + l2 * self.weights)
+            self.bias -= learning_rate * error.sum(axis=0)
+        return self
+
+    @staticmethod
+    def _softmax(logits: np.ndarray) -> np.ndarray:
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=-1, keepdims=True)
+
+    def predict_proba(self, query: str) -> Dict[str, float]:
+        features = self.features(query)
+        buckets = np.fromiter(features.keys(), dtype=np.int64, count=len(features))
+        values = np.fromiter(features.values(), dtype=np.float32, count=len(features))
+        probabilities = self._softmax(self.weights[:, buckets] @ values + self.bias)
+        return dict(zip(self.labels, probabilities.tolist()))
+
+
+class LocalIntentClassifier:
+    """
+    Fast-path router for OrchestratorAgent: the hashed n-gram model, with the keyword
+    rules as features. classify() returns None when the model is not confident
+    enough, and the caller falls back to the LLM
+    """
+
+    _default: Optional["LocalIntentClassifier"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, model: HashedNgramModel, confidence_threshold: float = 0.6):
+        self.model = model
+        self.confidence_threshold = confidence_threshold
+
+    @classmethod
+    def train(cls, samples: List[Tuple[str, str]], confidence_threshold: float = 0.6, **fit_kwargs):
+        return cls(HashedNgramModel().fit(samples, **fit_kwargs), confidence_threshold)
+
+    @classmethod
+    def default(cls) -> "LocalIntentClassifier":
+        """Process-wide classifier trained once from the bundled labeled samples"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls.train(load_samples())
+            return cls._default
+
+    def predict(self, query: str) -> Tuple[str, float, str]:
+        """
+        (intent, confidence, source); source is "rules" when a keyword rule fired
+        for the query, "model" otherwise. Either way the confidence is the model's
+        """
+        probabilities = self.model.predict_proba(query)
+        intent = max(probabilities, key=probabilities.get)
+        return intent, probabilities[intent], "rules" if keyword_intent(query) is not None else "model"
+
+    def classify(self, query: str) -> Optional[str]:
+        """Intent when confident, otherwise None (use the LLM)"""
+        intent, confidence, _ = self.predict(query)
+        return intent if confidence >= self.confidence_threshold else None
@@ -0,0 +1,607 @@
+import os
+import json
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Iterator, Iterable, Sequence, Callable, Tuple
+
+from boto3.dynamodb.types import TypeDeserializer
+
+from agents.aws_clients import get_client
+from agents.job_index import JobIndex
+
+# Attributes the job matcher, the catalog ranking and the Streamlit pages actually read
+JOB_ATTRIBUTES = (
+    "job_id",
+    "title",
+    "company",
+    "location",
+    "category",
+    "experience_level",
+    "required_skills",
+    "preferred_skills",
+    "salary_range",
+    "posted_date",
+    "description",
+)
+
+_SEGMENT_DONE = object()
+
+
+def projection_arguments(attributes: Sequence[str]) -> Dict[str, Any]:
+    """
+    Build ProjectionExpression arguments for a list of attributes
+    Every name goes through ExpressionAttributeNames since several
+    (e.g. location) are DynamoDB reserved words
+    """
+    names = {f"#a{i}": attribute for i, attribute in enumerate(attributes)}
+    return {
+        "ProjectionExpression": ", ".join(names),
+        "ExpressionAttributeNames": names
+    }
+
+
+def _merge_expression_names(base: Dict[str, Any], extra: Dict[str, Any]) -> Dict[str, Any]:
+    merged = dict(base)
+    extra = dict(extra)
+    if 'ExpressionAttributeNames' in extra:
+        names = dict(merged.get('ExpressionAttributeNames', {}))
+        names.update(extra.pop('ExpressionAttributeNames'))
+        merged['ExpressionAttributeNames'] = names
+    merged.update(extra)
+    return merged
+
+
+def scan_segment_pages(
+    client,
+    table_name: str,
+    segment: int = 0,
+    total_segments: int = 1,
+    scan_kwargs: Optional[Dict[str, Any]] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield pages of one scan segment, following LastEvaluatedKey
+    Expects the client of a boto3 DynamoDB resource (table.meta.client),
+    which (de)serializes items to plain Python types like Table.scan does
+    """
+    kwargs = dict(scan_kwargs or {})
+    kwargs["TableName"] = table_name
+    if total_segments > 1:
+        kwargs["Segment"] = segment
+        kwargs["TotalSegments"] = total_segments
+
+    while True:
+        response = client.scan(**kwargs)
+        yield response.get('Items', [])
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        kwargs["ExclusiveStartKey"] = response['LastEvaluatedKey']
+
+
+def iter_table_items(
+    client,
+    table_name: str,
+    total_segments: int = 1,
+    attributes: Optional[Sequence[str]] = None,
+    max_workers: Optional[int] = None,
+    scan_kwargs: Optional[Dict[str, Any]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream every item of a DynamoDB table
+
+    With total_segments > 1 the table is read as a parallel scan: each
+    Segment runs on its own thread and pages are yielded to the caller as
+    soon as any segment returns one. Uses the resource's client because
+    boto3 clients are thread-safe while resources are not. Extra scan_kwargs
+    (e.g. a FilterExpression) are merged with the projection arguments.
+    """
+    scan_kwargs = _merge_expression_names(
+        projection_arguments(attributes) if attributes else {},
+        scan_kwargs or {}
+    )
+
+    if total_segments <= 1:
+        for page in scan_segment_pages(client, table_name, scan_kwargs=scan_kwargs):
+            yield from page
+        return
+
+    pages: "queue.Queue" = queue.Queue(maxsize=total_segments * 2)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # Bounded queue: give up if the consumer stopped reading
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def scan_worker(segment: int) -> None:
+        try:
+            for page in scan_segment_pages(client, table_name, segment, total_segments, scan_kwargs):
+                if not put(page):
+                    return
+        except Exception as e:
+            put(e)
+        finally:
+            put(_SEGMENT_DONE)
+
+    with ThreadPoolExecutor(max_workers=max_workers or total_segments) as executor:
+        for segment in range(total_segments):
+            executor.submit(scan_worker, segment)
+
+        try:
+            remaining = total_segments
+            while remaining:
+                item = pages.get()
+                if item is _SEGMENT_DONE:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield from item
+        finally:
+            stop.set()
+
+
+def load_jobs(
+    client,
+    table_name: str,
+    total_segments: int = 1,
+    since: Any = None,
+    version_attribute: str = "posted_date"
+) -> List[Dict[str, Any]]:
+    """
+    Every job with JOB_ATTRIBUTES, or only those whose version_attribute is at or
+    after `since`. Raises on DynamoDB errors so a cache never mistakes a failed
+    scan for an empty table
+    """
+    scan_kwargs = None
+    if since is not None:
+        scan_kwargs = {
+            'FilterExpression': '#version >= :watermark',
+            'ExpressionAttributeNames': {'#version': version_attribute},
+            'ExpressionAttributeValues': {':watermark': since}
+        }
+    return list(iter_table_items(
+        client,
+        table_name,
+        total_segments=total_segments,
+        attributes=JOB_ATTRIBUTES,
+        scan_kwargs=scan_kwargs
+    ))
+
+
+def query_category_items(
+    client,
+    table_name: str,
+    category: str,
+    index_name: str = "category-index",
+    attributes: Optional[Sequence[str]] = None
+) -> List[Dict[str, Any]]:
+    """All items of one category from the category GSI, following LastEvaluatedKey"""
+    kwargs = _merge_expression_names(
+        projection_arguments(attributes) if attributes else {},
+        {
+            "KeyConditionExpression": "#category = :category",
+            "ExpressionAttributeNames": {"#category": "category"},
+            "ExpressionAttributeValues": {":category": category}
+        }
+    )
+    kwargs["TableName"] = table_name
+    kwargs["IndexName"] = index_name
+
+    items = []
+    while True:
+        response = client.query(**kwargs)
+        items.extend(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response:
+            return items
+        kwargs["ExclusiveStartKey"] = response['LastEvaluatedKey']
+
+
+def query_categories(
+    client,
+    table_name: str,
+    categories: Sequence[str],
+    index_name: str = "category-index",
+    attributes: Optional[Sequence[str]] = None,
+    max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Query several categories on the GSI in parallel, one thread per category"""
+    categories = list(dict.fromkeys(categories))
+    if not categories:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(categories)) as executor:
+        results = executor.map(
+            lambda category: query_category_items(client, table_name, category, index_name, attributes),
+            categories
+        )
+        return [item for items in results for item in items]
+
+
+class JobChange:
+    """One INSERT, MODIFY or REMOVE event for a job posting"""
+
+    __slots__ = ("event_name", "key", "new_image")
+
+    def __init__(self, event_name: str, key: Any, new_image: Optional[Dict[str, Any]] = None):
+        self.event_name = event_name
+        self.key = key
+        self.new_image = new_image
+
+
+class FileChangeFeed:
+    """
+    Local stand-in for a DynamoDB Streams change feed
+    Reads JSON lines of {"eventName": "INSERT|MODIFY|REMOVE", "job_id": ..., "NewImage": {...}}
+    The checkpoint is the byte offset already consumed
+    """
+
+    def __init__(self, path: str, key_attribute: str = "job_id"):
+        self.path = path
+        self.key_attribute = key_attribute
+
+    def latest_checkpoint(self) -> int:
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+    def append(self, event_name: str, key: Any, new_image: Optional[Dict[str, Any]] = None) -> None:
+        """Write an event to the feed (used by tests and local tooling)"""
+        if event_name != "REMOVE" and new_image is None:
+            raise ValueError(f"{event_name} events need a NewImage")
+        record = {"eventName": event_name, self.key_attribute: key}
+        if new_image is not None:
+            record["NewImage"] = new_image
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def read_changes(self, checkpoint: Optional[int]) -> Tuple[List[JobChange], int]:
+        if not os.path.exists(self.path):
+            return [], 0
+
+        changes = []
+        with open(self.path, "rb") as f:
+            f.seek(checkpoint or 0)
+            while True:
+                line = f.readline()
+                # Leave a partially written last line for the next read
+                if not line or not line.endswith(b"\n"):
+                    break
+                checkpoint = f.tell()
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                changes.append(JobChange(
+                    record["eventName"],
+                    record[self.key_attribute],
+                    record.get("NewImage")
+                ))
+        return changes, checkpoint or 0
+
+
+class DynamoDBStreamChangeFeed:
+    """
+    Change feed backed by the jobs table's DynamoDB Stream (NEW_IMAGE or NEW_AND_OLD_IMAGES)
+    The checkpoint maps shard IDs to a position: {"SequenceNumber": ...} for the
+    last record applied, or {"ShardIterator": ...} for a shard with nothing new
+    since the snapshot
+    """
+
+    VIEW_TYPES = ("NEW_IMAGE", "NEW_AND_OLD_IMAGES")
+
+    def __init__(self, stream_arn: str, region: str = "us-west-2", key_attribute: str = "job_id"):
+        self.stream_arn = stream_arn
+        self.key_attribute = key_attribute
+        self.streams = get_client('dynamodbstreams', region)
+        self.deserializer = TypeDeserializer()
+
+        # KEYS_ONLY and OLD_IMAGE records carry no item to upsert
+        view_type = self.streams.describe_stream(StreamArn=stream_arn)['StreamDescription'].get('StreamViewType')
+        if view_type not in self.VIEW_TYPES:
+            raise ValueError(
+                f"Stream {stream_arn} has view type {view_type}; the job catalog needs one of {self.VIEW_TYPES}"
+            )
+
+    def latest_checkpoint(self) -> Dict[str, Dict[str, str]]:
+        """
+        The current end of every shard, so the first refresh after a full load
+        starts from the snapshot instead of replaying from TRIM_HORIZON
+        """
+        checkpoint = {}
+        for shard in self._shards():
+            shard_id = shard['ShardId']
+            ending = shard.get('SequenceNumberRange', {}).get('EndingSequenceNumber')
+            if ending:
+                checkpoint[shard_id] = {'SequenceNumber': ending}
+            else:
+                checkpoint[shard_id] = {'ShardIterator': self.streams.get_shard_iterator(
+                    StreamArn=self.stream_arn,
+                    ShardId=shard_id,
+                    ShardIteratorType='LATEST'
+                )['ShardIterator']}
+        return checkpoint
+
+    def _shards(self) -> List[Dict[str, Any]]:
+        shards = []
+        kwargs = {"StreamArn": self.stream_arn}
+        while True:
+            description = self.streams.describe_stream(**kwargs)['StreamDescription']
+            shards.extend(description.get('Shards', []))
+            last_shard = description.get('LastEvaluatedShardId')
+            if not last_shard:
+                return shards
+            kwargs["ExclusiveStartShardId"] = last_shard
+
+    def _shard_iterator(self, shard_id: str, position: Optional[Dict[str, str]]) -> str:
+        if position and 'ShardIterator' in position:
+            return position['ShardIterator']
+        if position and 'SequenceNumber' in position:
+            return self.streams.get_shard_iterator(
+                StreamArn=self.stream_arn,
+                ShardId=shard_id,
+                ShardIteratorType='AFTER_SEQUENCE_NUMBER',
+                SequenceNumber=position['SequenceNumber']
+            )['ShardIterator']
+        return self.streams.get_shard_iterator(
+            StreamArn=self.stream_arn,
+            ShardId=shard_id,
+            ShardIteratorType='TRIM_HORIZON'
+        )['ShardIterator']
+
+    def read_changes(
+        self,
+        checkpoint: Optional[Dict[str, Dict[str, str]]]
+    ) -> Tuple[List[JobChange], Dict[str, Dict[str, str]]]:
+        checkpoint = dict(checkpoint or {})
+        changes = []
+
+        for shard in self._shards():
+            shard_id = shard['ShardId']
+            iterator = self._shard_iterator(shard_id, checkpoint.get(shard_id))
+
+            while iterator:
+                try:
+                    response = self.streams.get_records(ShardIterator=iterator, Limit=1000)
+                except self.streams.exceptions.ExpiredIteratorException:
+                    # Shard iterators last 15 minutes; replay the shard rather than skip records
+                    if 'ShardIterator' not in checkpoint.get(shard_id, {}):
+                        raise
+                    checkpoint.pop(shard_id)
+                    iterator = self._shard_iterator(shard_id, None)
+                    continue
+                records = response.get('Records', [])
+                for record in records:
+                    data = record['dynamodb']
+                    keys = {k: self.deserializer.deserialize(v) for k, v in data.get('Keys', {}).items()}
+                    new_image = None
+                    if 'NewImage' in data:
+                        new_image = {k: self.deserializer.deserialize(v) for k, v in data['NewImage'].items()}
+                    changes.append(JobChange(record['eventName'], keys.get(self.key_attribute), new_image))
+                    checkpoint[shard_id] = {'SequenceNumber': data['SequenceNumber']}
+
+                # Open shards keep returning iterators; stop once caught up
+                if not records:
+                    # Carry a fresh iterator forward until the shard has a record to anchor on
+                    if response.get('NextShardIterator') and 'ShardIterator' in checkpoint.get(shard_id, {}):
+                        checkpoint[shard_id] = {'ShardIterator': response['NextShardIterator']}
+                    break
+                iterator = response.get('NextShardIterator')
+
+        return changes, checkpoint
+
+
+class JobCatalog:
+    """
+    Process-wide, TTL-refreshed cache of the job index
+
+    A full scan happens on first use (miss). After ttl_seconds the next read
+    refreshes incrementally: from the change feed if one is configured,
+    otherwise by scanning only items whose version attribute (posted_date by
+    default) is at or after the last seen value. Only new, updated or
+    deleted postings are applied, to a copy of the index that is then
+    swapped in, so readers never see a half-applied refresh. A periodic
+    full reload still catches deletes when there is no change feed.
+
+    Loaders should raise on failure: a failed load or refresh keeps serving
+    the previous index instead of replacing it with an empty one.
+    """
+
+    _registry: Dict[Tuple[Any, ...], "JobCatalog"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        loader: Callable[[], Iterable[Dict[str, Any]]],
+        incremental_loader: Optional[Callable[[Any], Iterable[Dict[str, Any]]]] = None,
+        change_feed=None,
+        ttl_seconds: float = 300,
+        full_reload_seconds: float = 3600,
+        version_attribute: str = "posted_date",
+        key_attribute: str = "job_id",
+        compact_ratio: float = 0.25
+    ):
+        """compact_ratio: compact the index once removed slots exceed this share of it"""
+        self.loader = loader
+        self.incremental_loader = incremental_loader
+        self.change_feed = change_feed
+        self.ttl_seconds = ttl_seconds
+        self.full_reload_seconds = full_reload_seconds
+        self.version_attribute = version_attribute
+        self.key_attribute = key_attribute
+        self.compact_ratio = compact_ratio
+
+        self.index: Optional[JobIndex] = None
+        self.checked_at = 0.0
+        self.full_loaded_at = 0.0
+        self.watermark: Any = None
+        self.feed_checkpoint: Any = None
+        self._lock = threading.Lock()
+        # Separate from _lock, which is held for the whole load
+        self._warm_lock = threading.Lock()
+        self._warming = False
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "full_loads": 0,
+            "upserts_applied": 0,
+            "deletes_applied": 0,
+            "compactions": 0,
+            "failed_refreshes": 0,
+            "last_refresh_ms": 0.0,
+            "total_refresh_ms": 0.0
+        }
+
+    @classmethod
+    def shared(
+        cls,
+        region: str,
+        table_name: str,
+        loader_settings: Tuple[Any, ...] = (),
+        **kwargs
+    ) -> "JobCatalog":
+        """
+        One catalog per (region, table, loader settings, configuration) for the whole process
+        The loader functions themselves are not part of the key: pass every
+        setting bound into them (e.g. scan segments) as loader_settings
+        """
+        config = tuple(sorted(
+            (name, value) for name, value in kwargs.items()
+            if name not in ("loader", "incremental_loader")
+        ))
+        key = (region, table_name, tuple(loader_settings), config)
+        with cls._registry_lock:
+            catalog = cls._registry.get(key)
+            if catalog is None:
+                catalog = cls(**kwargs)
+                cls._registry[key] = catalog
+            return catalog
+
+    @classmethod
+    def clear_shared(cls) -> None:
+        with cls._registry_lock:
+            cls._registry.clear()
+
+    def _advance_watermark(self, jobs: Iterable[Dict[str, Any]]) -> None:
+        for job in jobs:
+            value = job.get(self.version_attribute)
+            if value is not None and (self.watermark is None or value > self.watermark):
+                self.watermark = value
+
+    def _full_load(self) -> JobIndex:
+        # Take the feed position first so changes made during the scan are replayed
+        checkpoint = self.change_feed.latest_checkpoint() if self.change_feed is not None else None
+
+        index = JobIndex(self.loader(), key_attribute=self.key_attribute)
+        self.feed_checkpoint = checkpoint
+        self.watermark = None
+        self._advance_watermark(index.all_jobs())
+
+        self.index = index
+        self.full_loaded_at = time.time()
+        self.stats["full_loads"] += 1
+        return index
+
+    def _incremental_refresh(self) -> JobIndex:
+        index = self.index.copy()
+
+        if self.change_feed is not None:
+            changes, checkpoint = self.change_feed.read_changes(self.feed_checkpoint)
+            for change in changes:
+                if change.event_name == "REMOVE":
+                    if index.remove(change.key):
+                        self.stats["deletes_applied"] += 1
+                elif change.new_image is not None:
+                    index.upsert(change.new_image)
+                    self.stats["upserts_applied"] += 1
+                else:
+                    raise ValueError(f"{change.event_name} for {change.key} has no NewImage")
+            # Only advance once every change applied, so a failed refresh is retried
+            self.feed_checkpoint = checkpoint
+        elif self.incremental_loader is not None:
+            updated = list(self.incremental_loader(self.watermark))
+            for job in updated:
+                if index.get(job.get(self.key_attribute)) != job:
+                    index.upsert(job)
+                    self.stats["upserts_applied"] += 1
+            self._advance_watermark(updated)
+        else:
+            return self._full_load()
+
+        if index.tombstones > self.compact_ratio * len(index.jobs):
+            index.compact()
+            self.stats["compactions"] += 1
+
+        self.index = index
+        return index
+
+    def is_loaded(self) -> bool:
+        return self.index is not None
+
+    def warm_in_background(self) -> bool:
+        """Start the first load on a daemon thread; False if loaded or already loading"""
+        with self._warm_lock:
+            if self.index is not None or self._warming:
+                return False
+            self._warming = True
+
+        def warm() -> None:
+            try:
+                self.get_index()
+            finally:
+                self._warming = False
+
+        threading.Thread(target=warm, name="job-catalog-warm", daemon=True).start()
+        return True
+
+    def get_index(self) -> JobIndex:
+        """Return the cached index, loading or refreshing it first if needed"""
+        with self._lock:
+            now = time.time()
+            if self.index is None:
+                self.stats["misses"] += 1
+                return self._timed(self._full_load)
+
+            if now - self.checked_at < self.ttl_seconds:
+                self.stats["hits"] += 1
+                return self.index
+
+            self.stats["refreshes"] += 1
+            if self.change_feed is None and now - self.full_loaded_at >= self.full_reload_seconds:
+                return self._timed(self._full_load)
+            return self._timed(self._incremental_refresh)
+
+    def reload(self) -> JobIndex:
+        """Force a full reload of the catalog"""
+        with self._lock:
+            self.stats["refreshes"] += 1
+            return self._timed(self._full_load)
+
+    def _timed(self, refresh: Callable[[], JobIndex]) -> JobIndex:
+        start = time.perf_counter()
+        try:
+            index = refresh()
+        except Exception as e:
+            # Keep serving the last good index; a cold catalog retries on the next read
+            print(f"Error refreshing job catalog: {str(e)}")
+            self.stats["failed_refreshes"] += 1
+            index = self.index if self.index is not None else JobIndex(key_attribute=self.key_attribute)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.checked_at = time.time()
+        self.stats["last_refresh_ms"] = round(elapsed_ms, 3)
+        self.stats["total_refresh_ms"] = round(self.stats["total_refresh_ms"] + elapsed_ms, 3)
+        return index
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache hit/miss/refresh counters and refresh latency"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["jobs_cached"] = len(self.index) if self.index is not None else 0
+            stats["age_seconds"] = round(time.time() - self.checked_at, 3) if self.index is not None else None
+            return stats
@@ -0,0 +1,305 @@
+import heapq
+from typing import Dict, Any, List, Optional, Iterable, Set
+
+from agents.skill_demand import SkillDemandAggregates
+
+
+def normalize_skill(skill: str) -> str:
+    """Normalize a skill token the same way the matcher always has"""
+    return skill.lower().strip()
+
+
+class IndexedJob:
+    """
+    A job posting with its skill lists normalized once at load time
+    Keeps the raw list lengths because match percentages divide by them
+    """
+
+    __slots__ = ("job", "position", "required", "preferred", "required_count", "preferred_count")
+
+    def __init__(self, job: Dict[str, Any], position: int):
+        self.job = job
+        self.position = position
+
+        required_skills = job.get('required_skills', []) or []
+        preferred_skills = job.get('preferred_skills', []) or []
+
+        self.required = frozenset(normalize_skill(s) for s in required_skills)
+        self.preferred = frozenset(normalize_skill(s) for s in preferred_skills)
+        self.required_count = len(required_skills)
+        self.preferred_count = len(preferred_skills)
+
+    @property
+    def all_skills(self) -> frozenset:
+        return self.required | self.preferred
+
+
+class JobIndex:
+    """
+    In-memory inverted index over the job catalog
+    Maps normalized skill tokens to the jobs that list them so matching
+    only touches jobs sharing at least one skill with the student
+    """
+
+    def __init__(self, jobs: Optional[Iterable[Dict[str, Any]]] = None, key_attribute: str = "job_id"):
+        self.key_attribute = key_attribute
+        # Slots stay stable so catalog order survives updates; removed jobs leave None
+        self.jobs: List[Optional[IndexedJob]] = []
+        self.skill_to_jobs: Dict[str, Set[int]] = {}
+        self.positions_by_key: Dict[Any, int] = {}
+        # Skill demand aggregates are built on first lookup, then kept current
+        self.demand: Optional[SkillDemandAggregates] = None
+        self.live_count = 0
+        # Bumped on every change so derived structures know when to rebuild
+        self.version = 0
+
+        if jobs is not None:
+            self.build(jobs)
+
+    def __len__(self) -> int:
+        return self.live_count
+
+    def build(self, jobs: Iterable[Dict[str, Any]]) -> None:
+        """(Re)build the index from a list of raw DynamoDB job items"""
+        self.jobs = []
+        self.skill_to_jobs = {}
+        self.positions_by_key = {}
+        self.demand = None
+        self.live_count = 0
+        self.version += 1
+
+        for job in jobs:
+            self._append(job)
+
+    def copy(self) -> "JobIndex":
+        """
+        Copy the index structure so changes can be applied off to the side
+        IndexedJob entries are immutable and shared between copies
+        """
+        clone = JobIndex(key_attribute=self.key_attribute)
+        clone.jobs = list(self.jobs)
+        clone.skill_to_jobs = {skill: set(positions) for skill, positions in self.skill_to_jobs.items()}
+        clone.positions_by_key = dict(self.positions_by_key)
+        clone.demand = self.demand.copy() if self.demand is not None else None
+        clone.live_count = self.live_count
+        clone.version = self.version
+        return clone
+
+    def _append(self, job: Dict[str, Any]) -> None:
+        indexed = IndexedJob(job, len(self.jobs))
+        self.jobs.append(indexed)
+        self.live_count += 1
+        self._link(indexed)
+
+        key = job.get(self.key_attribute)
+        if key is not None:
+            self.positions_by_key[key] = indexed.position
+
+    def _link(self, indexed: IndexedJob) -> None:
+        for skill in indexed.all_skills:
+            self.skill_to_jobs.setdefault(skill, set()).add(indexed.position)
+        if self.demand is not None:
+            self.demand.add(indexed.job, indexed.all_skills)
+
+    def _unlink(self, indexed: IndexedJob) -> None:
+        if self.demand is not None:
+            self.demand.remove(indexed.job, indexed.all_skills)
+        for skill in indexed.all_skills:
+            positions = self.skill_to_jobs.get(skill)
+            if positions is not None:
+                positions.discard(indexed.position)
+                if not positions:
+                    del self.skill_to_jobs[skill]
+
+    def upsert(self, job: Dict[str, Any]) -> None:
+        """Add a new posting or replace an existing one in place (keeps its catalog slot)"""
+        position = self.positions_by_key.get(job.get(self.key_attribute))
+        if position is None:
+            self._append(job)
+        else:
+            self._unlink(self.jobs[position])
+            indexed = IndexedJob(job, position)
+            self.jobs[position] = indexed
+            self._link(indexed)
+        self.version += 1
+
+    def remove(self, key: Any) -> bool:
+        """Drop a posting by its key attribute; returns False if it was not indexed"""
+        position = self.positions_by_key.pop(key, None)
+        if position is None:
+            return False
+
+        self._unlink(self.jobs[position])
+        self.jobs[position] = None
+        self.live_count -= 1
+        self.version += 1
+        return True
+
+    @property
+    def tombstones(self) -> int:
+        """Slots left empty by remove()"""
+        return len(self.jobs) - self.live_count
+
+    def compact(self) -> bool:
+        """
+        Drop removed slots and renumber positions, keeping catalog order
+        Returns False when there was nothing to reclaim
+        """
+        if not self.tombstones:
+            return False
+        # Aggregates do not depend on positions, so they survive the rebuild
+        demand = self.demand
+        self.build(self.all_jobs())
+        self.demand = demand
+        return True
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        """Raw job item for a key attribute value, if indexed"""
+        position = self.positions_by_key.get(key)
+        return self.jobs[position].job if position is not None else None
+
+    def live_jobs(self) -> List[IndexedJob]:
+        """Indexed jobs in catalog order, skipping removed slots"""
+        return [indexed for indexed in self.jobs if indexed is not None]
+
+    def all_jobs(self) -> List[Dict[str, Any]]:
+        """Return the raw job items in catalog order"""
+        return [indexed.job for indexed in self.live_jobs()]
+
+    def jobs_in_categories(self, categories: Iterable[str]) -> List[Dict[str, Any]]:
+        """Raw jobs whose category is one of the given categories, in catalog order"""
+        wanted = set(categories)
+        return [indexed.job for indexed in self.live_jobs() if indexed.job.get('category') in wanted]
+
+    def candidate_positions(self, skills: Set[str]) -> Set[int]:
+        """Positions of jobs that share at least one normalized skill"""
+        positions: Set[int] = set()
+        for skill in skills:
+            positions.update(self.skill_to_jobs.get(skill, ()))
+        return positions
+
+    def jobs_with_skill(self, skill: str) -> List[Dict[str, Any]]:
+        """Raw jobs listing the skill as required or preferred, in catalog order"""
+        positions = sorted(self.skill_to_jobs.get(normalize_skill(skill), ()))
+        return [self.jobs[p].job for p in positions]
+
+    def sample_jobs_with_skill(self, skill: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """First few jobs listing the skill, in catalog order, without sorting them all"""
+        positions = heapq.nsmallest(limit, self.skill_to_jobs.get(normalize_skill(skill), ()))
+        return [self.jobs[p].job for p in positions]
+
+    def skill_demand(self, skill: str) -> Optional[Dict[str, Any]]:
+        """Precomputed demand aggregates for a skill (job count, categories, co-skills, salaries)"""
+        if self.demand is None:
+            # One pass over the catalog; upserts and removes keep it current afterwards
+            demand = SkillDemandAggregates()
+            for indexed in self.live_jobs():
+                demand.add(indexed.job, indexed.all_skills)
+            self.demand = demand
+        return self.demand.lookup(normalize_skill(skill))
+
+    @staticmethod
+    def skill_match(student_skills: Set[str], job_skills: frozenset, job_skill_count: int) -> float:
+        """Same result as JobMatcherAgent.calculate_skill_match on pre-normalized sets"""
+        if not job_skill_count:
+            return 0.0
+        return round((len(student_skills & job_skills) / job_skill_count) * 100, 2)
+
+    def _scores(
+        self,
+        indexed: IndexedJob,
+        student_skills: Set[str],
+        experience_level: str,
+        preferred_categories: Optional[List[str]] = None
+    ):
+        """Return (final_score, required_match, preferred_match) for one job"""
+        job = indexed.job
+
+        required_match = self.skill_match(student_skills, indexed.required, indexed.required_count)
+        preferred_match = self.skill_match(student_skills, indexed.preferred, indexed.preferred_count)
+
+        # Overall match score (weighted: 70% required, 30% preferred)
+        overall_match = (required_match * 0.7) + (preferred_match * 0.3)
+
+        exp_match = 1.0 if job.get('experience_level') == experience_level else 0.5
+
+        cat_match = 1.0
+        if preferred_categories:
+            cat_match = 1.2 if job.get('category') in preferred_categories else 0.8
+
+        final_score = overall_match * exp_match * cat_match
+
+        return round(final_score, 2), required_match, preferred_match
+
+    def score(
+        self,
+        indexed: IndexedJob,
+        student_skills: Set[str],
+        experience_level: str,
+        preferred_categories: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Score one indexed job and build the match entry returned by match_jobs"""
+        match_score, required_match, preferred_match = self._scores(
+            indexed, student_skills, experience_level, preferred_categories
+        )
+        return self.match_entry(indexed, student_skills, match_score, required_match, preferred_match)
+
+    @staticmethod
+    def match_entry(
+        indexed: IndexedJob,
+        student_skills: Set[str],
+        match_score: float,
+        required_match: float,
+        preferred_match: float
+    ) -> Dict[str, Any]:
+        """Build the match dictionary shape returned by match_jobs"""
+        return {
+            "job": indexed.job,
+            "match_score": match_score,
+            "required_match": required_match,
+            "preferred_match": preferred_match,
+            "matching_skills": list(student_skills & indexed.all_skills),
+            "missing_skills": list(indexed.required - student_skills)
+        }
+
+    def top_matches(
+        self,
+        student_skills: List[str],
+        experience_level: str = "Entry Level",
+        preferred_categories: Optional[List[str]] = None,
+        top_n: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the top N matches, identical to sorting every scored job
+
+        Only candidate jobs are scored. If there are fewer candidates than
+        top_n, the remaining slots are filled with zero-score jobs in catalog
+        order, exactly as the full stable sort would have done.
+        """
+        if top_n <= 0:
+            return []
+
+        student_set = {normalize_skill(s) for s in student_skills}
+        positions = self.candidate_positions(student_set)
+
+        scored = [
+            (self._scores(self.jobs[p], student_set, experience_level, preferred_categories), p)
+            for p in positions
+        ]
+
+        # Ties keep catalog order, matching list.sort(reverse=True) stability
+        best = heapq.nlargest(top_n, scored, key=lambda item: (item[0][0], -item[1]))
+        top = [
+            self.match_entry(self.jobs[p], student_set, *scores)
+            for scores, p in best
+        ]
+
+        # Jobs sharing no skill score zero and rank after every candidate
+        if len(top) < top_n:
+            for indexed in self.jobs:
+                if len(top) >= top_n:
+                    break
+                if indexed is not None and indexed.position not in positions:
+                    top.append(self.score(indexed, student_set, experience_level, preferred_categories))
+
+        return top
@@ -1,11 +1,34 @@
 import os
-import boto3
+import sys
 import json
-from typing import Dict, Any, List, Optional
-from strands import Agent
-from strands.models import BedrockModel
+import threading
+import time
+from functools import partial
+from typing import Dict, Any, List, Optional, Iterator
 from decimal import Decimal
 
+# Add parent directory to Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from agents.agent_template import AgentTemplate
+from agents.aws_clients import get_bedrock_model, get_resource
+from agents.job_catalog import (
+    JOB_ATTRIBUTES,
+    JobCatalog,
+    iter_table_items,
+    load_jobs,
+    query_categories,
+    query_category_items
+)
+from agents.job_index import JobIndex
+from agents.job_scoring import VectorizedJobScorer
+from agents.response_cache import ResponseCache, make_cache_key
+
+# Bump whenever the get_recommendations prompt changes so cached analyses are not reused
+RECOMMENDATIONS_PROMPT_VERSION = "recommendations-v1"
+
 class DecimalEncoder(json.JSONEncoder):
     """Helper to encode Decimal types from DynamoDB"""
     def default(self, obj):
@@ -20,16 +43,54 @@ class JobMatcherAgent:
     Demonstrates Lab 3 pattern: Strands Agent + AWS Service Integration
     """
     
-    def __init__(self, region: str = "us-west-2", table_name: str = "career-compass-jobs"):
+    SCORING_MODES = ("index", "vectorized")
+    
+    def __init__(
+        self,
+        region: str = "us-west-2",
+        table_name: str = "career-compass-jobs",
+        scoring_mode: str = "index",
+        scan_segments: int = 4,
+        catalog_ttl_seconds: float = 300,
+        change_feed=None,
+        category_pushdown: bool = True,
+        response_cache: Optional[ResponseCache] = None
+    ):
+        if scoring_mode not in self.SCORING_MODES:
+            raise ValueError(f"scoring_mode must be one of {self.SCORING_MODES}")
+        
         self.region = region
         self.table_name = table_name
+        self.scoring_mode = scoring_mode
+        self.scan_segments = scan_segments
+        self.category_pushdown = category_pushdown
         
         # Initialize DynamoDB client (AWS MCP tool pattern)
-        self.dynamodb = boto3.resource('dynamodb', region_name=region)
+        self.dynamodb = get_resource('dynamodb', region)
         self.table = self.dynamodb.Table(table_name)
         
+        # Process-wide job catalog cache: loaded once, refreshed incrementally after the TTL
+        # Loaders bind the table, not this agent, so the shared catalog never pins an agent
+        client = self.table.meta.client
+        self.catalog = JobCatalog.shared(
+            region,
+            table_name,
+            loader_settings=(scan_segments,),
+            loader=partial(load_jobs, client, table_name, scan_segments),
+            # Called with the posted_date watermark as `since`
+            incremental_loader=partial(load_jobs, client, table_name, scan_segments),
+            change_feed=change_feed,
+            ttl_seconds=catalog_ttl_seconds
+        )
+        self.job_scorer: Optional[VectorizedJobScorer] = None
+        self._job_scorer_lock = threading.Lock()
+        
+        # LLM analyses keyed on the prompt inputs; shared in-process unless a cache is given
+        self.response_cache = response_cache if response_cache is not None else ResponseCache.shared()
+        
         # Initialize Bedrock Model with Nova Pro
-        self.model = BedrockModel(
+        self.model = get_bedrock_model(
+            region,
             model_id="us.amazon.nova-pro-v1:0",
             temperature=0.7,
             max_tokens=3000,
@@ -56,47 +117,125 @@ When providing recommendations:
 
 Always maintain a supportive and constructive tone."""
         
-        # Create Strands agent
-        self.agent = Agent(
+        # Each call runs on a fresh Strands agent so prompts never pile up in history
+        self.agent = AgentTemplate(
             model=self.model,
             system_prompt=self.system_prompt
         )
     
+    def iter_jobs(self, total_segments: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream jobs from DynamoDB as scan pages arrive
+        Uses a parallel Segment/TotalSegments scan across a thread pool and a
+        ProjectionExpression limited to the attributes the matcher reads
+        """
+        return iter_table_items(
+            self.table.meta.client,
+            self.table_name,
+            total_segments=total_segments or self.scan_segments,
+            attributes=JOB_ATTRIBUTES
+        )
+    
     def get_all_jobs(self) -> List[Dict[str, Any]]:
         """
         Retrieve all jobs from DynamoDB using AWS MCP tool pattern
-        Handles pagination automatically
+        Handles pagination and parallel scan segments automatically
         """
         try:
-            response = self.table.scan()
-            jobs = response.get('Items', [])
-            
-            # Handle pagination if needed
-            while 'LastEvaluatedKey' in response:
-                response = self.table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
-                jobs.extend(response.get('Items', []))
-            
-            return jobs
+            return list(self.iter_jobs())
         except Exception as e:
             print(f"Error retrieving jobs from DynamoDB: {str(e)}")
             return []
     
+    def get_jobs_since(self, watermark: Any = None) -> List[Dict[str, Any]]:
+        """
+        Retrieve jobs whose posted_date is at or after the watermark
+        Used by the catalog cache for incremental refreshes
+        """
+        if watermark is None:
+            return self.get_all_jobs()
+        
+        try:
+            return load_jobs(
+                self.table.meta.client,
+                self.table_name,
+                self.scan_segments,
+                since=watermark,
+                version_attribute=self.catalog.version_attribute
+            )
+        except Exception as e:
+            print(f"Error retrieving updated jobs from DynamoDB: {str(e)}")
+            return []
+    
+    def load_job_index(self, refresh: bool = False) -> JobIndex:
+        """
+        Return the cached job index, scanning DynamoDB only on first use
+        Pass refresh=True to rebuild it from the current table contents
+        """
+        if refresh:
+            return self.catalog.reload()
+        return self.catalog.get_index()
+    
+    def refresh_job_index(self) -> JobIndex:
+        """Rebuild the job index after the jobs table has changed"""
+        return self.load_job_index(refresh=True)
+    
+    def get_catalog_stats(self) -> Dict[str, Any]:
+        """Job catalog cache hit/miss/refresh counters and refresh latency"""
+        return self.catalog.get_stats()
+    
+    def get_response_cache_stats(self) -> Dict[str, Any]:
+        """LLM analysis cache hits, misses, evictions and size"""
+        return self.response_cache.get_stats()
+    
+    def load_job_scorer(self) -> VectorizedJobScorer:
+        """
+        Return the NumPy scorer for the current job index
+        Re-encoded only when the index has been rebuilt or changed
+        """
+        job_index = self.load_job_index()
+        with self._job_scorer_lock:
+            scorer = self.job_scorer
+            if scorer is None or scorer.job_index is not job_index or scorer.version != job_index.version:
+                scorer = VectorizedJobScorer(job_index)
+                self.job_scorer = scorer
+            return scorer
+    
     def get_jobs_by_category(self, category: str) -> List[Dict[str, Any]]:
         """
         Retrieve jobs by category using Global Secondary Index
         Demonstrates efficient DynamoDB querying
         """
         try:
-            response = self.table.query(
-                IndexName='category-index',
-                KeyConditionExpression='category = :cat',
-                ExpressionAttributeValues={':cat': category}
+            return query_category_items(
+                self.table.meta.client,
+                self.table_name,
+                category,
+                attributes=JOB_ATTRIBUTES
             )
-            return response.get('Items', [])
         except Exception as e:
             print(f"Error querying jobs by category: {str(e)}")
             return []
     
+    def get_category_candidates(self, categories: List[str]) -> List[Dict[str, Any]]:
+        """
+        Jobs in the given categories, sorted by job_id
+        Read from the cached catalog when it is warm; otherwise queried on
+        category-index in parallel (fully paginated) while the catalog loads in
+        the background, so later requests are served from memory
+        """
+        if self.catalog.is_loaded():
+            jobs = self.load_job_index().jobs_in_categories(categories)
+        else:
+            self.catalog.warm_in_background()
+            try:
+                jobs = query_categories(self.table.meta.client, self.table_name, categories, attributes=JOB_ATTRIBUTES)
+            except Exception as e:
+                print(f"Error querying jobs by category: {str(e)}")
+                return []
+        # Same order from either source, so ties rank the same cold or warm
+        return sorted(jobs, key=lambda job: str(job.get('job_id', '')))
+    
     def calculate_skill_match(self, student_skills: List[str], job_skills: List[str]) -> float:
         """Calculate skill match percentage"""
         if not job_skills:
@@ -130,71 +269,122 @@ Always maintain a supportive and constructive tone."""
             Dictionary with matched jobs and analysis
         """
         
-        # Get all jobs from DynamoDB using AWS MCP tool
-        all_jobs = self.get_all_jobs()
+        # Category filter: score only jobs in those categories, from the GSI or the warm catalog
+        if preferred_categories and self.category_pushdown:
+            candidates = self.get_category_candidates(preferred_categories)
+            if candidates:
+                candidate_index = JobIndex(candidates)
+                if self.scoring_mode == "vectorized":
+                    candidate_scorer = VectorizedJobScorer(candidate_index)
+                else:
+                    candidate_scorer = candidate_index
+                top_matches = candidate_scorer.top_matches(
+                    student_skills=student_skills,
+                    experience_level=experience_level,
+                    preferred_categories=preferred_categories,
+                    top_n=top_n
+                )
+                return {
+                    "status": "success",
+                    "total_jobs_analyzed": len(candidates),
+                    "top_matches": top_matches,
+                    "student_skills": student_skills,
+                    "experience_level": experience_level
+                }
+        
+        # Get the indexed job catalog (DynamoDB is only scanned on first use)
+        job_index = self.load_job_index()
         
-        if not all_jobs:
+        if not len(job_index):
+            # Retry once in case the table was empty when the index was built
+            job_index = self.refresh_job_index()
+        
+        if not len(job_index):
             return {
                 "status": "error",
                 "error": "No jobs found in database",
                 "top_matches": []
             }
         
-        # Calculate match scores for each job
-        job_matches = []
-        for job in all_jobs:
-            required_skills = job.get('required_skills', [])
-            preferred_skills = job.get('preferred_skills', [])
-            
-            # Calculate match scores
-            required_match = self.calculate_skill_match(student_skills, required_skills)
-            preferred_match = self.calculate_skill_match(student_skills, preferred_skills)
-            
-            # Overall match score (weighted: 70% required, 30% preferred)
-            overall_match = (required_match * 0.7) + (preferred_match * 0.3)
-            
-            # Experience level match bonus
-            exp_match = 1.0 if job.get('experience_level') == experience_level else 0.5
-            
-            # Category preference bonus
-            cat_match = 1.0
-            if preferred_categories:
-                cat_match = 1.2 if job.get('category') in preferred_categories else 0.8
-            
-            # Final score with bonuses
-            final_score = overall_match * exp_match * cat_match
-            
-            # Identify matching and missing skills
-            student_skills_lower = set([s.lower().strip() for s in student_skills])
-            required_skills_lower = set([s.lower().strip() for s in required_skills])
-            preferred_skills_lower = set([s.lower().strip() for s in preferred_skills])
-            
-            matching_skills = list(student_skills_lower & (required_skills_lower | preferred_skills_lower))
-            missing_skills = list(required_skills_lower - student_skills_lower)
-            
-            job_matches.append({
-                "job": job,
-                "match_score": round(final_score, 2),
-                "required_match": required_match,
-                "preferred_match": preferred_match,
-                "matching_skills": matching_skills,
-                "missing_skills": missing_skills
-            })
-        
-        # Sort by match score (descending)
-        job_matches.sort(key=lambda x: x['match_score'], reverse=True)
+        if self.scoring_mode == "vectorized":
+            # Score every job in one NumPy pass, top N via argpartition
+            scorer = self.load_job_scorer()
+        else:
+            # Score only jobs sharing a skill with the student, top N via heap
+            scorer = job_index
         
-        # Get top N matches
-        top_matches = job_matches[:top_n]
+        top_matches = scorer.top_matches(
+            student_skills=student_skills,
+            experience_level=experience_level,
+            preferred_categories=preferred_categories,
+            top_n=top_n
+        )
         
         return {
             "status": "success",
-            "total_jobs_analyzed": len(all_jobs),
+            "total_jobs_analyzed": len(job_index),
             "top_matches": top_matches,
             "student_skills": student_skills,
             "experience_level": experience_level
         }
     
+    def match_jobs_batch(
+        self,
+        profiles: List[Dict[str, Any]],
+        top_n: int = 5,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Match many student profiles against the job catalog in one call
+        The catalog is loaded and encoded once and scored as a students x jobs matrix
+        
+        Args:
+            profiles: List of dicts with student_skills and optional
+                      experience_level, preferred_categories and top_n
+            top_n: Default number of top matches per student
+            max_workers: Fan profile chunks out across this many processes
+            
+        Returns:
+            Dictionary with one match_jobs-shaped result per profile and throughput
+        """
+        start_time = time.perf_counter()
+        
+        job_index = self.load_job_index()
+        if not len(job_index):
+            job_index = self.refresh_job_index()
+        
+        if not len(job_index):
+            return {
+                "status": "error",
+                "error": "No jobs found in database",
+                "results": []
+            }
+        
+        scorer = self.load_job_scorer()
+        batch_matches = scorer.top_matches_batch(profiles, top_n=top_n, max_workers=max_workers)
+        
+        results = []
+        for profile, top_matches in zip(profiles, batch_matches):
+            results.append({
+                "status": "success",
+                "total_jobs_analyzed": len(job_index),
+                "top_matches": top_matches,
+                "student_skills": profile.get('student_skills', []),
+                "experience_level": profile.get('experience_level', "Entry Level")
+            })
+        
+        elapsed = time.perf_counter() - start_time
+        students_per_second = len(profiles) / elapsed if elapsed > 0 else 0.0
+        
+        return {
+            "status": "success",
+            "total_students": len(profiles),
+            "total_jobs_analyzed": len(job_index),
+            "results": results,
+            "elapsed_seconds": round(elapsed, 4),
+            "students_per_second": round(students_per_second, 2)
+        }
+    
     def get_recommendations(
         self,
         student_skills: List[str],
@@ -236,8 +426,8 @@ Always maintain a supportive and constructive tone."""
                 "company": job['company'],
                 "location": job.get('location', 'Not specified'),
                 "match_score": match['match_score'],
-                "matching_skills": match['matching_skills'],
-                "missing_skills": match['missing_skills'],
+                "matching_skills": sorted(match['matching_skills']),
+                "missing_skills": sorted(match['missing_skills']),
                 "salary": job.get('salary_range', 'Not specified'),
                 "category": job.get('category', 'Not specified')
             })
@@ -267,15 +457,38 @@ Please provide:
 
 Be specific, encouraging, and actionable. Focus on growth opportunities."""
         
+        # Same profile + same top matches -> same prompt, so reuse the earlier analysis
+        cache_key = make_cache_key(
+            {
+                "student_skills": sorted({s.lower().strip() for s in student_skills}),
+                "experience_level": experience_level,
+                "preferred_categories": sorted(preferred_categories) if preferred_categories else None,
+                "jobs_summary": json.loads(json.dumps(jobs_summary, cls=DecimalEncoder))
+            },
+            RECOMMENDATIONS_PROMPT_VERSION
+        )
+        cached_analysis = self.response_cache.get(cache_key)
+        if cached_analysis is not None:
+            return {
+                "status": "success",
+                "match_data": match_result,
+                "ai_analysis": cached_analysis,
+                "agent_name": "JobMatcherAgent",
+                "cached": True
+            }
+        
         try:
             # Get AI analysis using Strands agent
             ai_response = self.agent(analysis_prompt)
+            ai_analysis = str(ai_response)
+            self.response_cache.put(cache_key, ai_analysis)
             
             return {
                 "status": "success",
                 "match_data": match_result,
-                "ai_analysis": str(ai_response),
-                "agent_name": "JobMatcherAgent"
+                "ai_analysis": ai_analysis,
+                "agent_name": "JobMatcherAgent",
+                "cached": False
             }
             
         except Exception as e:
@@ -292,52 +505,46 @@ Be specific, encouraging, and actionable. Focus on growth opportunities."""
         Find all jobs that require a specific skill
         Useful for exploring opportunities for a particular technology
         """
-        all_jobs = self.get_all_jobs()
-        matching_jobs = []
-        
-        skill_lower = skill.lower().strip()
-        for job in all_jobs:
-            required_skills = [s.lower().strip() for s in job.get('required_skills', [])]
-            preferred_skills = [s.lower().strip() for s in job.get('preferred_skills', [])]
-            
-            if skill_lower in required_skills or skill_lower in preferred_skills:
-                matching_jobs.append(job)
-        
-        return matching_jobs
+        return self.load_job_index().jobs_with_skill(skill)
     
     def get_skill_demand_analysis(self, skill: str) -> Dict[str, Any]:
         """
         Analyze demand for a specific skill across all jobs
         Provides insights on salary ranges and job categories
         """
-        matching_jobs = self.find_jobs_by_skill(skill)
+        # O(1) lookup into aggregates maintained alongside the job index
+        job_index = self.load_job_index()
+        demand = job_index.skill_demand(skill)
         
-        if not matching_jobs:
+        if not demand:
             return {
                 "status": "error",
                 "error": f"No jobs found requiring skill: {skill}"
             }
         
-        # Aggregate data
-        categories = {}
-        for job in matching_jobs:
-            cat = job.get('category', 'Other')
-            categories[cat] = categories.get(cat, 0) + 1
+        categories = demand['categories']
+        sample_jobs = job_index.sample_jobs_with_skill(skill, limit=5)
         
         analysis_prompt = f"""Analyze the demand for the skill "{skill}" based on this job data:
 
 JOBS REQUIRING {skill.upper()}:
-Total Jobs: {len(matching_jobs)}
+Total Jobs: {demand['total_jobs']}
 Categories: {json.dumps(categories, indent=2)}
 
+Skills Most Often Listed Alongside {skill} (job counts):
+{json.dumps(demand['complementary_skills'], indent=2)}
+
+Salary Ranges Across These Jobs:
+{json.dumps(demand['salary_summary'] or demand['salary_ranges'], indent=2, cls=DecimalEncoder)}
+
 Sample Jobs:
-{json.dumps([{"title": j['title'], "company": j['company'], "salary": j.get('salary_range')} for j in matching_jobs[:5]], indent=2, cls=DecimalEncoder)}
+{json.dumps([{"title": j['title'], "company": j['company'], "salary": j.get('salary_range')} for j in sample_jobs], indent=2, cls=DecimalEncoder)}
 
 Provide:
 1. **Market Demand**: How in-demand is this skill?
 2. **Career Paths**: What roles typically require this skill?
 3. **Salary Insights**: Typical salary ranges for this skill
-4. **Complementary Skills**: What other skills are commonly required alongside this?
+4. **Complementary Skills**: Which of the co-occurring skills above should be learned alongside this, and why?
 5. **Learning Recommendation**: Should students prioritize learning this skill?
 
 Be specific and data-driven."""
@@ -348,8 +555,10 @@ Be specific and data-driven."""
             return {
                 "status": "success",
                 "skill": skill,
-                "total_jobs": len(matching_jobs),
+                "total_jobs": demand['total_jobs'],
                 "categories": categories,
+                "complementary_skills": demand['complementary_skills'],
+                "salary_summary": demand['salary_summary'],
                 "analysis": str(ai_response),
                 "agent_name": "JobMatcherAgent"
             }
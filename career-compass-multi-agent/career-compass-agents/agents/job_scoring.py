@@ -0,0 +1,372 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+
+import numpy as np
+
+from agents.job_index import JobIndex, normalize_skill
+
+# Number of set bits for every possible byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint16)
+
+# Multipliers used by match_jobs, indexed by the flags computed below
+_EXPERIENCE_FACTORS = (1.0, 0.5)
+_CATEGORY_FACTORS = (1.0, 1.2, 0.8)
+
+# Largest lazily-filled rounding table before falling back to np.unique
+_MAX_ROUNDING_TABLE = 4_000_000
+
+# Scores per chunk when scoring many students (bounds peak memory)
+_BATCH_CELLS = 4_000_000
+
+
+class VectorizedJobScorer:
+    """
+    NumPy scoring engine over a JobIndex snapshot
+    Encodes required/preferred skills as packed bitset rows over the skill
+    vocabulary and scores every job in one vectorized pass. Scores are
+    bit-for-bit identical to JobIndex / calculate_skill_match because the
+    per-skill percentages and the final rounding go through Python round().
+    """
+
+    def __init__(self, job_index: JobIndex):
+        self.job_index = job_index
+        self.version = job_index.version
+        # Compact snapshot of live jobs; scorer positions index into this list
+        self.jobs = job_index.live_jobs()
+        jobs = self.jobs
+
+        self.vocabulary: Dict[str, int] = {
+            skill: i for i, skill in enumerate(sorted(job_index.skill_to_jobs))
+        }
+        n_bytes = max(1, (len(self.vocabulary) + 7) // 8)
+
+        self.required_bits = np.zeros((len(jobs), n_bytes), dtype=np.uint8)
+        self.preferred_bits = np.zeros((len(jobs), n_bytes), dtype=np.uint8)
+        self.required_counts = np.array([j.required_count for j in jobs], dtype=np.int64)
+        self.preferred_counts = np.array([j.preferred_count for j in jobs], dtype=np.int64)
+
+        for row, indexed in enumerate(jobs):
+            self._set_bits(self.required_bits[row], indexed.required)
+            self._set_bits(self.preferred_bits[row], indexed.preferred)
+
+        # Experience level and category as integer codes over distinct values
+        self._experience_values, self.experience_codes = self._encode_values(
+            j.job.get('experience_level') for j in jobs
+        )
+        self._category_values, self.category_codes = self._encode_values(
+            j.job.get('category') for j in jobs
+        )
+
+        # Percentages as codes into a sorted list of Python-rounded values:
+        # _percent_codes[count, overlap] -> index into percent_values
+        max_count = int(max(self.required_counts.max(initial=0), self.preferred_counts.max(initial=0)))
+        percentages = {
+            (count, overlap): (round((overlap / count) * 100, 2) if count else 0.0)
+            for count in range(max_count + 1)
+            for overlap in range(count + 1)
+        }
+        self.percent_values = np.array(sorted(set(percentages.values())), dtype=np.float64)
+        value_codes = {value: code for code, value in enumerate(self.percent_values.tolist())}
+        self._percent_codes = np.zeros((max_count + 1, max_count + 1), dtype=np.int64)
+        for (count, overlap), value in percentages.items():
+            self._percent_codes[count, overlap] = value_codes[value]
+
+        # Final scores keyed on (required code, preferred code, exp flag, cat flag),
+        # rounded with Python round() the first time each key is seen
+        table_size = len(self.percent_values) ** 2 * len(_EXPERIENCE_FACTORS) * len(_CATEGORY_FACTORS)
+        if table_size <= _MAX_ROUNDING_TABLE:
+            self._rounded = np.zeros(table_size, dtype=np.float64)
+            self._rounded_filled = np.zeros(table_size, dtype=bool)
+        else:
+            self._rounded = None
+            self._rounded_filled = None
+
+        self._required_dense: Optional[np.ndarray] = None
+        self._preferred_dense: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def __getstate__(self):
+        # Dense matrices are rebuilt lazily in worker processes
+        state = self.__dict__.copy()
+        state['_required_dense'] = None
+        state['_preferred_dense'] = None
+        return state
+
+    @staticmethod
+    def _encode_values(values: Iterable[Any]):
+        distinct: List[Any] = []
+        positions: Dict[Any, int] = {}
+        codes = []
+        for value in values:
+            if value not in positions:
+                positions[value] = len(distinct)
+                distinct.append(value)
+            codes.append(positions[value])
+        return distinct, np.array(codes, dtype=np.int64)
+
+    @staticmethod
+    def _codes_where(distinct: List[Any], predicate) -> np.ndarray:
+        return np.array([i for i, value in enumerate(distinct) if predicate(value)], dtype=np.int64)
+
+    def _set_bits(self, row: np.ndarray, skills: Iterable[str]) -> None:
+        for skill in skills:
+            bit = self.vocabulary.get(skill)
+            if bit is not None:
+                row[bit >> 3] |= np.uint8(1 << (bit & 7))
+
+    def encode_skills(self, student_skills: Iterable[str]) -> np.ndarray:
+        """Encode a student skill list as a bitset row over the vocabulary"""
+        row = np.zeros(self.required_bits.shape[1], dtype=np.uint8)
+        self._set_bits(row, {normalize_skill(s) for s in student_skills})
+        return row
+
+    def _factor_flags(
+        self,
+        experience_level: str,
+        preferred_categories: Optional[List[str]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-job experience flag (0 match, 1 other) and category flag (0 none, 1 preferred, 2 other)"""
+        exp_codes = self._codes_where(self._experience_values, lambda v: v == experience_level)
+        exp_flags = np.where(np.isin(self.experience_codes, exp_codes), 0, 1)
+
+        if preferred_categories:
+            cat_codes = self._codes_where(self._category_values, lambda v: v in preferred_categories)
+            cat_flags = np.where(np.isin(self.category_codes, cat_codes), 1, 2)
+        else:
+            cat_flags = np.zeros(len(self), dtype=np.int64)
+
+        return exp_flags, cat_flags
+
+    def _final_scores(
+        self,
+        required_codes: np.ndarray,
+        preferred_codes: np.ndarray,
+        exp_flags: np.ndarray,
+        cat_flags: np.ndarray
+    ) -> np.ndarray:
+        """Rounded final scores, identical to round(overall * exp * cat, 2)"""
+        if self._rounded is None:
+            # Very long skill lists: compute in float64 then round the distinct values
+            overall = (self.percent_values[required_codes] * 0.7) + (self.percent_values[preferred_codes] * 0.3)
+            raw = overall * np.take(_EXPERIENCE_FACTORS, exp_flags) * np.take(_CATEGORY_FACTORS, cat_flags)
+            distinct, inverse = np.unique(raw, return_inverse=True)
+            rounded = np.array([round(float(v), 2) for v in distinct], dtype=np.float64)
+            return rounded[inverse].reshape(raw.shape)
+
+        n_percent = len(self.percent_values)
+        keys = (required_codes * n_percent + preferred_codes) * len(_EXPERIENCE_FACTORS) + exp_flags
+        keys = keys * len(_CATEGORY_FACTORS) + cat_flags
+
+        present = np.zeros(len(self._rounded), dtype=bool)
+        present[keys] = True
+        for key in np.flatnonzero(present & ~self._rounded_filled).tolist():
+            rest, cat_flag = divmod(key, len(_CATEGORY_FACTORS))
+            rest, exp_flag = divmod(rest, len(_EXPERIENCE_FACTORS))
+            required_code, preferred_code = divmod(rest, n_percent)
+
+            # Overall match score (weighted: 70% required, 30% preferred)
+            overall_match = (
+                (float(self.percent_values[required_code]) * 0.7)
+                + (float(self.percent_values[preferred_code]) * 0.3)
+            )
+            final_score = overall_match * _EXPERIENCE_FACTORS[exp_flag] * _CATEGORY_FACTORS[cat_flag]
+
+            self._rounded[key] = round(final_score, 2)
+            self._rounded_filled[key] = True
+
+        return self._rounded[keys]
+
+    def _percent_code(self, counts: np.ndarray, overlap: np.ndarray) -> np.ndarray:
+        return self._percent_codes[counts, np.minimum(overlap, counts)]
+
+    def score_all(
+        self,
+        student_skills: List[str],
+        experience_level: str = "Entry Level",
+        preferred_categories: Optional[List[str]] = None
+    ):
+        """
+        Score every job at once
+        Returns (final_scores, required_match, preferred_match) arrays
+        """
+        student_row = self.encode_skills(student_skills)
+
+        required_overlap = _POPCOUNT[self.required_bits & student_row].sum(axis=-1, dtype=np.int64)
+        preferred_overlap = _POPCOUNT[self.preferred_bits & student_row].sum(axis=-1, dtype=np.int64)
+        required_codes = self._percent_code(self.required_counts, required_overlap)
+        preferred_codes = self._percent_code(self.preferred_counts, preferred_overlap)
+
+        exp_flags, cat_flags = self._factor_flags(experience_level, preferred_categories)
+        final_scores = self._final_scores(required_codes, preferred_codes, exp_flags, cat_flags)
+
+        return final_scores, self.percent_values[required_codes], self.percent_values[preferred_codes]
+
+    def _dense(self, bits: np.ndarray) -> np.ndarray:
+        """Unpack bitset rows into a jobs x vocabulary 0/1 matrix"""
+        return np.unpackbits(bits, axis=1, bitorder='little')[:, :len(self.vocabulary)]
+
+    def score_matrix(self, profiles: List[Dict[str, Any]]):
+        """
+        Score a students x jobs matrix in one pass
+        Skill overlaps come from one matrix product over the vocabulary
+        columns the students actually use.
+        Returns (final_scores, required_match, preferred_match), each students x jobs
+        """
+        if self._required_dense is None:
+            self._required_dense = self._dense(self.required_bits)
+            self._preferred_dense = self._dense(self.preferred_bits)
+
+        skill_sets = [
+            {normalize_skill(s) for s in profile.get('student_skills', [])}
+            for profile in profiles
+        ]
+        columns = sorted({self.vocabulary[s] for skills in skill_sets for s in skills if s in self.vocabulary})
+        column_of = {bit: i for i, bit in enumerate(columns)}
+
+        students = np.zeros((len(columns), len(profiles)), dtype=np.float32)
+        for j, skills in enumerate(skill_sets):
+            for skill in skills:
+                bit = self.vocabulary.get(skill)
+                if bit is not None:
+                    students[column_of[bit], j] = 1.0
+
+        # Overlaps are small integers so float32 products are exact
+        required_overlap = (self._required_dense[:, columns].astype(np.float32) @ students).T.astype(np.int64)
+        preferred_overlap = (self._preferred_dense[:, columns].astype(np.float32) @ students).T.astype(np.int64)
+        required_codes = self._percent_code(self.required_counts[None, :], required_overlap)
+        preferred_codes = self._percent_code(self.preferred_counts[None, :], preferred_overlap)
+
+        flags = [
+            self._factor_flags(
+                profile.get('experience_level', "Entry Level"),
+                profile.get('preferred_categories')
+            )
+            for profile in profiles
+        ]
+        exp_flags = np.array([f[0] for f in flags], dtype=np.int64).reshape(len(profiles), len(self))
+        cat_flags = np.array([f[1] for f in flags], dtype=np.int64).reshape(len(profiles), len(self))
+
+        final_scores = self._final_scores(required_codes, preferred_codes, exp_flags, cat_flags)
+
+        return final_scores, self.percent_values[required_codes], self.percent_values[preferred_codes]
+
+    @staticmethod
+    def top_positions(scores: np.ndarray, top_n: int) -> np.ndarray:
+        """
+        Positions of the top N scores via argpartition
+        Ties are broken by catalog position, like a stable descending sort
+        """
+        if top_n <= 0 or not len(scores):
+            return np.array([], dtype=np.int64)
+        if top_n >= len(scores):
+            return np.lexsort((np.arange(len(scores)), -scores))
+
+        threshold = scores[np.argpartition(-scores, top_n - 1)[top_n - 1]]
+        above = np.flatnonzero(scores > threshold)
+        ties = np.flatnonzero(scores == threshold)[:top_n - len(above)]
+        chosen = np.concatenate([above, ties])
+        return chosen[np.lexsort((chosen, -scores[chosen]))]
+
+    def _entries(
+        self,
+        student_skills: List[str],
+        positions: Iterable[int],
+        scores: Iterable[float],
+        required_match: Iterable[float],
+        preferred_match: Iterable[float]
+    ) -> List[Dict[str, Any]]:
+        """Match dictionaries for the given catalog positions and their scores"""
+        student_set = {normalize_skill(s) for s in student_skills}
+        return [
+            JobIndex.match_entry(self.jobs[p], student_set, float(s), float(r), float(f))
+            for p, s, r, f in zip(positions, scores, required_match, preferred_match)
+        ]
+
+    def top_matches(
+        self,
+        student_skills: List[str],
+        experience_level: str = "Entry Level",
+        preferred_categories: Optional[List[str]] = None,
+        top_n: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Vectorized equivalent of JobIndex.top_matches"""
+        scores, required_match, preferred_match = self.score_all(
+            student_skills, experience_level, preferred_categories
+        )
+        positions = self.top_positions(scores, top_n)
+        return self._entries(
+            student_skills,
+            positions.tolist(),
+            scores[positions],
+            required_match[positions],
+            preferred_match[positions]
+        )
+
+    def top_positions_batch(self, profiles: List[Dict[str, Any]], top_n: int = 5) -> List[Tuple]:
+        """
+        Top N (positions, scores, required_match, preferred_match) per profile
+        Only small arrays are returned so results are cheap to send between processes
+        """
+        results = []
+        chunk = max(1, _BATCH_CELLS // max(1, len(self)))
+        for start in range(0, len(profiles), chunk):
+            batch = profiles[start:start + chunk]
+            scores, required_match, preferred_match = self.score_matrix(batch)
+            for row, profile in enumerate(batch):
+                positions = self.top_positions(scores[row], profile.get('top_n', top_n))
+                results.append((
+                    positions,
+                    scores[row, positions],
+                    required_match[row, positions],
+                    preferred_match[row, positions]
+                ))
+        return results
+
+    def top_matches_batch(
+        self,
+        profiles: List[Dict[str, Any]],
+        top_n: int = 5,
+        max_workers: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Top N match lists for many student profiles
+
+        Each profile is a dict with student_skills and optional
+        experience_level, preferred_categories and top_n. With max_workers > 1
+        profile chunks are scored in a process pool; each worker receives the
+        encoded catalog once through the pool initializer.
+        """
+        if max_workers and max_workers > 1 and len(profiles) > 1:
+            chunk = -(-len(profiles) // max_workers)
+            chunks = [profiles[i:i + chunk] for i in range(0, len(profiles), chunk)]
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_batch_worker,
+                initargs=(self,)
+            ) as executor:
+                raw = [
+                    item
+                    for part in executor.map(_score_batch_chunk, chunks, [top_n] * len(chunks))
+                    for item in part
+                ]
+        else:
+            raw = self.top_positions_batch(profiles, top_n)
+
+        return [
+            self._entries(profile.get('student_skills', []), positions.tolist(), scores, required, preferred)
+            for profile, (positions, scores, required, preferred) in zip(profiles, raw)
+        ]
+
+
+_WORKER_SCORER: Optional[VectorizedJobScorer] = None
+
+
+def _init_batch_worker(scorer: VectorizedJobScorer) -> None:
+    global _WORKER_SCORER
+    _WORKER_SCORER = scorer
+
+
+def _score_batch_chunk(profiles: List[Dict[str, Any]], top_n: int) -> List[Tuple]:
+    return _WORKER_SCORER.top_positions_batch(profiles, top_n)
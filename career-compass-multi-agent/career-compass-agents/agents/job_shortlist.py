@@ -0,0 +1,99 @@
+import math
+import heapq
+from typing import Dict, Any, List, Optional, Iterable
+
+from agents.job_index import JobIndex, normalize_skill
+from agents.mcp_tools.semantic_cache import tokenize
+
+
+def job_text(job: Dict[str, Any]) -> str:
+    """Title, description and skills of a posting as one document"""
+    skills = list(job.get('required_skills', []) or []) + list(job.get('preferred_skills', []) or [])
+    return " ".join([str(job.get('title', '')), str(job.get('description', '')), " ".join(skills)])
+
+
+class JobShortlister:
+    """
+    Stage one of resume-to-catalog ranking: sparse TF-IDF cosine between the resume
+    and each posting's title, description and skills, blended with required-skill
+    coverage. Scoring walks an inverted index, so only postings sharing a term with
+    the resume are touched; no model call is made
+    """
+
+    def __init__(self, jobs: Iterable[Dict[str, Any]], skill_weight: float = 0.4, version: Any = None):
+        self.jobs: List[Dict[str, Any]] = list(jobs)
+        self.skill_weight = skill_weight
+        # Lets callers tell whether a cached shortlister still matches the catalog
+        self.version = version
+
+        term_counts: List[Dict[str, int]] = []
+        document_frequency: Dict[str, int] = {}
+        for job in self.jobs:
+            counts: Dict[str, int] = {}
+            for term in self._terms(job_text(job)):
+                counts[term] = counts.get(term, 0) + 1
+            term_counts.append(counts)
+            for term in counts:
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+
+        total = len(self.jobs)
+        self.idf = {term: math.log((1 + total) / (1 + df)) + 1.0 for term, df in document_frequency.items()}
+        # term -> [(job position, normalized tf-idf weight)]
+        self.postings: Dict[str, List[tuple]] = {}
+        self.required: List[frozenset] = []
+        for position, (job, counts) in enumerate(zip(self.jobs, term_counts)):
+            weights = {term: (1 + math.log(count)) * self.idf[term] for term, count in counts.items()}
+            norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+            for term, weight in weights.items():
+                self.postings.setdefault(term, []).append((position, weight / norm))
+            self.required.append(frozenset(normalize_skill(skill) for skill in job.get('required_skills', []) or []))
+
+    @classmethod
+    def from_job_index(cls, job_index: JobIndex, **kwargs) -> "JobShortlister":
+        return cls(job_index.all_jobs(), version=(id(job_index), job_index.version), **kwargs)
+
+    @staticmethod
+    def _terms(text: str) -> List[str]:
+        tokens = tokenize(text)
+        return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    def shortlist(self, resume_text: str, resume_skills: Optional[Iterable[str]] = None, top_k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Best top_k postings: [{job, similarity, skill_coverage, score}]
+        score = (1 - skill_weight) * tf-idf cosine + skill_weight * required-skill coverage
+        """
+        counts: Dict[str, int] = {}
+        for term in self._terms(resume_text):
+            if term in self.idf:
+                counts[term] = counts.get(term, 0) + 1
+        weights = {term: (1 + math.log(count)) * self.idf[term] for term, count in counts.items()}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+
+        similarity: Dict[int, float] = {}
+        for term, weight in weights.items():
+            for position, job_weight in self.postings[term]:
+                similarity[position] = similarity.get(position, 0.0) + weight / norm * job_weight
+
+        skills = {normalize_skill(skill) for skill in resume_skills or ()}
+        candidates = set(similarity)
+        if skills:
+            candidates.update(position for position, required in enumerate(self.required) if required & skills)
+
+        def score(position: int) -> tuple:
+            required = self.required[position]
+            coverage = len(required & skills) / len(required) if required else 0.0
+            cosine = similarity.get(position, 0.0)
+            return (1 - self.skill_weight) * cosine + self.skill_weight * coverage, cosine, coverage
+
+        scored = ((score(position), position) for position in candidates)
+        # Ties keep catalog order
+        best = heapq.nsmallest(top_k, scored, key=lambda item: (-item[0][0], item[1]))
+        return [
+            {
+                "job": self.jobs[position],
+                "similarity": round(cosine, 4),
+                "skill_coverage": round(coverage, 4),
+                "score": round(total, 4)
+            }
+            for (total, cosine, coverage), position in best
+        ]
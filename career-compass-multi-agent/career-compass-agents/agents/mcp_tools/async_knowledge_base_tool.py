@@ -0,0 +1,121 @@
+import asyncio
+import contextlib
+from typing import Dict, List, Any
+
+from agents.mcp_tools.knowledge_base_tool import KnowledgeBaseTool, KnowledgeBaseToolOutput
+
+
+async def open_async_client(exit_stack: contextlib.AsyncExitStack, service_name: str, region: str):
+    """Open an aioboto3 client whose lifetime is tied to exit_stack"""
+    import aioboto3  # Only needed when no client is injected
+
+    session = aioboto3.Session()
+    return await exit_stack.enter_async_context(session.client(service_name, region_name=region))
+
+
+class LoopLocalClients:
+    """
+    aioboto3 clients opened lazily for the running event loop
+    The clients, the exit stack that closes them and the lock guarding their
+    creation all belong to one loop, so when called from another loop (a second
+    asyncio.run(), a new Streamlit script run) they are replaced rather than reused
+    """
+
+    def __init__(self, region: str):
+        self.region = region
+        self._loop = None
+        self._exit_stack = None
+        self._lock = None
+        self._clients: Dict[str, Any] = {}
+
+    def _bind(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Clients of a finished loop cannot be closed from this one; drop them
+            self._loop = loop
+            self._exit_stack = contextlib.AsyncExitStack()
+            self._lock = asyncio.Lock()
+            self._clients = {}
+
+    async def get(self, service_name: str):
+        self._bind()
+        client = self._clients.get(service_name)
+        if client is None:
+            async with self._lock:
+                client = self._clients.get(service_name)
+                if client is None:
+                    client = await open_async_client(self._exit_stack, service_name, self.region)
+                    self._clients[service_name] = client
+        return client
+
+    async def close(self) -> None:
+        if self._loop is asyncio.get_running_loop():
+            await self._exit_stack.aclose()
+        self._loop = None
+        self._clients = {}
+
+
+class AsyncKnowledgeBaseTool(KnowledgeBaseTool):
+    """
+    KnowledgeBaseTool for asyncio callers
+    Same modes, caching and output as the sync tool; Bedrock calls are awaited on an
+    aioboto3-style client (any object whose retrieve/retrieve_and_generate are coroutines)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._clients = LoopLocalClients(self.region)
+
+    def _create_client(self):
+        # Opened on first use, inside the running event loop
+        return None
+
+    async def _client(self):
+        if self.bedrock_agent_runtime is not None:
+            return self.bedrock_agent_runtime
+        return await self._clients.get('bedrock-agent-runtime')
+
+    async def close(self) -> None:
+        await self._clients.close()
+
+    async def execute(self, query: str, max_results: int = 5) -> KnowledgeBaseToolOutput:
+        """Execute knowledge base query"""
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.get(query, max_results)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+
+        try:
+            if self.mode == "retrieve":
+                output = self._passages_output(await self._retrieve(query, max_results), max_results)
+            else:
+                client = await self._client()
+                response = await client.retrieve_and_generate(
+                    **self._retrieve_and_generate_request(query, max_results)
+                )
+                output = self._generated_output(response)
+
+        except Exception as e:
+            print(f"Error querying knowledge base: {str(e)}")
+            return self._error_output(e)
+
+        if self.semantic_cache is not None:
+            self.semantic_cache.put(query, output.model_copy(deep=True), max_results)
+
+        return output
+
+    async def _retrieve(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        request = self._retrieve_request(query, max_results)
+        if self.local_retriever is not None:
+            # In-process BM25 lookup is sub-millisecond; no need to leave the loop
+            return self._retrieved_sources(self.local_retriever.retrieve(**request))
+        client = await self._client()
+        return self._retrieved_sources(await client.retrieve(**request))
+
+    async def retrieve(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+        """Ranked passages only, no generation"""
+        try:
+            return await self._retrieve(query, max_results)
+        except Exception as e:
+            print(f"Error retrieving from knowledge base: {str(e)}")
+            return []
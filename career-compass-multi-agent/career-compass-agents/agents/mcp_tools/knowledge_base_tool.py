@@ -1,9 +1,16 @@
 
-import boto3
 import json
 from typing import Dict, List, Any, Optional
 from pydantic import BaseModel, Field
 
+from agents.aws_clients import get_client
+from agents.mcp_tools.semantic_cache import SemanticCache
+
+
+def reference_location(location: Dict[str, Any]) -> Dict[str, Any]:
+    """The s3Location (or local index location) of a retrieved reference"""
+    return location.get('s3Location') or location.get('localLocation') or {}
+
 class KnowledgeBaseToolInput(BaseModel):
     """Input schema for Knowledge Base tool"""
     query: str = Field(
@@ -20,17 +27,90 @@ class KnowledgeBaseToolOutput(BaseModel):
     sources: List[Dict[str, Any]]
     confidence: str
 
+def select_passages(
+    sources: List[Dict[str, Any]],
+    max_chunks: int = 5,
+    max_chunk_chars: int = 1200,
+    max_total_chars: int = 4000,
+    overlap_threshold: float = 0.8
+) -> List[Dict[str, Any]]:
+    """
+    Trim ranked passages to a budget, best first
+    Lines already included by a higher-ranked passage are removed, and a passage
+    that is mostly (overlap_threshold) lines already seen is dropped entirely
+    """
+    selected = []
+    seen_lines = set()
+    total_chars = 0
+    
+    for source in sorted(sources, key=lambda s: s.get('score', 0), reverse=True):
+        if len(selected) >= max_chunks or total_chars >= max_total_chars:
+            break
+        
+        lines = [line.strip() for line in source.get('content', '').splitlines() if line.strip()]
+        if not lines:
+            continue
+        fresh = [line for line in lines if " ".join(line.lower().split()) not in seen_lines]
+        if len(fresh) <= len(lines) * (1 - overlap_threshold):
+            continue
+        
+        content = "\n".join(fresh)
+        budget = min(max_chunk_chars, max_total_chars - total_chars)
+        if len(content) > budget:
+            content = content[:budget].rsplit(" ", 1)[0] + " ..."
+        
+        seen_lines.update(" ".join(line.lower().split()) for line in fresh)
+        total_chars += len(content)
+        selected.append(dict(source, content=content))
+    
+    return selected
+
 class KnowledgeBaseTool:
     """MCP Tool for querying Bedrock Knowledge Base"""
     
-    def __init__(self, knowledge_base_id: str, region: str = "us-west-2"):
+    MODES = ("retrieve_and_generate", "retrieve")
+    
+    def __init__(
+        self,
+        knowledge_base_id: str,
+        region: str = "us-west-2",
+        semantic_cache: Optional[SemanticCache] = None,
+        use_semantic_cache: bool = False,
+        local_retriever=None,
+        bedrock_agent_runtime=None,
+        mode: str = "retrieve_and_generate",
+        max_chunks: int = 5,
+        max_chunk_chars: int = 1200,
+        max_total_chars: int = 4000,
+        overlap_threshold: float = 0.8
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}")
+        
         self.knowledge_base_id = knowledge_base_id
         self.region = region
-        self.bedrock_agent_runtime = boto3.client(
-            'bedrock-agent-runtime',
-            region_name=region
+        self.mode = mode
+        
+        # Retrieve-only budgets for what is returned to the calling model
+        self.max_chunks = max_chunks
+        self.max_chunk_chars = max_chunk_chars
+        self.max_total_chars = max_total_chars
+        self.overlap_threshold = overlap_threshold
+        self.bedrock_agent_runtime = (
+            bedrock_agent_runtime if bedrock_agent_runtime is not None else self._create_client()
         )
         
+        # Opt-in: near-identical questions reuse an earlier answer instead of calling Bedrock
+        if semantic_cache is None and use_semantic_cache:
+            semantic_cache = SemanticCache.shared(f"{knowledge_base_id}:{mode}")
+        self.semantic_cache = semantic_cache
+        
+        # Optional in-process LocalRetriever; answers retrieve() without calling Bedrock
+        self.local_retriever = local_retriever
+        
+    def _create_client(self):
+        return get_client('bedrock-agent-runtime', self.region)
+    
     @property
     def name(self) -> str:
         return "query_knowledge_base"
@@ -52,51 +132,137 @@ class KnowledgeBaseTool:
     
     def execute(self, query: str, max_results: int = 5) -> KnowledgeBaseToolOutput:
         """Execute knowledge base query"""
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.get(query, max_results)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+        
         try:
-            response = self.bedrock_agent_runtime.retrieve_and_generate(
-                input={'text': query},
-                retrieveAndGenerateConfiguration={
-                    'type': 'KNOWLEDGE_BASE',
-                    'knowledgeBaseConfiguration': {
-                        'knowledgeBaseId': self.knowledge_base_id,
-                        'modelArn': 'arn:aws:bedrock:us-west-2:596174723673:inference-profile/us.amazon.nova-pro-v1:0',
-                        
-                        'retrievalConfiguration': {
-                            'vectorSearchConfiguration': {
-                                'numberOfResults': max_results
-                            }
+            if self.mode == "retrieve":
+                output = self._passages_output(self._retrieve(query, max_results), max_results)
+            else:
+                response = self.bedrock_agent_runtime.retrieve_and_generate(
+                    **self._retrieve_and_generate_request(query, max_results)
+                )
+                output = self._generated_output(response)
+            
+        except Exception as e:
+            print(f"Error querying knowledge base: {str(e)}")
+            return self._error_output(e)
+        
+        if self.semantic_cache is not None:
+            self.semantic_cache.put(query, output.model_copy(deep=True), max_results)
+        
+        return output
+    
+    def _error_output(self, error: Exception) -> KnowledgeBaseToolOutput:
+        return KnowledgeBaseToolOutput(
+            answer=f"I encountered an error while searching the knowledge base: {str(error)}",
+            sources=[],
+            confidence="low"
+        )
+    
+    def _retrieve_and_generate_request(self, query: str, max_results: int) -> Dict[str, Any]:
+        """Retrieval plus a model-written answer, generated inside the knowledge base call"""
+        return {
+            'input': {'text': query},
+            'retrieveAndGenerateConfiguration': {
+                'type': 'KNOWLEDGE_BASE',
+                'knowledgeBaseConfiguration': {
+                    'knowledgeBaseId': self.knowledge_base_id,
+                    'modelArn': 'arn:aws:bedrock:us-west-2:596174723673:inference-profile/us.amazon.nova-pro-v1:0',
+                    
+                    'retrievalConfiguration': {
+                        'vectorSearchConfiguration': {
+                            'numberOfResults': max_results
                         }
                     }
                 }
-            )
-            
-            answer = response['output']['text']
-            sources = []
-            
-            if 'citations' in response:
-                for citation in response['citations']:
-                    for reference in citation.get('retrievedReferences', []):
-                        sources.append({
-                            'content': reference.get('content', {}).get('text', ''),
-                            'location': reference.get('location', {}).get('s3Location', {}),
-                            'score': reference.get('metadata', {}).get('score', 0)
-                        })
-            
-            confidence = "high" if len(sources) >= 3 else "medium" if len(sources) >= 1 else "low"
-            
-            return KnowledgeBaseToolOutput(
-                answer=answer,
-                sources=sources,
-                confidence=confidence
-            )
-            
+            }
+        }
+    
+    def _generated_output(self, response: Dict[str, Any]) -> KnowledgeBaseToolOutput:
+        answer = response['output']['text']
+        sources = []
+        
+        if 'citations' in response:
+            for citation in response['citations']:
+                for reference in citation.get('retrievedReferences', []):
+                    sources.append({
+                        'content': reference.get('content', {}).get('text', ''),
+                        'location': reference_location(reference.get('location', {})),
+                        'score': reference.get('metadata', {}).get('score', 0)
+                    })
+        
+        confidence = "high" if len(sources) >= 3 else "medium" if len(sources) >= 1 else "low"
+        
+        return KnowledgeBaseToolOutput(
+            answer=answer,
+            sources=sources,
+            confidence=confidence
+        )
+    
+    def _passages_output(self, sources: List[Dict[str, Any]], max_results: int) -> KnowledgeBaseToolOutput:
+        """
+        Ranked passages handed straight to the calling model, which writes the answer
+        Saves the second generation that retrieve_and_generate runs inside the tool
+        """
+        passages = select_passages(
+            sources,
+            max_chunks=min(max_results, self.max_chunks),
+            max_chunk_chars=self.max_chunk_chars,
+            max_total_chars=self.max_total_chars,
+            overlap_threshold=self.overlap_threshold
+        )
+        
+        confidence = "high" if len(passages) >= 3 else "medium" if len(passages) >= 1 else "low"
+        answer = (
+            f"Retrieved {len(passages)} passages ranked by relevance. "
+            "Answer from the passage content in sources and cite them by number."
+            if passages else "No relevant passages found in the knowledge base."
+        )
+        
+        return KnowledgeBaseToolOutput(
+            answer=answer,
+            sources=[dict(passage, id=number) for number, passage in enumerate(passages, 1)],
+            confidence=confidence
+        )
+    
+    def _retrieve_request(self, query: str, max_results: int) -> Dict[str, Any]:
+        return {
+            'knowledgeBaseId': self.knowledge_base_id,
+            'retrievalQuery': {'text': query},
+            'retrievalConfiguration': {
+                'vectorSearchConfiguration': {
+                    'numberOfResults': max_results
+                }
+            }
+        }
+    
+    def _retrieved_sources(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [
+            {
+                'content': result.get('content', {}).get('text', ''),
+                'location': reference_location(result.get('location', {})),
+                'score': result.get('score', 0)
+            }
+            for result in response.get('retrievalResults', [])
+        ]
+    
+    def _retrieve(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        client = self.local_retriever or self.bedrock_agent_runtime
+        return self._retrieved_sources(client.retrieve(**self._retrieve_request(query, max_results)))
+    
+    def retrieve(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+        """
+        Ranked passages only, no generation
+        Uses the local index when one is configured, otherwise Bedrock retrieve
+        """
+        try:
+            return self._retrieve(query, max_results)
         except Exception as e:
-            print(f"Error querying knowledge base: {str(e)}")
-            return KnowledgeBaseToolOutput(
-                answer=f"I encountered an error while searching the knowledge base: {str(e)}",
-                sources=[],
-                confidence="low"
-            )
+            print(f"Error retrieving from knowledge base: {str(e)}")
+            return []
     
     def to_tool_definition(self) -> Dict:
         """Convert to Bedrock tool definition format"""
@@ -0,0 +1,332 @@
+import os
+import json
+import math
+import time
+import hashlib
+import threading
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from agents.mcp_tools.semantic_cache import tokenize
+
+INDEX_FORMAT = 1
+DEFAULT_PATTERNS = (".txt", ".md")
+
+
+def chunk_document(text: str, chunk_words: int = 80, overlap_words: int = 20) -> List[str]:
+    """
+    Split a document into passages of roughly chunk_words words on line boundaries
+    Consecutive passages share about overlap_words words of trailing lines so a fact
+    that straddles a boundary is still retrievable as one passage
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    chunks = []
+    current: List[str] = []
+    current_words = 0
+
+    for line in lines:
+        words = len(line.split())
+        if current and current_words + words > chunk_words:
+            chunks.append("\n".join(current))
+            # Carry trailing lines forward as overlap
+            carried: List[str] = []
+            carried_words = 0
+            for previous in reversed(current):
+                if carried_words >= overlap_words:
+                    break
+                carried.insert(0, previous)
+                carried_words += len(previous.split())
+            current, current_words = carried, carried_words
+        current.append(line)
+        current_words += words
+
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as handle:
+        return hashlib.sha256(handle.read()).hexdigest()
+
+
+def _write_json(path: str, payload: Any) -> None:
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle)
+    os.replace(temporary, path)
+
+
+def _write_array(path: str, array: np.ndarray) -> None:
+    temporary = f"{path}.tmp.npy"
+    np.save(temporary, array)
+    os.replace(temporary, path)
+
+
+class LocalRetriever:
+    """
+    Offline BM25 retrieval over the knowledge-base-documents folder
+
+    Index layout (index_dir):
+        segments/<doc>.json   chunks and term counts for one document
+        manifest.json         document fingerprints and BM25 stats
+        vocabulary.json       terms, position = term id
+        chunks.json           passage text and source for every chunk id
+        offsets.npy           postings start per term id (len = terms + 1)
+        postings.npy          chunk ids, grouped by term
+        frequencies.npy       term frequency per posting
+        lengths.npy           token count per chunk
+
+    The .npy arrays are opened memory-mapped, so loading is instant and the pages
+    are shared between processes. Rebuilding only re-chunks documents whose content
+    changed; unchanged documents reuse their segment file
+    """
+
+    def __init__(
+        self,
+        documents_dir: str,
+        index_dir: Optional[str] = None,
+        chunk_words: int = 80,
+        overlap_words: int = 20,
+        k1: float = 1.5,
+        b: float = 0.75,
+        check_interval_seconds: float = 5.0
+    ):
+        self.documents_dir = os.path.abspath(documents_dir)
+        self.index_dir = os.path.abspath(index_dir or os.path.join(self.documents_dir, ".kb_index"))
+        self.chunk_words = chunk_words
+        self.overlap_words = overlap_words
+        self.k1 = k1
+        self.b = b
+        self.check_interval_seconds = check_interval_seconds
+
+        self._lock = threading.Lock()
+        self._loaded: Optional[Dict[str, Any]] = None
+        self._last_check = 0.0
+
+    # ---- index build -------------------------------------------------------------------
+
+    def _document_paths(self) -> List[str]:
+        return sorted(
+            os.path.join(self.documents_dir, name)
+            for name in os.listdir(self.documents_dir)
+            if name.endswith(DEFAULT_PATTERNS) and os.path.isfile(os.path.join(self.documents_dir, name))
+        )
+
+    def _fingerprint(self, path: str) -> List[int]:
+        stat = os.stat(path)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        path = os.path.join(self.index_dir, "manifest.json")
+        try:
+            with open(path, encoding="utf-8") as handle:
+                manifest = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+        settings = [INDEX_FORMAT, self.chunk_words, self.overlap_words]
+        return manifest if manifest.get("settings") == settings else {}
+
+    def is_stale(self) -> bool:
+        """True when a document was added, removed or modified since the last build"""
+        documents = self._read_manifest().get("documents")
+        if documents is None:
+            return True
+        paths = self._document_paths()
+        if sorted(documents) != [os.path.basename(path) for path in paths]:
+            return True
+        return any(documents[os.path.basename(path)]["fingerprint"] != self._fingerprint(path) for path in paths)
+
+    def build(self) -> Dict[str, Any]:
+        """Bring the on-disk index up to date; returns build statistics"""
+        start = time.perf_counter()
+        segments_dir = os.path.join(self.index_dir, "segments")
+        os.makedirs(segments_dir, exist_ok=True)
+
+        previous = self._read_manifest().get("documents", {})
+        documents: Dict[str, Any] = {}
+        segments: List[Dict[str, Any]] = []
+        reindexed = 0
+
+        for path in self._document_paths():
+            name = os.path.basename(path)
+            fingerprint = self._fingerprint(path)
+            segment_path = os.path.join(segments_dir, f"{name}.json")
+            entry = previous.get(name)
+
+            segment = None
+            if entry is not None and os.path.exists(segment_path):
+                digest = entry["sha256"] if entry["fingerprint"] == fingerprint else _file_digest(path)
+                if digest == entry["sha256"]:
+                    with open(segment_path, encoding="utf-8") as handle:
+                        segment = json.load(handle)
+
+            if segment is None:
+                with open(path, "rb") as handle:
+                    raw = handle.read()
+                digest = hashlib.sha256(raw).hexdigest()
+                text = raw.decode("utf-8", errors="replace")
+                segment = {
+                    "chunks": [
+                        {"content": content, "terms": dict(Counter(tokenize(content)))}
+                        for content in chunk_document(text, self.chunk_words, self.overlap_words)
+                    ]
+                }
+                _write_json(segment_path, segment)
+                reindexed += 1
+
+            documents[name] = {"fingerprint": fingerprint, "sha256": digest, "chunks": len(segment["chunks"])}
+            segments.append({"name": name, "path": path, "chunks": segment["chunks"]})
+
+        # Segments of deleted documents
+        for name in set(previous) - set(documents):
+            try:
+                os.remove(os.path.join(segments_dir, f"{name}.json"))
+            except OSError:
+                pass
+
+        # Merge per-document term counts into global postings
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        chunks: List[Dict[str, Any]] = []
+        lengths: List[int] = []
+        for segment in segments:
+            for ordinal, chunk in enumerate(segment["chunks"]):
+                chunk_id = len(chunks)
+                chunks.append({"content": chunk["content"], "path": segment["path"], "chunk": ordinal})
+                lengths.append(sum(chunk["terms"].values()))
+                for term, frequency in chunk["terms"].items():
+                    postings.setdefault(term, []).append((chunk_id, frequency))
+
+        vocabulary = sorted(postings)
+        offsets = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        for term_id, term in enumerate(vocabulary):
+            offsets[term_id + 1] = offsets[term_id] + len(postings[term])
+        flat = [posting for term in vocabulary for posting in postings[term]]
+
+        _write_array(os.path.join(self.index_dir, "offsets.npy"), offsets)
+        _write_array(os.path.join(self.index_dir, "postings.npy"), np.array([p[0] for p in flat], dtype=np.int32))
+        _write_array(os.path.join(self.index_dir, "frequencies.npy"), np.array([p[1] for p in flat], dtype=np.float32))
+        _write_array(os.path.join(self.index_dir, "lengths.npy"), np.array(lengths, dtype=np.float32))
+        _write_json(os.path.join(self.index_dir, "chunks.json"), chunks)
+        _write_json(os.path.join(self.index_dir, "vocabulary.json"), vocabulary)
+        # Manifest last: a crash mid-build leaves a stale manifest, which forces a rebuild
+        _write_json(os.path.join(self.index_dir, "manifest.json"), {
+            "settings": [INDEX_FORMAT, self.chunk_words, self.overlap_words],
+            "documents": documents,
+            "average_length": float(np.mean(lengths)) if lengths else 0.0
+        })
+
+        with self._lock:
+            self._loaded = None
+
+        return {
+            "documents": len(documents),
+            "reindexed": reindexed,
+            "chunks": len(chunks),
+            "terms": len(vocabulary),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 2)
+        }
+
+    # ---- query ---------------------------------------------------------------------------
+
+    def _load(self) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            loaded = self._loaded
+            if loaded is not None and now - self._last_check < self.check_interval_seconds:
+                return loaded
+
+        stale = self.is_stale()
+        with self._lock:
+            self._last_check = now
+        if loaded is not None and not stale:
+            return loaded
+        if stale:
+            self.build()
+
+        manifest = self._read_manifest()
+        with open(os.path.join(self.index_dir, "chunks.json"), encoding="utf-8") as handle:
+            chunks = json.load(handle)
+        with open(os.path.join(self.index_dir, "vocabulary.json"), encoding="utf-8") as handle:
+            vocabulary = json.load(handle)
+
+        loaded = {
+            "vocabulary": {term: term_id for term_id, term in enumerate(vocabulary)},
+            "average_length": manifest["average_length"] or 1.0,
+            "chunks": chunks,
+            "offsets": np.load(os.path.join(self.index_dir, "offsets.npy"), mmap_mode="r"),
+            "postings": np.load(os.path.join(self.index_dir, "postings.npy"), mmap_mode="r"),
+            "frequencies": np.load(os.path.join(self.index_dir, "frequencies.npy"), mmap_mode="r"),
+            "lengths": np.load(os.path.join(self.index_dir, "lengths.npy"), mmap_mode="r")
+        }
+        with self._lock:
+            self._loaded = loaded
+        return loaded
+
+    def search(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+        """
+        Top passages by BM25 score, in the same shape as KnowledgeBaseTool sources:
+        [{'content': str, 'location': {'uri': ...}, 'score': float}]
+        """
+        index = self._load()
+        chunk_count = len(index["chunks"])
+        if not chunk_count:
+            return []
+
+        scores = np.zeros(chunk_count, dtype=np.float32)
+        for term in set(tokenize(query)):
+            term_id = index["vocabulary"].get(term)
+            if term_id is None:
+                continue
+            start, end = int(index["offsets"][term_id]), int(index["offsets"][term_id + 1])
+            chunk_ids = index["postings"][start:end]
+            frequencies = index["frequencies"][start:end]
+            document_frequency = end - start
+            idf = math.log(1 + (chunk_count - document_frequency + 0.5) / (document_frequency + 0.5))
+            norms = self.k1 * (1 - self.b + self.b * index["lengths"][chunk_ids] / index["average_length"])
+            scores[chunk_ids] += idf * frequencies * (self.k1 + 1) / (frequencies + norms)
+
+        matched = np.flatnonzero(scores)
+        if not len(matched):
+            return []
+        # Highest score first, chunk order breaks ties
+        top = matched[np.lexsort((matched, -scores[matched]))][:max_results]
+
+        return [
+            {
+                "content": index["chunks"][chunk_id]["content"],
+                "location": {
+                    "uri": "file://" + index["chunks"][chunk_id]["path"],
+                    "chunk": index["chunks"][chunk_id]["chunk"]
+                },
+                "score": round(float(scores[chunk_id]), 4)
+            }
+            for chunk_id in top
+        ]
+
+    def retrieve(
+        self,
+        retrievalQuery: Dict[str, str],
+        knowledgeBaseId: Optional[str] = None,
+        retrievalConfiguration: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Drop-in for bedrock-agent-runtime retrieve(), answered in-process"""
+        max_results = (
+            (retrievalConfiguration or {})
+            .get("vectorSearchConfiguration", {})
+            .get("numberOfResults", 5)
+        )
+        return {
+            "retrievalResults": [
+                {
+                    "content": {"text": source["content"]},
+                    "location": {"type": "LOCAL", "localLocation": source["location"]},
+                    "score": source["score"]
+                }
+                for source in self.search(retrievalQuery["text"], max_results)
+            ]
+        }
@@ -0,0 +1,209 @@
+import re
+import time
+import zlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9+#.]+")
+
+# Question words and fillers that change the phrasing but not the intent
+STOPWORDS = frozenset("""
+a an the and or of for to in on at by with about from as is are was were be been
+do does did i me my we our you your it its this that these those what which who
+how why when where can could should would will shall need needs get tell please
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased content words with a crude plural strip ("skills" -> "skill")"""
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        token = token.strip(".")
+        if not token or token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+class HashingEmbedder:
+    """
+    Local embedder: word unigrams and bigrams hashed into a fixed-size unit vector
+    No model or network call, so it is cheap enough to run on every query
+    """
+
+    def __init__(self, dimensions: int = 1024):
+        self.dimensions = dimensions
+
+    def _bucket(self, feature: str) -> int:
+        return zlib.crc32(feature.encode("utf-8")) % self.dimensions
+
+    def embed(self, text: str) -> np.ndarray:
+        tokens = tokenize(text)
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for token in tokens:
+            vector[self._bucket(token)] += 1.0
+        for first, second in zip(tokens, tokens[1:]):
+            vector[self._bucket(f"{first} {second}")] += 0.5
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class SemanticCacheEntry:
+    """One cached answer with its query embedding and hit statistics"""
+
+    __slots__ = (
+        "query", "max_results", "terms", "vector", "value", "created_at", "hits", "last_hit_at", "last_similarity"
+    )
+
+    def __init__(self, query: str, max_results: int, terms: frozenset, vector: np.ndarray, value: Any):
+        self.query = query
+        self.max_results = max_results
+        self.terms = terms
+        self.vector = vector
+        self.value = value
+        self.created_at = time.time()
+        self.hits = 0
+        self.last_hit_at: Optional[float] = None
+        self.last_similarity: Optional[float] = None
+
+
+class SemanticCache:
+    """
+    Query cache that matches rephrasings rather than exact text
+    A lookup returns the stored value of the most similar earlier query when the
+    cosine similarity reaches the threshold; entries expire after the TTL and the
+    least recently used entry is evicted beyond max_entries
+
+    The hashing embedder is a bag of words, so one differing qualifier
+    ("beginner" vs "expert") still scores above 0.85. With require_same_terms
+    (the default) a hit also needs exactly the same content words, which
+    allows reordering, stopwords and plurals but nothing else.
+    """
+
+    _shared: Dict[str, "SemanticCache"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        embedder=None,
+        similarity_threshold: float = 0.85,
+        max_entries: int = 512,
+        ttl_seconds: float = 6 * 3600,
+        require_same_terms: bool = True
+    ):
+        self.embedder = embedder or HashingEmbedder()
+        self.similarity_threshold = similarity_threshold
+        self.require_same_terms = require_same_terms
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries: "OrderedDict[int, SemanticCacheEntry]" = OrderedDict()
+        self._next_id = 0
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_ids: List[int] = []
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    @classmethod
+    def shared(cls, namespace: str, **kwargs) -> "SemanticCache":
+        """Process-wide cache per namespace (e.g. one per knowledge base)"""
+        with cls._shared_lock:
+            cache = cls._shared.get(namespace)
+            if cache is None:
+                cache = cls._shared[namespace] = cls(**kwargs)
+            return cache
+
+    @classmethod
+    def clear_shared(cls) -> None:
+        with cls._shared_lock:
+            cls._shared.clear()
+
+    def _embeddings(self) -> Tuple[np.ndarray, List[int]]:
+        """Entry vectors stacked into one matrix, rebuilt only after inserts or evictions"""
+        if self._matrix is None:
+            self._matrix_ids = list(self.entries)
+            self._matrix = (
+                np.vstack([self.entries[entry_id].vector for entry_id in self._matrix_ids])
+                if self._matrix_ids else np.zeros((0, 1), dtype=np.float32)
+            )
+        return self._matrix, self._matrix_ids
+
+    def _drop(self, entry_id: int) -> None:
+        del self.entries[entry_id]
+        self._matrix = None
+
+    def get(self, query: str, max_results: int = 5) -> Optional[Any]:
+        """Cached value for the closest earlier query, or None below the threshold"""
+        vector = self.embedder.embed(query)
+        terms = frozenset(tokenize(query))
+        now = time.time()
+
+        with self._lock:
+            expired = [entry_id for entry_id, entry in self.entries.items() if now - entry.created_at > self.ttl_seconds]
+            for entry_id in expired:
+                self._drop(entry_id)
+            self.stats["expired"] += len(expired)
+
+            matrix, ids = self._embeddings()
+            if ids and np.any(vector):
+                similarities = matrix @ vector
+                # Only answers retrieved with the same result budget are interchangeable
+                for position in np.argsort(-similarities):
+                    if similarities[position] < self.similarity_threshold:
+                        break
+                    entry = self.entries[ids[position]]
+                    if entry.max_results != max_results:
+                        continue
+                    if self.require_same_terms and entry.terms != terms:
+                        continue
+                    entry.hits += 1
+                    entry.last_hit_at = now
+                    entry.last_similarity = float(similarities[position])
+                    self.entries.move_to_end(ids[position])
+                    self.stats["hits"] += 1
+                    return entry.value
+
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, query: str, value: Any, max_results: int = 5) -> None:
+        vector = self.embedder.embed(query)
+        if not np.any(vector):
+            return
+
+        with self._lock:
+            self.entries[self._next_id] = SemanticCacheEntry(
+                query, max_results, frozenset(tokenize(query)), vector, value
+            )
+            self._next_id += 1
+            self._matrix = None
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self.entries)
+            return stats
+
+    def get_entry_stats(self) -> List[Dict[str, Any]]:
+        """Per-entry hit counts, most hit first"""
+        now = time.time()
+        with self._lock:
+            entries = sorted(self.entries.values(), key=lambda entry: entry.hits, reverse=True)
+            return [
+                {
+                    "query": entry.query,
+                    "max_results": entry.max_results,
+                    "hits": entry.hits,
+                    "age_seconds": round(now - entry.created_at, 1),
+                    "last_hit_seconds_ago": round(now - entry.last_hit_at, 1) if entry.last_hit_at else None,
+                    "last_similarity": entry.last_similarity
+                }
+                for entry in entries
+            ]
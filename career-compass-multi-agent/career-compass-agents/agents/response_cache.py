@@ -0,0 +1,209 @@
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+
+def make_cache_key(payload: Any, template_version: str) -> str:
+    """
+    Content-addressed key: SHA-256 of the canonical JSON payload plus the prompt version
+    Bumping the template version invalidates every entry built from the old prompt
+    """
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{template_version}\n{canonical}".encode("utf-8")).hexdigest()
+
+
+class InMemoryCacheBackend:
+    """LRU dictionary of key -> (value, created_at) with byte accounting"""
+
+    def __init__(self):
+        self.entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.total_bytes = 0
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, value: str, created_at: float) -> None:
+        self.delete(key)
+        self.entries[key] = (value, created_at)
+        self.total_bytes += len(value.encode("utf-8"))
+
+    def delete(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= len(entry[0].encode("utf-8"))
+
+    def pop_oldest(self) -> Optional[str]:
+        """Evict the least recently used key"""
+        if not self.entries:
+            return None
+        key, (value, _) = self.entries.popitem(last=False)
+        self.total_bytes -= len(value.encode("utf-8"))
+        return key
+
+    def size_bytes(self) -> int:
+        return self.total_bytes
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class SQLiteCacheBackend:
+    """
+    On-disk cache in a local SQLite file, so entries survive restarts and are
+    shared by every process on the machine
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # One transaction so concurrent processes agree on the starting byte total
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            self.connection.execute(
+                """CREATE TABLE IF NOT EXISTS response_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )"""
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS response_cache_lru ON response_cache (last_access)"
+            )
+            # Running byte total kept by triggers, so it stays exact across processes
+            # and size_bytes() is a single-row read instead of a SUM over the table
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache_size (id INTEGER PRIMARY KEY CHECK (id = 0), total INTEGER NOT NULL)"
+            )
+            self.connection.execute(
+                "INSERT OR IGNORE INTO response_cache_size (id, total) "
+                "SELECT 0, COALESCE(SUM(size), 0) FROM response_cache"
+            )
+            self.connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS response_cache_size_insert AFTER INSERT ON response_cache "
+                "BEGIN UPDATE response_cache_size SET total = total + new.size WHERE id = 0; END"
+            )
+            self.connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS response_cache_size_update AFTER UPDATE OF size ON response_cache "
+                "BEGIN UPDATE response_cache_size SET total = total + new.size - old.size WHERE id = 0; END"
+            )
+            self.connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS response_cache_size_delete AFTER DELETE ON response_cache "
+                "BEGIN UPDATE response_cache_size SET total = total - old.size WHERE id = 0; END"
+            )
+            self.connection.execute("COMMIT")
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        row = self.connection.execute(
+            "SELECT value, created_at FROM response_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            self.connection.execute(
+                "UPDATE response_cache SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+        return row
+
+    def put(self, key: str, value: str, created_at: float) -> None:
+        # Upsert rather than INSERT OR REPLACE: REPLACE's implicit delete skips delete triggers
+        self.connection.execute(
+            "INSERT INTO response_cache (key, value, size, created_at, last_access) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+            "created_at = excluded.created_at, last_access = excluded.last_access",
+            (key, value, len(value.encode("utf-8")), created_at, time.time())
+        )
+
+    def delete(self, key: str) -> None:
+        self.connection.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+
+    def pop_oldest(self) -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT key FROM response_cache ORDER BY last_access LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        self.delete(row[0])
+        return row[0]
+
+    def size_bytes(self) -> int:
+        return self.connection.execute("SELECT total FROM response_cache_size WHERE id = 0").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+
+
+class ResponseCache:
+    """
+    LRU + TTL cache for model responses with a byte budget
+    The backend is pluggable: in-memory by default, or SQLiteCacheBackend on local disk
+    """
+
+    _shared: Optional["ResponseCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        backend=None,
+        ttl_seconds: float = 24 * 3600,
+        max_bytes: int = 50 * 1024 * 1024
+    ):
+        self.backend = backend if backend is not None else InMemoryCacheBackend()
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+
+    @classmethod
+    def shared(cls) -> "ResponseCache":
+        """Process-wide in-memory cache used when an agent is not given one"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self.backend.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            value, created_at = entry
+            if time.time() - created_at > self.ttl_seconds:
+                self.backend.delete(key)
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+
+            self.stats["hits"] += 1
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        # Values larger than the whole budget are not worth evicting everything for
+        if len(value.encode("utf-8")) > self.max_bytes:
+            return
+
+        with self._lock:
+            self.backend.put(key, value, time.time())
+            while self.backend.size_bytes() > self.max_bytes:
+                if self.backend.pop_oldest() is None:
+                    break
+                self.stats["evictions"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self.backend)
+            stats["size_bytes"] = self.backend.size_bytes()
+            return stats
@@ -1,7 +1,93 @@
 import os
-from typing import Dict, Any, Optional
-from strands import Agent
-from strands.models import BedrockModel
+import re
+import time
+from typing import Dict, Any, List, Optional
+from pydantic import BaseModel, Field
+
+from agents.agent_template import AgentTemplate
+from agents.aws_clients import get_bedrock_model
+from agents.job_index import normalize_skill
+from agents.response_cache import ResponseCache, make_cache_key
+from agents.resume_parser import JUDGMENT_SECTIONS, ResumeFeatures, ResumeParser
+
+# Bump whenever the analysis prompt or ResumeAnalysis schema changes so cached results are not reused
+ANALYSIS_PROMPT_VERSION = "resume-analysis-v2"
+JOB_FIT_PROMPT_VERSION = "job-fit-v1"
+
+class SectionAnalysis(BaseModel):
+    """Feedback on one resume section"""
+    name: str = Field(description="Section name, e.g. Technical Skills, Projects, Experience, Education, Formatting")
+    assessment: str = Field(description="2-3 sentence assessment of the section")
+    suggestions: List[str] = Field(default_factory=list, description="Specific improvements for the section")
+
+
+class ResumeAnalysis(BaseModel):
+    """Structured result of one resume analysis; every public method is a projection of it"""
+    score: float = Field(description="Overall resume score from 0 to 10")
+    summary: str = Field(description="2-3 sentence overall assessment")
+    skills: List[str] = Field(default_factory=list, description="Technical skills listed or demonstrated in the resume")
+    strengths: List[str] = Field(default_factory=list, description="Top strengths")
+    gaps: List[str] = Field(default_factory=list, description="Top areas for improvement")
+    sections: List[SectionAnalysis] = Field(default_factory=list)
+    ats_keywords: List[str] = Field(default_factory=list, description="Keywords to add for Applicant Tracking Systems")
+    recommendations: List[str] = Field(default_factory=list, description="Top 5 actionable recommendations")
+
+    def to_markdown(self) -> str:
+        """Full report in the layout analyze_resume has always returned"""
+        lines = [f"**Overall Score:** {self.score:g}/10", "", "### Overall Assessment", self.summary]
+        if self.strengths:
+            lines += ["", "**Strengths**"] + [f"- {item}" for item in self.strengths]
+        if self.gaps:
+            lines += ["", "**Areas for Improvement**"] + [f"- {item}" for item in self.gaps]
+        for section in self.sections:
+            lines += ["", f"### {section.name}", section.assessment]
+            lines += [f"- {item}" for item in section.suggestions]
+        if self.ats_keywords:
+            lines += ["", "### ATS Optimization Suggestions", ", ".join(self.ats_keywords)]
+        if self.recommendations:
+            lines += ["", "### Top Actionable Recommendations"]
+            lines += [f"{number}. {item}" for number, item in enumerate(self.recommendations, 1)]
+        return "\n".join(lines)
+
+
+class JobFit(BaseModel):
+    """Model judgment of one shortlisted posting"""
+    job_id: str
+    fit_score: float = Field(description="Fit of the resume for this job from 0 to 10")
+    rationale: str = Field(description="1-2 sentences on why it fits or does not")
+    next_step: str = Field(default="", description="Most useful thing to do before applying")
+
+
+class JobFitReport(BaseModel):
+    """Batched rerank of every shortlisted posting in one generation"""
+    rankings: List[JobFit] = Field(default_factory=list)
+
+
+_YEARS_REQUIRED = re.compile(r"\b(\d+\s*(?:\+|-\s*\d+)?)\s*(?:years?|yrs?)\b", re.IGNORECASE)
+_SENIORITY = re.compile(
+    r"\b(intern(?:ship)?|entry[- ]level|fresher|junior|mid[- ]level|senior|lead|principal|staff)\b",
+    re.IGNORECASE
+)
+
+
+def job_requirements(job_description: str) -> List[str]:
+    """Seniority and years-of-experience requirements stated in a job description"""
+    requirements = []
+    for match in _SENIORITY.finditer(job_description):
+        level = match.group(1).lower().replace("-", " ")
+        if level not in requirements:
+            requirements.append(level)
+    for match in _YEARS_REQUIRED.finditer(job_description):
+        years = f"{' '.join(match.group(1).split())} years of experience"
+        if years not in requirements:
+            requirements.append(years)
+    return requirements
+
+
+def normalize_resume(resume_text: str) -> str:
+    """Whitespace-folded resume text, so a re-pasted resume hashes to the same key"""
+    return "\n".join(" ".join(line.split()) for line in resume_text.strip().splitlines() if line.strip())
+
 
 class ResumeAnalyzerAgent:
     """
@@ -9,11 +95,21 @@ class ResumeAnalyzerAgent:
     Analyzes student resumes and provides improvement suggestions
     """
     
-    def __init__(self, region: str = "us-west-2"):
+    def __init__(
+        self,
+        region: str = "us-west-2",
+        response_cache: Optional[ResponseCache] = None,
+        resume_parser: Optional[ResumeParser] = None
+    ):
         self.region = region
+        # Structured analyses keyed by resume content hash, shared with the other agents
+        self.response_cache = response_cache if response_cache is not None else ResponseCache.shared()
+        # Local pre-processing: skills, contact, dates, structure and ATS keywords need no model
+        self.resume_parser = resume_parser or ResumeParser.default()
         
-        # Initialize Bedrock Model with Nova Pro - pass parameters directly
-        self.model = BedrockModel(
+        # Nova Pro model from the shared registry (pooled client, reused across agents)
+        self.model = get_bedrock_model(
+            region,
             model_id="us.amazon.nova-pro-v1:0",
             temperature=0.7,
             max_tokens=3000,
@@ -35,12 +131,89 @@ When analyzing a resume, provide:
 
 Be constructive, encouraging, and specific. Provide concrete examples of improvements."""
         
-        # Create Strands agent
-        self.agent = Agent(
+        # Each call runs on a fresh Strands agent so prompts never pile up in history
+        self.agent = AgentTemplate(
             model=self.model,
             system_prompt=self.system_prompt
         )
     
+    def analyze_structured(self, resume_text: str) -> ResumeAnalysis:
+        """
+        One structured-output generation per distinct resume, cached by content hash
+        Raises if the model call fails; the public methods turn that into an error dict
+        """
+        analysis, _ = self._get_analysis(resume_text)
+        return analysis
+    
+    def analyze_structured_cached(self, resume_text: str):
+        """(ResumeAnalysis, cached): analyze_structured plus whether the analysis cache answered without a model call"""
+        return self._get_analysis(resume_text)
+    
+    def extract_features(self, resume_text: str) -> ResumeFeatures:
+        """Deterministic local features (no model call)"""
+        return self.resume_parser.parse(resume_text)
+    
+    def build_analysis_prompt(self, resume_text: str, features: ResumeFeatures) -> str:
+        """
+        Compact extracted features plus only the sections that need judgment
+        Falls back to the full resume when no standard sections were found
+        """
+        judged = [
+            f"[{section.upper()}]\n{features.sections[section]}"
+            for section in JUDGMENT_SECTIONS if section in features.sections
+        ]
+        resume_content = "\n\n".join(judged) if judged else normalize_resume(resume_text)
+        
+        return f"""Analyze this resume. Facts below were extracted locally; rely on them.
+
+FEATURES:
+{features.to_prompt()}
+
+SECTIONS:
+{resume_content}
+
+Fill in: score (out of 10), summary (2-3 sentences), top 3 strengths, top 3 gaps,
+sections (Technical Skills, Projects, Experience, Education & Certifications) and
+top 5 recommendations. Leave skills and ats_keywords empty. Be specific."""
+    
+    def _get_analysis(self, resume_text: str):
+        """(ResumeAnalysis, cached)"""
+        resume = normalize_resume(resume_text)
+        cache_key = make_cache_key(
+            {"resume": resume, "parser": self.resume_parser.fingerprint},
+            ANALYSIS_PROMPT_VERSION
+        )
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return ResumeAnalysis.model_validate_json(cached), True
+        
+        features = self.extract_features(resume)
+        result = self.agent(self.build_analysis_prompt(resume, features), structured_output_model=ResumeAnalysis)
+        analysis = self._merge_features(result.structured_output, features)
+        self.response_cache.put(cache_key, analysis.model_dump_json())
+        return analysis, False
+    
+    @staticmethod
+    def _merge_features(analysis: ResumeAnalysis, features: ResumeFeatures) -> ResumeAnalysis:
+        """Locally computed skills, ATS keywords and structure replace the model's versions"""
+        if features.skills:
+            analysis.skills = list(features.skills)
+        analysis.ats_keywords = list(features.ats_keywords)
+        analysis.sections = [
+            section for section in analysis.sections
+            if section.name.lower() not in ("formatting & structure", "formatting", "structure")
+        ]
+        analysis.sections.append(SectionAnalysis(
+            name="Formatting & Structure",
+            assessment=(
+                f"{features.word_count} words, {features.bullet_count} bullet points "
+                f"({features.quantified_bullets} quantified), sections found: "
+                f"{', '.join(section.title() for section in features.sections if section != 'header') or 'none'}."
+            ),
+            suggestions=list(features.structural_issues)
+        ))
+        return analysis
+    
     def analyze_resume(self, resume_text: str) -> Dict[str, Any]:
         """
         Analyze a resume and provide detailed feedback
@@ -51,33 +224,16 @@ Be constructive, encouraging, and specific. Provide concrete examples of improve
         Returns:
             Dictionary with analysis results
         """
-        
-        analysis_prompt = f"""Please analyze the following resume and provide comprehensive feedback:
-
-RESUME:
-{resume_text}
-
-Provide your analysis in the following structure:
-1. Overall Assessment (2-3 sentences)
-2. Technical Skills Analysis
-3. Project Analysis
-4. Experience Analysis
-5. Education & Certifications
-6. Formatting & Structure
-7. ATS Optimization Suggestions
-8. Top 5 Actionable Recommendations
-
-Be specific and provide examples where possible."""
-        
         try:
-            # Invoke the Strands agent - returns a string directly
-            response = self.agent(analysis_prompt)
+            analysis, cached = self._get_analysis(resume_text)
             
             return {
                 "status": "success",
-                "analysis": str(response),
+                "analysis": analysis.to_markdown(),
+                "structured": analysis.model_dump(),
                 "resume_length": len(resume_text),
-                "agent_name": "ResumeAnalyzerAgent"
+                "agent_name": "ResumeAnalyzerAgent",
+                "cached": cached
             }
             
         except Exception as e:
@@ -91,6 +247,7 @@ Be specific and provide examples where possible."""
     def quick_score(self, resume_text: str) -> Dict[str, Any]:
         """
         Provide a quick score and summary of the resume
+        Reuses the cached structured analysis, so no extra model call after analyze_resume
         
         Args:
             resume_text: The full text content of the resume
@@ -98,25 +255,19 @@ Be specific and provide examples where possible."""
         Returns:
             Dictionary with score and brief feedback
         """
-        
-        scoring_prompt = f"""Analyze this resume and provide:
-1. Overall Score (out of 10)
-2. Brief 2-3 sentence summary
-3. Top 3 strengths
-4. Top 3 areas for improvement
-
-RESUME:
-{resume_text}
-
-Format your response clearly with these sections."""
-        
         try:
-            response = self.agent(scoring_prompt)
+            analysis, cached = self._get_analysis(resume_text)
+            
+            lines = [f"**Overall Score:** {analysis.score:g}/10", "", analysis.summary]
+            lines += ["", "**Top Strengths**"] + [f"- {item}" for item in analysis.strengths[:3]]
+            lines += ["", "**Top Areas for Improvement**"] + [f"- {item}" for item in analysis.gaps[:3]]
             
             return {
                 "status": "success",
-                "score_analysis": str(response),
-                "agent_name": "ResumeAnalyzerAgent"
+                "score": analysis.score,
+                "score_analysis": "\n".join(lines),
+                "agent_name": "ResumeAnalyzerAgent",
+                "cached": cached
             }
             
         except Exception as e:
@@ -129,42 +280,196 @@ Format your response clearly with these sections."""
     def compare_with_job(self, resume_text: str, job_description: str) -> Dict[str, Any]:
         """
         Compare resume against a specific job description
+        Vocabulary skills named in the job description are matched locally; experience
+        alignment and recommendations come from the cached analysis. If that analysis
+        fails, the local skill match is still returned with status "partial_success"
         
         Args:
             resume_text: The full text content of the resume
             job_description: The job description to compare against
             
         Returns:
-            Dictionary with comparison results
+            Dictionary with comparison results; match_score is None when the job
+            description names no skills the parser knows
         """
+        try:
+            analysis, cached = self._get_analysis(resume_text)
+            analysis_error = None
+        except Exception as e:
+            print(f"Error in compare_with_job: {str(e)}")
+            analysis, cached, analysis_error = None, False, str(e)
         
-        comparison_prompt = f"""Compare this resume against the job description and provide:
-1. Match Score (out of 10)
-2. Matching Skills
-3. Missing Skills
-4. Relevant Experience Alignment
-5. Recommendations to improve match
-
-RESUME:
-{resume_text}
-
-JOB DESCRIPTION:
-{job_description}
-
-Provide specific, actionable feedback."""
+        resume_skills = {
+            normalize_skill(skill)
+            for skill in self.resume_parser.extract_skills(resume_text) + (analysis.skills if analysis else [])
+        }
+        matching_skills = []
+        missing_skills = []
+        # Only skills the parser's vocabulary knows, so prose like "Location: Seattle" is ignored
+        for skill in self.resume_parser.extract_skills(job_description):
+            (matching_skills if normalize_skill(skill) in resume_skills else missing_skills).append(skill)
         
-        try:
-            response = self.agent(comparison_prompt)
-            
-            return {
-                "status": "success",
-                "comparison": str(response),
-                "agent_name": "ResumeAnalyzerAgent"
-            }
+        total = len(matching_skills) + len(missing_skills)
+        match_score = round(10 * len(matching_skills) / total, 1) if total else None
+        
+        if match_score is None:
+            lines = [
+                "**Match Score:** not scored - the job description names no technical skills "
+                "this tool recognizes, so fit depends on the experience and soft skills below"
+            ]
+        else:
+            lines = [f"**Match Score:** {match_score:g}/10 ({len(matching_skills)} of {total} named skills)"]
+            lines += ["", "**Matching Skills:** " + (", ".join(matching_skills) or "None found")]
+            lines += ["", "**Missing Skills:** " + (", ".join(missing_skills) or "None")]
+        
+        lines += ["", "**Experience Alignment**"]
+        requirements = job_requirements(job_description)
+        if requirements:
+            lines.append("- The posting asks for: " + ", ".join(requirements))
+        if analysis is not None:
+            experience = [section for section in analysis.sections if section.name.lower().startswith("experience")]
+            lines += [f"- Your experience: {section.assessment}" for section in experience]
+            lines += [f"- Strength to highlight: {item}" for item in analysis.strengths[:2]]
+        else:
+            lines.append(f"- Not available: resume analysis failed ({analysis_error})")
+        
+        recommendations = [f"Add evidence of {skill} (a project, course or certification)" for skill in missing_skills[:5]]
+        if analysis is not None:
+            recommendations += analysis.recommendations[:3]
+        if recommendations:
+            lines += ["", "**Recommendations**"] + [f"- {item}" for item in recommendations]
+        
+        result = {
+            "status": "success" if analysis is not None else "partial_success",
+            "match_score": match_score,
+            "matching_skills": matching_skills,
+            "missing_skills": missing_skills,
+            "job_requirements": requirements,
+            "comparison": "\n".join(lines),
+            "agent_name": "ResumeAnalyzerAgent",
+            "cached": cached
+        }
+        if analysis_error is not None:
+            result["error"] = analysis_error
+        return result
+    
+    def compare_with_jobs(self, resume_text: str, shortlister, top_k: int = 5) -> Dict[str, Any]:
+        """
+        Rank a whole job catalog against one resume with a single model call
+        Stage one shortlists top_k postings locally (JobShortlister); stage two
+        reranks the shortlist in one batched structured-output prompt. If the model
+        call fails, the local ranking is returned with llm_reranked False
+        
+        Args:
+            resume_text: The full text content of the resume
+            shortlister: JobShortlister built over the catalog
+            top_k: How many postings reach the model
             
+        Returns:
+            Dictionary with the ranked resume-to-jobs report
+        """
+        started = time.perf_counter()
+        features = self.extract_features(resume_text)
+        shortlist = shortlister.shortlist(resume_text, features.skills, top_k=top_k)
+        shortlist_ms = (time.perf_counter() - started) * 1000
+        resume_skills = {skill.lower() for skill in features.skills}
+        
+        rankings = []
+        for position, candidate in enumerate(shortlist, 1):
+            job = candidate['job']
+            required = list(job.get('required_skills', []) or [])
+            preferred = list(job.get('preferred_skills', []) or [])
+            rankings.append({
+                "job_id": str(job.get('job_id')),
+                "title": job.get('title'),
+                "company": job.get('company'),
+                "shortlist_rank": position,
+                "shortlist_score": candidate['score'],
+                "matching_skills": [skill for skill in required + preferred if skill.lower() in resume_skills],
+                "missing_skills": [skill for skill in required if skill.lower() not in resume_skills],
+                "fit_score": None,
+                "rationale": None,
+                "next_step": None
+            })
+        
+        report = {
+            "status": "success",
+            "llm_reranked": False,
+            "cached": False,
+            "rankings": rankings,
+            "shortlist_ms": round(shortlist_ms, 2),
+            "jobs_considered": len(shortlister.jobs),
+            "agent_name": "ResumeAnalyzerAgent"
+        }
+        if not rankings:
+            report["elapsed_ms"] = round(shortlist_ms, 2)
+            return report
+        
+        try:
+            fits, cached = self._get_job_fits(resume_text, features, shortlist)
+            for ranking in rankings:
+                fit = fits.get(ranking['job_id'])
+                if fit is not None:
+                    ranking.update(fit_score=fit.fit_score, rationale=fit.rationale, next_step=fit.next_step)
+            # Model score first; postings it skipped keep their shortlist order after the scored ones
+            rankings.sort(key=lambda item: (item['fit_score'] is None, -(item['fit_score'] or 0), item['shortlist_rank']))
+            report.update(llm_reranked=True, cached=cached)
         except Exception as e:
-            print(f"Error in compare_with_job: {str(e)}")
-            return {
-                "status": "error",
-                "error": str(e)
-            }
\ No newline at end of file
+            print(f"Error in compare_with_jobs: {str(e)}")
+            report["error"] = str(e)
+        
+        report["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return report
+    
+    def _get_job_fits(self, resume_text: str, features: ResumeFeatures, shortlist: List[Dict[str, Any]]):
+        """(job_id -> JobFit, cached) for the shortlist, from one cached batched generation"""
+        resume = normalize_resume(resume_text)
+        jobs = [candidate['job'] for candidate in shortlist]
+        cache_key = make_cache_key(
+            {"resume": resume, "jobs": jobs, "parser": self.resume_parser.fingerprint},
+            JOB_FIT_PROMPT_VERSION
+        )
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            report = JobFitReport.model_validate_json(cached)
+        else:
+            result = self.agent(self.build_job_fit_prompt(resume, features, jobs), structured_output_model=JobFitReport)
+            report = result.structured_output
+            self.response_cache.put(cache_key, report.model_dump_json())
+        return {fit.job_id: fit for fit in report.rankings}, cached is not None
+    
+    def build_job_fit_prompt(self, resume_text: str, features: ResumeFeatures, jobs: List[Dict[str, Any]]) -> str:
+        """Resume features and judgment sections once, then a compact card per shortlisted job"""
+        judged = [
+            f"[{section.upper()}]\n{features.sections[section]}"
+            for section in JUDGMENT_SECTIONS if section in features.sections
+        ]
+        resume_content = "\n\n".join(judged) if judged else resume_text
+        cards = []
+        for job in jobs:
+            description = str(job.get('description', ''))
+            cards.append(
+                f"- job_id {job.get('job_id')}: {job.get('title')} at {job.get('company')} "
+                f"({job.get('experience_level', 'n/a')})\n"
+                f"  required: {', '.join(job.get('required_skills', []) or [])}\n"
+                f"  preferred: {', '.join(job.get('preferred_skills', []) or [])}\n"
+                f"  about: {description[:400]}"
+            )
+        
+        return f"""Rank how well this resume fits each job below.
+
+RESUME FEATURES:
+{features.to_prompt()}
+
+RESUME SECTIONS:
+{resume_content}
+
+JOBS:
+{chr(10).join(cards)}
+
+Return one ranking per job_id: fit_score (out of 10), a 1-2 sentence rationale and
+the most useful next step before applying. Judge real fit, not keyword overlap alone."""
+    
+    def get_response_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size of the structured analysis cache"""
+        return self.response_cache.get_stats()
@@ -0,0 +1,269 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Tuple
+
+from agents.resume_analyzer_agent import normalize_resume
+
+RESUME_EXTENSIONS = (".txt", ".md")
+
+
+def resume_content_hash(resume_text: str) -> str:
+    """SHA-256 of the whitespace-normalized resume, the dedup and checkpoint key"""
+    return hashlib.sha256(normalize_resume(resume_text).encode("utf-8")).hexdigest()
+
+
+def iter_resumes(source: str) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Stream (resume_id, text) from a directory of .txt/.md files (id = relative path)
+    or a JSONL file of {"id", "text"} rows ("resume_id"/"resume_text" also accepted)
+    A row that is not a JSON object yields ("line-N", None) so the caller can record it
+    """
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(RESUME_EXTENSIONS):
+                    path = os.path.join(root, name)
+                    with open(path, encoding="utf-8", errors="replace") as handle:
+                        yield os.path.relpath(path, source), handle.read()
+        return
+
+    with open(source, encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                print(f"Skipping malformed row on line {line_number}: {str(e)}")
+                yield f"line-{line_number}", None
+                continue
+            if not isinstance(row, dict):
+                print(f"Skipping malformed row on line {line_number}: not a JSON object")
+                yield f"line-{line_number}", None
+                continue
+            text = row.get("text") or row.get("resume_text") or ""
+            yield str(row.get("id") or row.get("resume_id") or f"line-{line_number}"), text
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, bursts up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if capacity is not None and capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until `tokens` are available; returns the seconds spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                shortfall = (tokens - self.tokens) / self.rate
+            time.sleep(shortfall)
+            waited += shortfall
+
+
+def load_checkpoint(output_path: str) -> Tuple[set, Dict[str, Dict[str, Any]]]:
+    """
+    Completed resume ids and content hash -> successful record from an earlier run
+    The output JSONL is the checkpoint; a torn last line from a crash is ignored
+    """
+    done_ids = set()
+    by_hash: Dict[str, Dict[str, Any]] = {}
+    if not os.path.exists(output_path):
+        return done_ids, by_hash
+    with open(output_path, encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("status") == "success":
+                done_ids.add(record["resume_id"])
+                by_hash.setdefault(record["content_hash"], record)
+    return done_ids, by_hash
+
+
+class BulkResumeScorer:
+    """
+    Overnight batch scoring for a placement office
+    Resumes are read as a stream, deduplicated by content hash, and scored with at
+    most `max_concurrency` model calls in flight and at most `requests_per_second`
+    calls started. Every result is appended to the output JSONL as soon as it is
+    ready, and re-running with the same output skips what already succeeded
+    """
+
+    def __init__(
+        self,
+        analyzer,
+        output_path: str,
+        max_concurrency: int = 4,
+        requests_per_second: float = 1.0,
+        burst: Optional[float] = None,
+        max_retries: int = 2,
+        retry_backoff_seconds: float = 2.0
+    ):
+        """
+        analyzer: anything with analyze_structured(resume_text) -> ResumeAnalysis (e.g. ResumeAnalyzerAgent)
+        requests_per_second must be positive; TokenBucket raises ValueError otherwise
+        """
+        self.analyzer = analyzer
+        self.output_path = output_path
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = TokenBucket(requests_per_second, burst)
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._write_lock = threading.Lock()
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        self.stats = {"read": 0, "scored": 0, "duplicates": 0, "skipped": 0, "failed": 0, "model_calls": 0, "analysis_cache_hits": 0, "rate_limited_seconds": 0.0}
+
+    def _write(self, handle, record: Dict[str, Any]) -> None:
+        with self._write_lock:
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+            handle.flush()
+
+    def _analyze(self, resume_text: str):
+        """(ResumeAnalysis, cached); analyzers without analyze_structured_cached always count as a model call"""
+        analyze_cached = getattr(self.analyzer, "analyze_structured_cached", None)
+        if analyze_cached is not None:
+            return analyze_cached(resume_text)
+        return self.analyzer.analyze_structured(resume_text), False
+
+    def _score(self, resume_id: str, content_hash: str, resume_text: str) -> Dict[str, Any]:
+        """One resume, with retries; never raises"""
+        started = time.monotonic()
+        error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.retry_backoff_seconds * (2 ** (attempt - 1)))
+            waited = self.rate_limiter.acquire()
+            with self._write_lock:
+                self.stats["rate_limited_seconds"] += waited
+            cached = False
+            try:
+                analysis, cached = self._analyze(resume_text)
+                return {
+                    "resume_id": resume_id,
+                    "content_hash": content_hash,
+                    "status": "success",
+                    "score": analysis.score,
+                    "summary": analysis.summary,
+                    "strengths": analysis.strengths[:3],
+                    "gaps": analysis.gaps[:3],
+                    "skills": analysis.skills,
+                    "attempts": attempt + 1,
+                    "elapsed_ms": round((time.monotonic() - started) * 1000, 1)
+                }
+            except Exception as e:
+                error = str(e)
+                print(f"Error scoring {resume_id} (attempt {attempt + 1}): {error}")
+            finally:
+                # Answers from the analyzer's own cache never reached the model
+                with self._write_lock:
+                    self.stats["analysis_cache_hits" if cached else "model_calls"] += 1
+        return {
+            "resume_id": resume_id,
+            "content_hash": content_hash,
+            "status": "error",
+            "error": error,
+            "attempts": self.max_retries + 1,
+            "elapsed_ms": round((time.monotonic() - started) * 1000, 1)
+        }
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.output_path, "rb") as handle:
+            handle.seek(-1, os.SEEK_END)
+            return handle.read(1) == b"\n"
+
+    @staticmethod
+    def _duplicate(record: Dict[str, Any], resume_id: str) -> Dict[str, Any]:
+        return dict(record, resume_id=resume_id, duplicate_of=record["resume_id"], attempts=0, elapsed_ms=0.0)
+
+    def run(self, resumes: Iterable[Tuple[str, Optional[str]]]) -> Dict[str, Any]:
+        """Score every (resume_id, text); returns this run's statistics"""
+        self._reset_stats()
+        start = time.perf_counter()
+        done_ids, done_by_hash = load_checkpoint(self.output_path)
+        # content hash -> resume ids waiting on the in-flight primary
+        waiting: Dict[str, List[str]] = {}
+        in_flight = {}
+
+        with open(self.output_path, "a", encoding="utf-8") as handle, \
+                ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="resume-batch") as executor:
+            if handle.tell() and not self._ends_with_newline():
+                handle.write("\n")  # terminate a line torn by a crash before appending
+
+            def finish(future) -> None:
+                content_hash = in_flight.pop(future)
+                record = future.result()
+                self._write(handle, record)
+                duplicate_ids = waiting.pop(content_hash, [])
+                if record["status"] == "success":
+                    self.stats["scored"] += 1
+                    done_by_hash[content_hash] = record
+                else:
+                    # Failed records are not checkpointed, so a re-run retries them
+                    self.stats["failed"] += 1
+                for duplicate_id in duplicate_ids:
+                    self._write(handle, self._duplicate(record, duplicate_id))
+
+            for resume_id, resume_text in resumes:
+                self.stats["read"] += 1
+                if resume_id in done_ids:
+                    self.stats["skipped"] += 1
+                    continue
+                if resume_text is None:
+                    self.stats["failed"] += 1
+                    self._write(handle, {"resume_id": resume_id, "content_hash": None, "status": "error", "error": "malformed input row"})
+                    continue
+                if not resume_text.strip():
+                    self.stats["failed"] += 1
+                    self._write(handle, {"resume_id": resume_id, "content_hash": None, "status": "error", "error": "empty resume"})
+                    continue
+
+                content_hash = resume_content_hash(resume_text)
+                if content_hash in done_by_hash:
+                    self.stats["duplicates"] += 1
+                    self._write(handle, self._duplicate(done_by_hash[content_hash], resume_id))
+                    continue
+                if content_hash in waiting:
+                    self.stats["duplicates"] += 1
+                    waiting[content_hash].append(resume_id)
+                    continue
+
+                # Bounded read-ahead: hold at most 2x concurrency resumes in memory
+                while len(in_flight) >= self.max_concurrency * 2:
+                    completed, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        finish(future)
+                waiting[content_hash] = []
+                in_flight[executor.submit(self._score, resume_id, content_hash, resume_text)] = content_hash
+
+            while in_flight:
+                completed, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in completed:
+                    finish(future)
+
+        stats = dict(self.stats)
+        stats["elapsed_seconds"] = round(time.perf_counter() - start, 3)
+        stats["rate_limited_seconds"] = round(stats["rate_limited_seconds"], 3)
+        return stats
@@ -0,0 +1,274 @@
+import re
+import hashlib
+import threading
+from typing import Dict, List, Optional, Iterable
+from pydantic import BaseModel, Field
+
+from agents.job_index import JobIndex, normalize_skill
+
+# Skills listed by the seeded job catalog (populate_jobs_dynamodb.py) plus common
+# neighbours; used when no live catalog vocabulary is supplied
+DEFAULT_SKILL_VOCABULARY = (
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Golang", "Rust", "Kotlin", "Swift",
+    "SQL", "MySQL", "PostgreSQL", "MongoDB", "Redis", "DynamoDB", "Kafka", "GraphQL", "REST APIs",
+    "HTML", "CSS", "React", "Redux", "Angular", "Vue", "Node.js", "Express.js", "Django", "Flask",
+    "Spring Boot", "Webpack", "Microservices", "AWS", "AWS SageMaker", "Azure", "GCP", "Docker",
+    "Kubernetes", "Terraform", "Ansible", "Jenkins", "CI/CD", "Git", "Linux", "Networking",
+    "Machine Learning", "Deep Learning", "MLOps", "TensorFlow", "PyTorch", "Pandas", "NumPy",
+    "Scikit-learn", "Statistics", "Tableau", "Power BI", "Network Security", "Ethical Hacking",
+    "Incident Response", "SIEM", "Security Tools", "Agile"
+)
+
+# Skill groups that tend to appear in the same job posting; stand-in for the catalog's
+# postings when suggesting ATS keywords without a loaded JobIndex
+DEFAULT_SKILL_SETS = (
+    ("AWS", "Python", "Docker", "Kubernetes", "Terraform", "CI/CD", "Linux", "Networking"),
+    ("React", "Node.js", "JavaScript", "MongoDB", "REST APIs", "TypeScript", "GraphQL", "AWS"),
+    ("HTML", "CSS", "JavaScript", "React", "Redux", "TypeScript", "Webpack"),
+    ("Python", "Machine Learning", "Pandas", "Scikit-learn", "SQL", "TensorFlow", "PyTorch", "Statistics"),
+    ("Python", "TensorFlow", "PyTorch", "Machine Learning", "Deep Learning", "MLOps", "AWS SageMaker", "Docker"),
+    ("Docker", "Kubernetes", "Jenkins", "Git", "Linux", "AWS", "Terraform", "Ansible", "Python"),
+    ("Java", "Spring Boot", "SQL", "Microservices", "REST APIs", "Kafka", "Redis", "Docker"),
+    ("Network Security", "Linux", "SIEM", "Incident Response", "Ethical Hacking", "Security Tools", "Python"),
+    ("SQL", "Python", "Pandas", "Statistics", "Tableau", "Power BI"),
+)
+
+# Canonical section -> headings that introduce it
+SECTION_HEADINGS = {
+    "summary": ("summary", "professional summary", "objective", "career objective", "profile", "about me"),
+    "education": ("education", "academic background", "academics", "education & certifications"),
+    "skills": ("skills", "technical skills", "core competencies", "technologies", "tech stack"),
+    "experience": ("experience", "work experience", "internship", "internships", "internship experience",
+                   "professional experience", "employment"),
+    "projects": ("projects", "academic projects", "personal projects", "key projects"),
+    "certifications": ("certifications", "certificates", "licenses & certifications", "courses"),
+    "achievements": ("achievements", "awards", "honors", "accomplishments", "activities", "leadership",
+                     "extracurricular activities", "publications"),
+}
+EXPECTED_SECTIONS = ("education", "skills", "experience", "projects")
+# Sections whose content needs judgment; the rest is summarized by extracted features
+JUDGMENT_SECTIONS = ("summary", "experience", "projects", "achievements")
+
+_HEADING_LOOKUP = {alias: section for section, aliases in SECTION_HEADINGS.items() for alias in aliases}
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+_URL = re.compile(r"(?:https?://)?(?:www\.)?(?:linkedin\.com|github\.com|gitlab\.com|[\w-]+\.(?:dev|io|me))/?[\w\-./?=#%]*", re.I)
+_PHONE = re.compile(r"\+?\d[\d\s().-]{8,}\d")
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s+\d{{4}}|{_MONTH}|\d{{1,2}}/\d{{4}}|\d{{4}})"
+_DATE_RANGE = re.compile(rf"\b({_DATE})\s*(?:-|–|—|to)\s*({_DATE}|present|current|now)\b", re.I)
+_YEAR = re.compile(r"\b(?:19|20)\d{2}\b")
+_DEGREE = re.compile(
+    r"\b(bachelor|master|ph\.?d|doctorate|diploma|associate|b\.?\s?tech|m\.?\s?tech|b\.?e\.?|m\.?e\.?|"
+    r"b\.?sc?\.?|m\.?sc?\.?|b\.?a\.?|m\.?b\.?a|bca|mca)\b[^\n|]*", re.I
+)
+_GPA = re.compile(r"\b(?:c?gpa|grade point average)\s*[:\-]?\s*(\d+(?:\.\d+)?)\s*(?:/\s*(\d+(?:\.\d+)?))?", re.I)
+_BULLET = re.compile(r"^\s*(?:[-•*▪●◦]|\d+[.)])\s+")
+_METRIC = re.compile(r"\d+(?:\.\d+)?\s*(?:%|x\b|\+|k\b|users|ms\b|hours|requests)|\$\s?\d", re.I)
+
+
+class ResumeFeatures(BaseModel):
+    """Deterministic facts extracted from a resume before any model call"""
+    sections: Dict[str, str] = Field(default_factory=dict)
+    skills: List[str] = Field(default_factory=list)
+    skills_by_section: Dict[str, List[str]] = Field(default_factory=dict)
+    emails: List[str] = Field(default_factory=list)
+    phones: List[str] = Field(default_factory=list)
+    links: List[str] = Field(default_factory=list)
+    date_ranges: List[str] = Field(default_factory=list)
+    years: List[int] = Field(default_factory=list)
+    education: List[str] = Field(default_factory=list)
+    gpa: Optional[str] = None
+    word_count: int = 0
+    bullet_count: int = 0
+    quantified_bullets: int = 0
+    missing_sections: List[str] = Field(default_factory=list)
+    structural_issues: List[str] = Field(default_factory=list)
+    ats_keywords: List[str] = Field(default_factory=list)
+
+    def to_prompt(self) -> str:
+        """Terse feature summary for the LLM prompt (replaces the skills, education and contact text)"""
+        links = ", ".join(self.links) or "none"
+        lines = [
+            f"skills: {', '.join(self.skills) or 'none recognized'}",
+            f"education: {'; '.join(self.education) or 'not found'}" + (f" (GPA {self.gpa})" if self.gpa else ""),
+            f"contact: email {'yes' if self.emails else 'no'}, phone {'yes' if self.phones else 'no'}, links {links}",
+            f"structure: {self.word_count} words, {self.bullet_count} bullets ({self.quantified_bullets} quantified)",
+        ]
+        if "certifications" in self.sections:
+            lines.append("certifications: " + "; ".join(
+                line.strip(" -•*") for line in self.sections["certifications"].splitlines() if line.strip()
+            ))
+        if self.structural_issues:
+            lines.append(f"issues: {'; '.join(self.structural_issues)}")
+        return "\n".join(lines)
+
+
+class ResumeParser:
+    """
+    Local resume pre-processing: section segmentation, skill extraction against a
+    skill vocabulary (ideally the job catalog's), contact/date/education detection,
+    and the structural and ATS-keyword checks that need no model judgment
+    """
+
+    _default: Optional["ResumeParser"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        skill_vocabulary: Optional[Iterable[str]] = None,
+        skill_sets: Optional[Iterable[Iterable[str]]] = None,
+        max_ats_keywords: int = 10
+    ):
+        """
+        skill_vocabulary: skill names to recognize
+        skill_sets: skills listed together by one job posting; missing skills from
+        postings that overlap the resume become the ATS keyword suggestions
+        """
+        # Normalized skill -> display name, in vocabulary order
+        self.vocabulary: Dict[str, str] = {}
+        for name in (skill_vocabulary if skill_vocabulary is not None else DEFAULT_SKILL_VOCABULARY):
+            key = normalize_skill(name)
+            if key and key not in self.vocabulary:
+                self.vocabulary[key] = name.strip()
+        self.skill_sets = [
+            frozenset(normalize_skill(skill) for skill in skills)
+            for skills in (skill_sets if skill_sets is not None else DEFAULT_SKILL_SETS)
+        ]
+        for skills in self.skill_sets:
+            for key in skills:
+                self.vocabulary.setdefault(key, key)
+        self.max_ats_keywords = max_ats_keywords
+        # Identifies the vocabulary and skill sets, so cached analyses can tell parsers apart
+        self.fingerprint = hashlib.sha256(repr((
+            list(self.vocabulary.items()), sorted(sorted(skills) for skills in self.skill_sets), max_ats_keywords
+        )).encode("utf-8")).hexdigest()[:16]
+
+        # One alternation, longest names first so "AWS SageMaker" wins over "AWS"
+        alternatives = sorted(self.vocabulary, key=len, reverse=True)
+        self._skill_pattern = re.compile(
+            r"(?<![\w+#.])(" + "|".join(re.escape(skill) for skill in alternatives) + r")(?![\w+#]|\.\w)",
+            re.I
+        ) if alternatives else None
+
+    @classmethod
+    def from_job_index(cls, job_index: JobIndex, **kwargs) -> "ResumeParser":
+        """Vocabulary and skill sets from the live job catalog"""
+        names = []
+        skill_sets = []
+        for indexed in job_index.live_jobs():
+            names += list(indexed.job.get('required_skills', []) or []) + list(indexed.job.get('preferred_skills', []) or [])
+            skill_sets.append(indexed.all_skills)
+        return cls(list(DEFAULT_SKILL_VOCABULARY) + names, skill_sets or None, **kwargs)
+
+    @classmethod
+    def default(cls) -> "ResumeParser":
+        """Process-wide parser over DEFAULT_SKILL_VOCABULARY"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def segment(self, text: str) -> Dict[str, str]:
+        """Canonical section -> text; lines before the first heading go to "header" """
+        sections: Dict[str, List[str]] = {"header": []}
+        current = "header"
+        for line in text.splitlines():
+            heading = re.sub(r"[^a-z& ]", "", line.lower()).strip()
+            if heading in _HEADING_LOOKUP and len(line.strip()) <= 40:
+                current = _HEADING_LOOKUP[heading]
+                sections.setdefault(current, [])
+                continue
+            sections[current].append(line)
+        return {
+            section: "\n".join(lines).strip()
+            for section, lines in sections.items()
+            if "\n".join(lines).strip()
+        }
+
+    def extract_skills(self, text: str) -> List[str]:
+        """Vocabulary skills mentioned in the text, in order of first mention"""
+        if self._skill_pattern is None:
+            return []
+        skills = []
+        seen = set()
+        for match in self._skill_pattern.finditer(text):
+            key = match.group(1).lower()
+            if key not in seen:
+                seen.add(key)
+                skills.append(self.vocabulary[key])
+        return skills
+
+    def parse(self, resume_text: str) -> ResumeFeatures:
+        sections = self.segment(resume_text)
+        skills = self.extract_skills(resume_text)
+        skills_by_section = {
+            section: found for section, content in sections.items()
+            if (found := self.extract_skills(content))
+        }
+
+        lines = [line for line in resume_text.splitlines() if line.strip()]
+        bullets = [line for line in lines if _BULLET.match(line)]
+        quantified = [line for line in bullets if _METRIC.search(line)]
+        education_text = sections.get("education", "")
+        gpa = _GPA.search(resume_text)
+
+        features = ResumeFeatures(
+            sections=sections,
+            skills=skills,
+            skills_by_section=skills_by_section,
+            emails=sorted(set(_EMAIL.findall(resume_text))),
+            phones=sorted({" ".join(phone.split()) for phone in _PHONE.findall(resume_text) if not _YEAR.fullmatch(phone.strip())}),
+            links=sorted({link.rstrip("/.") for link in _URL.findall(resume_text)}),
+            date_ranges=[f"{start} - {end}" for start, end in _DATE_RANGE.findall(resume_text)],
+            years=sorted({int(year) for year in _YEAR.findall(resume_text)}),
+            education=[match.group(0).strip() for match in _DEGREE.finditer(education_text or resume_text)][:3],
+            gpa=f"{gpa.group(1)}/{gpa.group(2)}" if gpa and gpa.group(2) else (gpa.group(1) if gpa else None),
+            word_count=len(resume_text.split()),
+            bullet_count=len(bullets),
+            quantified_bullets=len(quantified),
+            missing_sections=[section for section in EXPECTED_SECTIONS if section not in sections]
+        )
+        features.structural_issues = self._structural_issues(features)
+        features.ats_keywords = self._ats_keywords(features)
+        return features
+
+    def _structural_issues(self, features: ResumeFeatures) -> List[str]:
+        issues = []
+        for section in features.missing_sections:
+            issues.append(f"No clearly headed {section.title()} section; ATS parsers rely on standard headings")
+        if not features.emails:
+            issues.append("No email address found")
+        if not features.phones:
+            issues.append("No phone number found")
+        if not any("linkedin" in link.lower() for link in features.links):
+            issues.append("No LinkedIn profile link")
+        if not any("github" in link.lower() or "gitlab" in link.lower() for link in features.links):
+            issues.append("No GitHub/portfolio link to show project work")
+        if features.bullet_count and features.quantified_bullets / features.bullet_count < 0.3:
+            issues.append(f"Only {features.quantified_bullets} of {features.bullet_count} bullet points are quantified")
+        if not features.bullet_count:
+            issues.append("No bullet points; achievements are harder to scan")
+        if features.word_count < 150:
+            issues.append(f"Resume is short ({features.word_count} words)")
+        elif features.word_count > 900:
+            issues.append(f"Resume is long ({features.word_count} words); aim for one page")
+        if "skills" in features.sections and "skills" not in features.skills_by_section:
+            issues.append("Skills section lists no recognizable technical skills")
+        return issues
+
+    def _ats_keywords(self, features: ResumeFeatures) -> List[str]:
+        """
+        Missing skills from the postings that overlap the resume, weighted by the overlap
+        With no overlap at all, the most frequently listed skills overall
+        """
+        present = {normalize_skill(skill) for skill in features.skills}
+        weights: Dict[str, int] = {}
+        for skills in self.skill_sets:
+            overlap = len(skills & present) if present else 1
+            if not overlap:
+                continue
+            for key in skills - present:
+                weights[key] = weights.get(key, 0) + overlap
+        order = {key: position for position, key in enumerate(self.vocabulary)}
+        ranked = sorted(weights, key=lambda key: (-weights[key], order.get(key, len(order))))
+        return [self.vocabulary.get(key, key) for key in ranked[:self.max_ats_keywords]]
@@ -0,0 +1,131 @@
+import re
+import heapq
+from collections import Counter
+from typing import Dict, Any, Optional, Tuple
+
+# Salary ranges in the jobs table look like "8-12 LPA"
+_SALARY_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*(.*?)\s*$")
+
+
+def parse_salary_range(salary_range: Any) -> Optional[Tuple[float, float, str]]:
+    """Parse "8-12 LPA" into (8.0, 12.0, "LPA"); None if it does not look like a range"""
+    if not isinstance(salary_range, str):
+        return None
+    match = _SALARY_PATTERN.match(salary_range)
+    if not match:
+        return None
+    return float(match.group(1)), float(match.group(2)), match.group(3)
+
+
+class SkillAggregate:
+    """Running demand statistics for one normalized skill"""
+
+    __slots__ = ("job_count", "categories", "co_skills", "salary_ranges")
+
+    def __init__(self):
+        self.job_count = 0
+        self.categories: Counter = Counter()
+        self.co_skills: Counter = Counter()
+        self.salary_ranges: Counter = Counter()
+
+    def copy(self) -> "SkillAggregate":
+        clone = SkillAggregate()
+        clone.job_count = self.job_count
+        clone.categories = Counter(self.categories)
+        clone.co_skills = Counter(self.co_skills)
+        clone.salary_ranges = Counter(self.salary_ranges)
+        return clone
+
+
+class SkillDemandAggregates:
+    """
+    Skill -> job count, category histogram, co-occurring skills and salary ranges
+    Built in one pass over the catalog and kept current as jobs are added or
+    removed, so demand lookups never rescan the jobs
+    """
+
+    def __init__(self):
+        self.skills: Dict[str, SkillAggregate] = {}
+        # Original spelling for each normalized skill, for display
+        self.display_names: Dict[str, str] = {}
+
+    def copy(self) -> "SkillDemandAggregates":
+        clone = SkillDemandAggregates()
+        clone.skills = {skill: aggregate.copy() for skill, aggregate in self.skills.items()}
+        clone.display_names = dict(self.display_names)
+        return clone
+
+    def _apply(self, job: Dict[str, Any], skills: frozenset, delta: int) -> None:
+        category = job.get('category', 'Other')
+        salary_range = job.get('salary_range')
+
+        for skill in skills:
+            aggregate = self.skills.get(skill)
+            if aggregate is None:
+                if delta < 0:
+                    continue
+                aggregate = self.skills[skill] = SkillAggregate()
+
+            aggregate.job_count += delta
+            aggregate.categories[category] += delta
+            if salary_range is not None:
+                aggregate.salary_ranges[str(salary_range)] += delta
+            # Counter.update/subtract count in C; the skill itself is then taken back out
+            if delta > 0:
+                aggregate.co_skills.update(skills)
+            else:
+                aggregate.co_skills.subtract(skills)
+            aggregate.co_skills[skill] -= delta
+            if not aggregate.co_skills[skill]:
+                del aggregate.co_skills[skill]
+
+            if aggregate.job_count <= 0:
+                del self.skills[skill]
+            elif delta < 0:
+                # Drop zeroed counters so lookups stay small
+                for counter in (aggregate.categories, aggregate.co_skills, aggregate.salary_ranges):
+                    for key in [k for k, v in counter.items() if v <= 0]:
+                        del counter[key]
+
+    def add(self, job: Dict[str, Any], skills: frozenset) -> None:
+        """Count a job under every normalized skill it lists"""
+        for raw in (job.get('required_skills', []) or []) + (job.get('preferred_skills', []) or []):
+            self.display_names.setdefault(raw.lower().strip(), raw.strip())
+        self._apply(job, skills, 1)
+
+    def remove(self, job: Dict[str, Any], skills: frozenset) -> None:
+        """Undo add() for a job that was updated or deleted"""
+        self._apply(job, skills, -1)
+
+    def display_name(self, skill: str) -> str:
+        return self.display_names.get(skill, skill)
+
+    def lookup(self, skill: str, top_co_skills: int = 10) -> Optional[Dict[str, Any]]:
+        """Demand summary for one normalized skill, or None if no job lists it"""
+        aggregate = self.skills.get(skill)
+        if aggregate is None:
+            return None
+
+        salary_summary = {}
+        for salary_range, count in aggregate.salary_ranges.items():
+            parsed = parse_salary_range(salary_range)
+            if parsed is None:
+                continue
+            low, high, unit = parsed
+            summary = salary_summary.setdefault(unit or "unspecified", {"min": low, "max": high, "jobs": 0})
+            summary["min"] = min(summary["min"], low)
+            summary["max"] = max(summary["max"], high)
+            summary["jobs"] += count
+
+        return {
+            "total_jobs": aggregate.job_count,
+            "categories": dict(aggregate.categories),
+            "complementary_skills": [
+                {"skill": self.display_name(other), "jobs": count}
+                for other, count in heapq.nsmallest(
+                    top_co_skills, aggregate.co_skills.items(), key=lambda item: (-item[1], item[0])
+                )
+            ],
+            "salary_ranges": dict(aggregate.salary_ranges),
+            "salary_summary": salary_summary
+        }
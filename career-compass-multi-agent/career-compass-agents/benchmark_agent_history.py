@@ -0,0 +1,119 @@
+import os
+import sys
+import gc
+import argparse
+from typing import Dict, List
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from strands import Agent
+from strands.models.model import Model
+
+from agents.agent_template import AgentTemplate
+from agents.history_manager import estimate_tokens
+
+RESUME_PROMPT = "Please analyze the following resume and provide comprehensive feedback:\n" + (
+    "Software Development Intern | TechCorp | Developed REST APIs using Node.js and AWS Lambda\n" * 40
+)
+
+
+class StubTokenModel(Model):
+    """
+    Strands model that answers instantly and records the input size of every call
+    Stands in for Bedrock so the benchmark measures only what the agent re-sends
+    """
+
+    def __init__(self, answer: str = "Here is your resume feedback. " * 20):
+        self.answer = answer
+        self.input_tokens: List[int] = []
+
+    def update_config(self, **model_config):
+        pass
+
+    def get_config(self):
+        return {}
+
+    async def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        raise NotImplementedError("StubTokenModel only streams text")
+        yield
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        tokens = estimate_tokens(messages) + len(system_prompt or "") // 4
+        self.input_tokens.append(tokens)
+        yield {"messageStart": {"role": "assistant"}}
+        yield {"contentBlockStart": {"start": {}}}
+        yield {"contentBlockDelta": {"delta": {"text": self.answer}}}
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+        yield {"metadata": {
+            "usage": {"inputTokens": tokens, "outputTokens": len(self.answer) // 4, "totalTokens": tokens},
+            "metrics": {"latencyMs": 0}
+        }}
+
+
+def current_rss_mb() -> float:
+    """Resident set size now (not the peak), from /proc on Linux"""
+    try:
+        with open("/proc/self/statm") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_calls(agent, model: StubTokenModel, calls: int) -> Dict[str, float]:
+    """Send `calls` sequential prompts and summarize per-call input tokens and RSS"""
+    gc.collect()
+    rss_start = current_rss_mb()
+    for call in range(calls):
+        agent(f"{RESUME_PROMPT}\nRequest {call}")
+    gc.collect()
+    window = max(1, min(10, calls // 10))
+    tokens = model.input_tokens
+    return {
+        "calls": calls,
+        "first_input_tokens": sum(tokens[:window]) / window,
+        "last_input_tokens": sum(tokens[-window:]) / window,
+        "total_input_tokens": sum(tokens),
+        "rss_growth_mb": current_rss_mb() - rss_start
+    }
+
+
+def run_benchmark(calls: int = 1000, legacy_calls: int = 1000):
+    """
+    Legacy long-lived Agent vs a per-request AgentTemplate on the same stub model
+    The long-lived agent re-sends prior turns until Strands' default sliding window
+    (40 messages) caps it; the template sends only the current prompt
+    """
+    legacy_model = StubTokenModel()
+    legacy = run_calls(
+        Agent(model=legacy_model, system_prompt="You are a resume analyzer.", callback_handler=None),
+        legacy_model,
+        legacy_calls
+    )
+
+    template_model = StubTokenModel()
+    stateless = run_calls(
+        AgentTemplate(model=template_model, system_prompt="You are a resume analyzer.", callback_handler=None),
+        template_model,
+        calls
+    )
+
+    print("=" * 70)
+    print("AGENT HISTORY BENCHMARK (stub model, sequential calls)")
+    print("=" * 70)
+    for label, result in (("long-lived Agent", legacy), ("AgentTemplate", stateless)):
+        print(f"{label:<17} {result['calls']:>5} calls | input tokens/call "
+              f"{result['first_input_tokens']:>9.0f} -> {result['last_input_tokens']:>9.0f} | "
+              f"RSS growth {result['rss_growth_mb']:>6.1f} MB")
+    print("=" * 70)
+    return legacy, stateless
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-call input tokens and RSS over many sequential agent calls")
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--legacy-calls", type=int, default=1000)
+    args = parser.parse_args()
+    run_benchmark(args.calls, args.legacy_calls)
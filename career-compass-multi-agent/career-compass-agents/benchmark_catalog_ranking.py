@@ -0,0 +1,106 @@
+import os
+import re
+import sys
+import time
+import random
+import argparse
+from types import SimpleNamespace
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.job_shortlist import JobShortlister
+from agents.response_cache import ResponseCache
+from agents.resume_analyzer_agent import JobFit, JobFitReport, ResumeAnalyzerAgent
+from agents.resume_parser import DEFAULT_SKILL_SETS
+
+ROLES = {
+    0: ("Cloud Engineer", "Build and operate cloud infrastructure with infrastructure as code."),
+    1: ("Full Stack Developer", "Ship web features end to end, from React front ends to Node.js services."),
+    2: ("Frontend Developer", "Build responsive, accessible user interfaces and component libraries."),
+    3: ("Data Scientist", "Analyze datasets and build predictive models for product decisions."),
+    4: ("ML Engineer", "Train, deploy and monitor deep learning models in production."),
+    5: ("DevOps Engineer", "Automate CI/CD pipelines, containers and cluster operations."),
+    6: ("Backend Developer", "Design Java microservices, APIs and event streaming."),
+    7: ("Security Analyst", "Monitor threats, respond to incidents and harden networks."),
+    8: ("Data Analyst", "Build dashboards and reports from SQL and Python analyses."),
+}
+LEVELS = ["Entry Level", "Mid Level", "Senior Level"]
+
+
+def make_catalog(count: int, seed: int = 11):
+    """Synthetic postings with descriptions, shaped like the career-compass-jobs table"""
+    rng = random.Random(seed)
+    jobs = []
+    for number in range(count):
+        family = rng.randrange(len(DEFAULT_SKILL_SETS))
+        skills = list(DEFAULT_SKILL_SETS[family])
+        rng.shuffle(skills)
+        title, description = ROLES[family]
+        jobs.append({
+            "job_id": f"JOB{number:05d}",
+            "title": f"{rng.choice(LEVELS).split()[0]} {title}",
+            "company": f"Company {rng.randrange(500)}",
+            "experience_level": rng.choice(LEVELS),
+            "required_skills": skills[:4],
+            "preferred_skills": skills[4:6],
+            "description": f"{description} Team {number % 37} works with {', '.join(skills[:3])}."
+        })
+    return jobs
+
+
+class StubRerankModel:
+    """Answers the batched job-fit prompt after a fixed latency, like one Nova call"""
+
+    def __init__(self, latency_seconds: float = 1.5):
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+        self.prompt_chars = 0
+
+    def __call__(self, prompt, structured_output_model=None):
+        self.calls += 1
+        self.prompt_chars += len(prompt)
+        time.sleep(self.latency_seconds)
+        job_ids = re.findall(r"job_id (\S+):", prompt)
+        return SimpleNamespace(structured_output=JobFitReport(rankings=[
+            JobFit(job_id=job_id, fit_score=9.0 - index * 0.5, rationale="Stub rationale.")
+            for index, job_id in enumerate(reversed(job_ids))
+        ]))
+
+
+def run_benchmark(catalog_size: int = 2000, top_k: int = 5, latency_seconds: float = 1.5):
+    from test_resume_analyzer import SAMPLE_RESUME
+
+    jobs = make_catalog(catalog_size)
+    start = time.perf_counter()
+    shortlister = JobShortlister(jobs)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    analyzer = ResumeAnalyzerAgent(response_cache=ResponseCache())
+    analyzer.agent = StubRerankModel(latency_seconds)
+    start = time.perf_counter()
+    report = analyzer.compare_with_jobs(SAMPLE_RESUME, shortlister, top_k=top_k)
+    two_stage_seconds = time.perf_counter() - start
+
+    print("=" * 70)
+    print(f"RESUME -> CATALOG RANKING ({catalog_size} jobs, top-{top_k}, {latency_seconds}s per model call)")
+    print("=" * 70)
+    print(f"shortlister build (once per catalog version): {build_ms:>9.1f} ms")
+    print(f"stage one shortlist:                          {report['shortlist_ms']:>9.1f} ms")
+    print(f"two-stage report: {analyzer.agent.calls} model call, {two_stage_seconds:>6.2f} s "
+          f"({analyzer.agent.prompt_chars} prompt chars)")
+    print(f"one LLM comparison per job:         {catalog_size} model calls, ~{catalog_size * latency_seconds / 60:.0f} min sequential")
+    print("-" * 70)
+    for ranking in report["rankings"]:
+        print(f"{ranking['fit_score']:>4} | {ranking['title']:<32} | missing: {', '.join(ranking['missing_skills']) or '-'}")
+    print("=" * 70)
+    return report, two_stage_seconds
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Two-stage resume-to-catalog ranking against a stub model")
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=1.5)
+    args = parser.parse_args()
+    run_benchmark(args.jobs, args.top_k, args.latency)
@@ -0,0 +1,172 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.job_index import JobIndex
+from agents.job_scoring import VectorizedJobScorer
+
+CATEGORIES = ["Software Development", "Cloud", "DevOps", "Data Science", "AI/ML", "Security"]
+LEVELS = ["Entry Level", "Mid Level", "Senior Level"]
+SKILL_VOCABULARY = [f"Skill {i}" for i in range(300)]
+
+
+def make_catalog(count: int, seed: int = 42):
+    """Synthetic job items shaped like the career-compass-jobs table"""
+    rng = random.Random(seed)
+    return [
+        {
+            "job_id": f"JOB{i:06d}",
+            "title": f"Engineer {i}",
+            "company": f"Company {i % 500}",
+            "category": rng.choice(CATEGORIES),
+            "experience_level": rng.choice(LEVELS),
+            "required_skills": rng.sample(SKILL_VOCABULARY, rng.randint(3, 8)),
+            "preferred_skills": rng.sample(SKILL_VOCABULARY, rng.randint(0, 4))
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_match(all_jobs, student_skills, experience_level, preferred_categories, top_n):
+    """The per-job Python loop match_jobs used before the index"""
+    def calculate_skill_match(student, job_skills):
+        if not job_skills:
+            return 0.0
+        student_lower = [s.lower().strip() for s in student]
+        job_lower = [s.lower().strip() for s in job_skills]
+        matching = set(student_lower) & set(job_lower)
+        return round((len(matching) / len(job_lower)) * 100, 2)
+
+    job_matches = []
+    for job in all_jobs:
+        required_skills = job.get('required_skills', [])
+        preferred_skills = job.get('preferred_skills', [])
+        required_match = calculate_skill_match(student_skills, required_skills)
+        preferred_match = calculate_skill_match(student_skills, preferred_skills)
+        overall_match = (required_match * 0.7) + (preferred_match * 0.3)
+        exp_match = 1.0 if job.get('experience_level') == experience_level else 0.5
+        cat_match = 1.0
+        if preferred_categories:
+            cat_match = 1.2 if job.get('category') in preferred_categories else 0.8
+        final_score = overall_match * exp_match * cat_match
+
+        student_lower = set([s.lower().strip() for s in student_skills])
+        required_lower = set([s.lower().strip() for s in required_skills])
+        preferred_lower = set([s.lower().strip() for s in preferred_skills])
+        job_matches.append({
+            "job": job,
+            "match_score": round(final_score, 2),
+            "required_match": required_match,
+            "preferred_match": preferred_match,
+            "matching_skills": list(student_lower & (required_lower | preferred_lower)),
+            "missing_skills": list(required_lower - student_lower)
+        })
+    job_matches.sort(key=lambda x: x['match_score'], reverse=True)
+    return job_matches[:top_n]
+
+
+def time_queries(match_fn, queries, repeat: int):
+    """Average milliseconds per query"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            match_fn(*query)
+    return (time.perf_counter() - start) * 1000 / (repeat * len(queries))
+
+
+def run_benchmark(sizes, queries_per_size: int = 20, top_n: int = 5):
+    rng = random.Random(7)
+
+    print("=" * 78)
+    print("JOB MATCHING BENCHMARK (per-job loop vs inverted index vs NumPy)")
+    print("=" * 78)
+    print(f"{'jobs':>8} | {'build idx':>10} | {'build np':>10} | {'loop ms':>9} | {'index ms':>9} | {'numpy ms':>9}")
+    print("-" * 78)
+
+    for size in sizes:
+        catalog = make_catalog(size)
+        queries = [
+            (
+                rng.sample(SKILL_VOCABULARY, rng.randint(4, 12)),
+                rng.choice(LEVELS),
+                rng.choice([None, rng.sample(CATEGORIES, 2)]),
+                top_n
+            )
+            for _ in range(queries_per_size)
+        ]
+
+        start = time.perf_counter()
+        job_index = JobIndex(catalog)
+        index_build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        scorer = VectorizedJobScorer(job_index)
+        numpy_build_ms = (time.perf_counter() - start) * 1000
+
+        # Results must agree before timings mean anything
+        for query in queries:
+            expected = [(m['job']['job_id'], m['match_score']) for m in legacy_match(catalog, *query)]
+            assert expected == [(m['job']['job_id'], m['match_score']) for m in job_index.top_matches(*query)]
+            assert expected == [(m['job']['job_id'], m['match_score']) for m in scorer.top_matches(*query)]
+
+        repeat = max(1, 10000 // size)
+        loop_ms = time_queries(lambda *q: legacy_match(catalog, *q), queries, repeat)
+        index_ms = time_queries(job_index.top_matches, queries, repeat)
+        numpy_ms = time_queries(scorer.top_matches, queries, repeat)
+
+        print(
+            f"{size:>8} | {index_build_ms:>10.1f} | {numpy_build_ms:>10.1f} | "
+            f"{loop_ms:>9.2f} | {index_ms:>9.2f} | {numpy_ms:>9.2f}"
+        )
+
+    print("=" * 78)
+
+
+def run_batch_benchmark(size: int, students: int, max_workers: int = None):
+    """Students per second for match-one-at-a-time vs the batch matrix path"""
+    rng = random.Random(3)
+    catalog = make_catalog(size)
+    scorer = VectorizedJobScorer(JobIndex(catalog))
+    profiles = [
+        {
+            "student_skills": rng.sample(SKILL_VOCABULARY, rng.randint(4, 12)),
+            "experience_level": rng.choice(LEVELS),
+            "preferred_categories": rng.choice([None, rng.sample(CATEGORIES, 2)])
+        }
+        for _ in range(students)
+    ]
+
+    start = time.perf_counter()
+    for profile in profiles:
+        scorer.top_matches(
+            profile['student_skills'], profile['experience_level'], profile['preferred_categories']
+        )
+    single_rate = students / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    scorer.top_matches_batch(profiles, max_workers=max_workers)
+    batch_rate = students / (time.perf_counter() - start)
+
+    print(f"BATCH MATCHING: {students} students x {size} jobs (workers={max_workers or 1})")
+    print(f"   one at a time: {single_rate:>10.1f} students/sec")
+    print(f"   batch matrix:  {batch_rate:>10.1f} students/sec")
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark job matching scoring engines")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--top-n", type=int, default=5)
+    parser.add_argument("--batch-students", type=int, default=500)
+    parser.add_argument("--batch-jobs", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    run_benchmark(args.sizes, args.queries, args.top_n)
+    run_batch_benchmark(args.batch_jobs, args.batch_students, args.workers)
@@ -0,0 +1,175 @@
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.career_guidance_agent import CareerGuidanceAgent
+from agents.mcp_tools.local_retriever import LocalRetriever
+
+DOCUMENTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "knowledge-base-documents")
+
+QUERIES = [
+    "What skills does a data scientist need?",
+    "How should I prepare for a system design interview?",
+    "Which universities are good for a masters in computer science?",
+    "What is the career path for a cloud engineer?",
+    "How do I answer behavioral questions with the STAR method?"
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)"""
+    return max(1, len(text) // 4)
+
+
+class GenerationModel:
+    """Latency model for one Nova generation: time to first token plus decode time"""
+
+    def __init__(self, latency_scale: float, first_token_seconds: float = 0.45, tokens_per_second: float = 80.0):
+        self.latency_scale = latency_scale
+        self.first_token_seconds = first_token_seconds
+        self.tokens_per_second = tokens_per_second
+        self.generations = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def generate(self, input_tokens: int, output_tokens: int) -> None:
+        self.generations += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        time.sleep(self.latency_scale * (self.first_token_seconds + output_tokens / self.tokens_per_second))
+
+
+class StubAgentRuntime:
+    """bedrock-agent-runtime stand-in backed by the local BM25 index"""
+
+    def __init__(self, retriever: LocalRetriever, model: GenerationModel, retrieve_seconds: float = 0.12):
+        self.retriever = retriever
+        self.model = model
+        self.retrieve_seconds = retrieve_seconds
+        self.calls = {"retrieve": 0, "retrieve_and_generate": 0}
+
+    def retrieve(self, **kwargs):
+        self.calls["retrieve"] += 1
+        time.sleep(self.model.latency_scale * self.retrieve_seconds)
+        response = self.retriever.retrieve(**kwargs)
+        for result in response["retrievalResults"]:
+            result["location"] = {"type": "S3", "s3Location": {"uri": result["location"]["localLocation"]["uri"]}}
+        return response
+
+    def retrieve_and_generate(self, input, retrieveAndGenerateConfiguration, **kwargs):
+        self.calls["retrieve_and_generate"] += 1
+        configuration = retrieveAndGenerateConfiguration["knowledgeBaseConfiguration"]
+        results = self.retrieve(
+            retrievalQuery=input,
+            retrievalConfiguration=configuration["retrievalConfiguration"]
+        )["retrievalResults"]
+
+        # The knowledge base prompt carries every retrieved chunk; the answer restates them
+        passages = "\n\n".join(result["content"]["text"] for result in results)
+        answer = "Based on the knowledge base: " + " ".join(passages.split())[:1400]
+        self.model.generate(estimate_tokens(input["text"] + passages) + 350, estimate_tokens(answer))
+
+        return {
+            "output": {"text": answer},
+            "citations": [{
+                "retrievedReferences": [
+                    {
+                        "content": result["content"],
+                        "location": result["location"],
+                        "metadata": {"score": result["score"]}
+                    }
+                    for result in results
+                ]
+            }]
+        }
+
+
+class StubBedrockRuntime:
+    """bedrock-runtime converse stand-in: one tool call, then a final answer"""
+
+    def __init__(self, model: GenerationModel, answer_tokens: int = 300):
+        self.model = model
+        self.answer_tokens = answer_tokens
+
+    def converse(self, modelId, messages, system, inferenceConfig, toolConfig=None, **kwargs):
+        prompt_tokens = estimate_tokens(json.dumps(messages, default=str) + json.dumps(system) + json.dumps(toolConfig))
+        last_content = messages[-1]["content"]
+
+        if any("toolResult" in block for block in last_content):
+            self.model.generate(prompt_tokens, self.answer_tokens)
+            return {
+                "stopReason": "end_turn",
+                "output": {"message": {"role": "assistant", "content": [{"text": "word " * self.answer_tokens}]}},
+                "usage": {"inputTokens": prompt_tokens, "outputTokens": self.answer_tokens}
+            }
+
+        self.model.generate(prompt_tokens, 40)
+        return {
+            "stopReason": "tool_use",
+            "output": {"message": {"role": "assistant", "content": [{
+                "toolUse": {
+                    "toolUseId": f"tool-{self.model.generations}",
+                    "name": "query_knowledge_base",
+                    "input": {"query": last_content[0]["text"], "max_results": 5}
+                }
+            }]}},
+            "usage": {"inputTokens": prompt_tokens, "outputTokens": 40}
+        }
+
+
+def run_mode(mode: str, retriever: LocalRetriever, queries, latency_scale: float):
+    """Run every query through CareerGuidanceAgent with stubbed Bedrock clients"""
+    model = GenerationModel(latency_scale)
+    agent = CareerGuidanceAgent(knowledge_base_id="STUBKB", kb_mode=mode)
+    agent.kb_tool.semantic_cache = None
+    agent.bedrock_runtime = StubBedrockRuntime(model)
+    agent.kb_tool.bedrock_agent_runtime = StubAgentRuntime(retriever, model)
+
+    start = time.perf_counter()
+    for query in queries:
+        result = agent.process_query(query)
+        assert result["status"] == "success", result
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "queries": len(queries),
+        "generations": model.generations,
+        "input_tokens": model.input_tokens,
+        "output_tokens": model.output_tokens,
+        "kb_calls": dict(agent.kb_tool.bedrock_agent_runtime.calls),
+        "latency_seconds": elapsed / latency_scale / len(queries) if latency_scale else elapsed / len(queries)
+    }
+
+
+def run_comparison(latency_scale: float = 0.05):
+    with tempfile.TemporaryDirectory() as index_dir:
+        retriever = LocalRetriever(DOCUMENTS_DIR, index_dir=index_dir)
+        results = [run_mode(mode, retriever, QUERIES, latency_scale) for mode in ("retrieve_and_generate", "retrieve")]
+
+    print("=" * 78)
+    print("KNOWLEDGE BASE TOOL MODES (stubbed Bedrock, simulated Nova latency)")
+    print("=" * 78)
+    print(f"{'mode':<22} | {'generations':>11} | {'input tok':>9} | {'output tok':>10} | {'sec/query':>9}")
+    print("-" * 78)
+    for result in results:
+        print(
+            f"{result['mode']:<22} | {result['generations']:>11} | {result['input_tokens']:>9} | "
+            f"{result['output_tokens']:>10} | {result['latency_seconds']:>9.2f}"
+        )
+    print("=" * 78)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare retrieve_and_generate vs retrieve-only KB tool mode")
+    parser.add_argument("--latency-scale", type=float, default=0.05,
+                        help="Fraction of the simulated model latency to actually sleep")
+    args = parser.parse_args()
+    run_comparison(args.latency_scale)
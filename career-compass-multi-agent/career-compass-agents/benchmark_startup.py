@@ -0,0 +1,105 @@
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Each scenario runs in a fresh interpreter so imports are genuinely cold
+SCENARIO = r"""
+import json, os, sys, time
+sys.path.insert(0, {here!r})
+timings = {{}}
+
+start = time.perf_counter()
+import orchestrator_agent
+timings["import_ms"] = (time.perf_counter() - start) * 1000
+
+start = time.perf_counter()
+orchestrator = orchestrator_agent.OrchestratorAgent(region="us-west-2")
+timings["construct_ms"] = (time.perf_counter() - start) * 1000
+timings["heavy_modules_after_construct"] = sorted(
+    name for name in ("strands", "boto3", "numpy") if name in sys.modules
+)
+
+start = time.perf_counter()
+orchestrator.career_agent
+timings["first_chat_agent_ms"] = (time.perf_counter() - start) * 1000
+
+start = time.perf_counter()
+orchestrator.resume_agent, orchestrator.job_matcher_agent, orchestrator.intent_agent
+timings["remaining_agents_ms"] = (time.perf_counter() - start) * 1000
+
+print(json.dumps(timings))
+"""
+
+STREAMLIT_SCENARIO = r"""
+import json, os, sys, time
+sys.path.insert(0, {here!r})
+try:
+    import streamlit
+except ImportError:
+    print(json.dumps({{"skipped": "streamlit not installed"}}))
+    raise SystemExit
+start = time.perf_counter()
+import streamlit_app
+print(json.dumps({{"import_ms": (time.perf_counter() - start) * 1000}}))
+"""
+
+
+def run_scenario(code: str) -> dict:
+    env = dict(os.environ, AWS_EC2_METADATA_DISABLED="true")
+    completed = subprocess.run(
+        [sys.executable, "-c", code.format(here=HERE)],
+        capture_output=True, text=True, env=env, timeout=300
+    )
+    lines = [line for line in completed.stdout.splitlines() if line.startswith("{")]
+    if completed.returncode != 0 or not lines:
+        return {"error": (completed.stderr or completed.stdout).strip().splitlines()[-1:]}
+    return json.loads(lines[-1])
+
+
+def median_runs(code: str, runs: int) -> dict:
+    results = [run_scenario(code) for _ in range(runs)]
+    if any("error" in result or "skipped" in result for result in results):
+        return results[0]
+    summary = {}
+    for key, value in results[0].items():
+        if isinstance(value, (int, float)):
+            summary[key] = sorted(result[key] for result in results)[len(results) // 2]
+        else:
+            summary[key] = value
+    return summary
+
+
+def run_benchmark(runs: int = 3):
+    orchestrator = median_runs(SCENARIO, runs)
+    streamlit = median_runs(STREAMLIT_SCENARIO, runs)
+
+    print("=" * 70)
+    print(f"STARTUP BENCHMARK (cold interpreter, median of {runs})")
+    print("=" * 70)
+    if "error" in orchestrator:
+        print(f"orchestrator_agent: failed: {orchestrator['error']}")
+    else:
+        print(f"import orchestrator_agent:           {orchestrator['import_ms']:>9.1f} ms")
+        print(f"OrchestratorAgent() construction:    {orchestrator['construct_ms']:>9.1f} ms")
+        print(f"  heavy modules loaded so far:       {orchestrator['heavy_modules_after_construct'] or 'none'}")
+        print(f"first chat (CareerGuidanceAgent):    {orchestrator['first_chat_agent_ms']:>9.1f} ms")
+        print(f"remaining specialists + intent:      {orchestrator['remaining_agents_ms']:>9.1f} ms")
+        ready = sum(orchestrator[key] for key in ("import_ms", "construct_ms", "first_chat_agent_ms"))
+        print(f"ready for a chat-only session:       {ready:>9.1f} ms")
+    if "import_ms" in streamlit:
+        print(f"import streamlit_app (bare mode):    {streamlit['import_ms']:>9.1f} ms")
+    else:
+        print(f"streamlit_app: {streamlit.get('skipped') or streamlit.get('error')}")
+    print("=" * 70)
+    return orchestrator, streamlit
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold import and construction time of the orchestrator and app")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    run_benchmark(args.runs)
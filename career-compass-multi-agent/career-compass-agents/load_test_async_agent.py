@@ -0,0 +1,157 @@
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.async_career_guidance_agent import AsyncCareerGuidanceAgent
+from agents.career_guidance_agent import CareerGuidanceAgent
+from agents.mcp_tools.semantic_cache import SemanticCache
+
+
+class StubBedrockServer:
+    """
+    In-process stand-in for the Bedrock endpoints: fixed network + generation latency
+    per call, one knowledge base lookup per question, then a final answer
+    """
+
+    def __init__(self, converse_seconds: float = 0.25, retrieve_seconds: float = 0.1):
+        self.converse_seconds = converse_seconds
+        self.retrieve_seconds = retrieve_seconds
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = 0
+
+    def response(self, messages):
+        self.calls += 1
+        last_content = messages[-1]["content"]
+        if any("toolResult" in block for block in last_content):
+            return {
+                "stopReason": "end_turn",
+                "output": {"message": {"role": "assistant", "content": [{"text": "Here is your career advice."}]}}
+            }
+        return {
+            "stopReason": "tool_use",
+            "output": {"message": {"role": "assistant", "content": [{
+                "toolUse": {"toolUseId": f"tool-{self.calls}", "name": "query_knowledge_base",
+                            "input": {"query": last_content[0]["text"]}}
+            }]}}
+        }
+
+    def knowledge(self, request):
+        return {
+            "output": {"text": f"Knowledge base answer for {request['input']['text']}"},
+            "citations": [{"retrievedReferences": [{
+                "content": {"text": "Relevant passage."},
+                "location": {"s3Location": {"uri": "s3://kb/doc.txt"}},
+                "metadata": {"score": 0.8}
+            }]}]
+        }
+
+    def _enter(self):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _exit(self):
+        self.in_flight -= 1
+
+
+class SyncStubRuntime:
+    def __init__(self, server: StubBedrockServer):
+        self.server = server
+
+    def converse(self, messages, **kwargs):
+        self.server._enter()
+        time.sleep(self.server.converse_seconds)
+        self.server._exit()
+        return self.server.response(messages)
+
+    def retrieve_and_generate(self, **request):
+        self.server._enter()
+        time.sleep(self.server.retrieve_seconds)
+        self.server._exit()
+        return self.server.knowledge(request)
+
+
+class AsyncStubRuntime:
+    def __init__(self, server: StubBedrockServer):
+        self.server = server
+
+    async def converse(self, messages, **kwargs):
+        self.server._enter()
+        await asyncio.sleep(self.server.converse_seconds)
+        self.server._exit()
+        return self.server.response(messages)
+
+    async def retrieve_and_generate(self, **request):
+        self.server._enter()
+        await asyncio.sleep(self.server.retrieve_seconds)
+        self.server._exit()
+        return self.server.knowledge(request)
+
+
+def run_sync(sessions: int, server: StubBedrockServer) -> float:
+    """One thread, one in-flight call: sessions are served back to back"""
+    agent = CareerGuidanceAgent(knowledge_base_id="STUBKB")
+    agent.bedrock_runtime = SyncStubRuntime(server)
+    agent.kb_tool.bedrock_agent_runtime = SyncStubRuntime(server)
+    agent.kb_tool.semantic_cache = None
+
+    start = time.perf_counter()
+    for session in range(sessions):
+        result = agent.process_query(f"Career question from student {session}")
+        assert result["status"] == "success"
+    return time.perf_counter() - start
+
+
+async def run_async(sessions: int, concurrency: int, server: StubBedrockServer) -> float:
+    """One event loop on one thread, up to `concurrency` sessions in flight"""
+    runtime = AsyncStubRuntime(server)
+    agent = AsyncCareerGuidanceAgent(
+        knowledge_base_id="STUBKB",
+        bedrock_runtime=runtime,
+        bedrock_agent_runtime=runtime
+    )
+    agent.kb_tool.semantic_cache = None
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def session(number: int):
+        async with semaphore:
+            # Every session has its own conversation history
+            result = await agent.process_query(f"Career question from student {number}", conversation_history=[])
+            assert result["status"] == "success"
+
+    start = time.perf_counter()
+    async with agent:
+        await asyncio.gather(*[session(number) for number in range(sessions)])
+    return time.perf_counter() - start
+
+
+def run_load_test(sessions: int = 200, concurrency: int = 50, sync_sessions: int = 10):
+    SemanticCache.clear_shared()
+
+    sync_server = StubBedrockServer()
+    sync_seconds = run_sync(sync_sessions, sync_server)
+
+    async_server = StubBedrockServer()
+    async_seconds = asyncio.run(run_async(sessions, concurrency, async_server))
+
+    print("=" * 70)
+    print("ASYNC CAREER GUIDANCE LOAD TEST (stub Bedrock, single thread)")
+    print("=" * 70)
+    print(f"sync agent:  {sync_sessions / sync_seconds:>8.1f} sessions/sec   (peak in-flight calls: {sync_server.peak_in_flight})")
+    print(f"async agent: {sessions / async_seconds:>8.1f} sessions/sec   (peak in-flight calls: {async_server.peak_in_flight})")
+    print("=" * 70)
+    return sync_sessions / sync_seconds, sessions / async_seconds
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent session throughput of AsyncCareerGuidanceAgent")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--sync-sessions", type=int, default=10)
+    args = parser.parse_args()
+    run_load_test(args.sessions, args.concurrency, args.sync_sessions)
@@ -1,44 +1,49 @@
 import os
 import sys
-from typing import Dict, Any, List, Optional
-from strands import Agent
-from strands.models import BedrockModel
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, List, Optional, Iterator, Callable
 
-# Import specialized agents
+# Specialist agents, strands and boto3 are imported on first use (see the lazy
+# properties below), so importing this module and building the orchestrator is cheap
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from agents.career_guidance_agent import CareerGuidanceAgent
-from agents.resume_analyzer_agent import ResumeAnalyzerAgent
-from agents.job_matcher_agent import JobMatcherAgent
 
 class OrchestratorAgent:
     """
     Orchestrator Agent using Strands framework
     Routes requests to specialized agents and coordinates multi-agent workflows
+    Each specialist (and its clients and models) is built the first time it is needed
     """
     
-    def __init__(self, region: str = "us-west-2"):
+    def __init__(
+        self,
+        region: str = "us-west-2",
+        use_local_intent_classifier: bool = True,
+        intent_confidence_threshold: float = 0.6,
+        intent_cache=None,
+        max_branch_workers: int = 4,
+        branch_timeout_seconds: float = 90.0
+    ):
         self.region = region
-        
-        # Initialize specialized agents
-        self.career_agent = CareerGuidanceAgent(
-            knowledge_base_id=os.getenv("KB_ID", "5UO4KAMLS3"),
-            region=region
-        )
-        
-        self.resume_agent = ResumeAnalyzerAgent(region=region)
-        
-        self.job_matcher_agent = JobMatcherAgent(
-            region=region,
-            table_name="career-compass-jobs"
-        )
-        
-        # Initialize Bedrock Model for orchestration
-        self.model = BedrockModel(
-            model_id="us.amazon.nova-pro-v1:0",
-            temperature=0.7,
-            max_tokens=2000,
-            top_p=0.9
+        # Local rules + hashed n-gram model answer most routing; the LLM only below this confidence
+        self.use_local_intent_classifier = use_local_intent_classifier
+        self.intent_confidence_threshold = intent_confidence_threshold
+        self._intent_cache = intent_cache
+        # Independent specialist calls in one workflow run side by side on this bounded
+        # pool; close() (or garbage collection) shuts it down
+        self.branch_timeout_seconds = branch_timeout_seconds
+        self.branch_executor = ThreadPoolExecutor(
+            max_workers=max_branch_workers,
+            thread_name_prefix="orchestrator-branch"
         )
+        self._construction_lock = threading.Lock()
+        self._career_agent = None
+        self._resume_agent = None
+        self._job_matcher_agent = None
+        self._intent_agent = None
+        self._catalog_parser = None
+        self._catalog_shortlister = None
         
         # System prompt for intent classification
         self.system_prompt = """You are an Orchestrator AI that routes student queries to specialized agents.
@@ -57,16 +62,158 @@ Respond with ONLY ONE of these options:
 - "MULTI_AGENT" - if the query requires multiple agents (e.g., "analyze my resume and recommend jobs")
 
 Be precise and choose the most appropriate routing."""
+    
+    def close(self) -> None:
+        """
+        Shut down the branch pool and any constructed specialist that holds its own
+        pool, without waiting for branches that are still running
+        """
+        self.branch_executor.shutdown(wait=False, cancel_futures=True)
+        if self._career_agent is not None and hasattr(self._career_agent, "close"):
+            self._career_agent.close()
+    
+    def __del__(self):
+        executor = getattr(self, "branch_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _get_or_create(self, attribute: str, factory):
+        """Build a specialist once, on first access; safe under concurrent first use"""
+        instance = getattr(self, attribute)
+        if instance is None:
+            with self._construction_lock:
+                instance = getattr(self, attribute)
+                if instance is None:
+                    instance = factory()
+                    setattr(self, attribute, instance)
+        return instance
+    
+    @property
+    def career_agent(self):
+        def create():
+            from agents.career_guidance_agent import CareerGuidanceAgent
+            return CareerGuidanceAgent(
+                knowledge_base_id=os.getenv("KB_ID", "5UO4KAMLS3"),
+                region=self.region
+            )
+        return self._get_or_create("_career_agent", create)
+    
+    @property
+    def resume_agent(self):
+        def create():
+            from agents.resume_analyzer_agent import ResumeAnalyzerAgent
+            return ResumeAnalyzerAgent(region=self.region)
+        return self._get_or_create("_resume_agent", create)
+    
+    @property
+    def job_matcher_agent(self):
+        def create():
+            from agents.job_matcher_agent import JobMatcherAgent
+            return JobMatcherAgent(
+                region=self.region,
+                table_name="career-compass-jobs"
+            )
+        return self._get_or_create("_job_matcher_agent", create)
+    
+    @property
+    def intent_agent(self):
+        def create():
+            from agents.agent_template import AgentTemplate
+            from agents.aws_clients import get_bedrock_model
+            
+            # Bedrock Model for orchestration
+            model = get_bedrock_model(
+                self.region,
+                model_id="us.amazon.nova-pro-v1:0",
+                temperature=0.7,
+                max_tokens=2000,
+                top_p=0.9
+            )
+            # Stateless intent classifier: one fresh Strands agent per classification
+            return AgentTemplate(
+                model=model,
+                system_prompt=self.system_prompt
+            )
+        return self._get_or_create("_intent_agent", create)
+    
+    @property
+    def resume_parser(self):
+        """
+        Local resume parser over the job catalog's skill vocabulary once the catalog is
+        loaded; ResumeParser.default() until then. A cold catalog is never loaded on the
+        caller's thread: if the job matcher exists its catalog starts warming in the
+        background, and resume-only sessions never build the job matcher at all
+        """
+        from agents.resume_parser import ResumeParser
+        
+        job_matcher_agent = self._job_matcher_agent
+        if job_matcher_agent is None:
+            return ResumeParser.default()
+        if not job_matcher_agent.catalog.is_loaded():
+            job_matcher_agent.catalog.warm_in_background()
+            return ResumeParser.default()
+        
+        job_index = job_matcher_agent.load_job_index()
+        cached = self._catalog_parser
+        if cached is None or cached[0] is not job_index or cached[1] != job_index.version:
+            cached = self._catalog_parser = (job_index, job_index.version, ResumeParser.from_job_index(job_index))
+        return cached[2]
+    
+    def catalog_resume_agent(self):
+        """Resume Analyzer Agent using the same parser as derive_student_skills"""
+        parser = self.resume_parser
+        resume_agent = self.resume_agent
+        resume_agent.resume_parser = parser
+        return resume_agent
+    
+    def derive_student_skills(self, resume_text: str) -> List[str]:
+        """Skills found in a resume by the local parser (no model call)"""
+        return self.resume_parser.parse(resume_text).skills
+    
+    def recommend_jobs(self, student_skills: Optional[List[str]], resume_text: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Job Matcher recommendations, deriving student_skills from the resume when none
+        are given; the result carries derived_student_skills (None when not derived)
+        """
+        derived_skills = None
+        if not student_skills and resume_text:
+            derived_skills = student_skills = self.derive_student_skills(resume_text)
+            print(f"🧩 Skills derived from resume: {', '.join(derived_skills) or 'none'}")
+        
+        if not student_skills:
+            return {
+                "status": "error",
+                "error": "No skills found; please provide your skills list for job matching.",
+                "derived_student_skills": derived_skills
+            }
         
-        # Create Strands agent for intent classification
-        self.intent_agent = Agent(
-            model=self.model,
-            system_prompt=self.system_prompt
+        result = self.job_matcher_agent.get_recommendations(
+            student_skills=student_skills,
+            experience_level="Entry Level",
+            top_n=3
         )
+        return dict(result, derived_student_skills=derived_skills)
+    
+    def constructed_agents(self) -> List[str]:
+        """Names of the agents built so far in this session"""
+        return [
+            name for name in ("career_agent", "resume_agent", "job_matcher_agent", "intent_agent")
+            if getattr(self, f"_{name}") is not None
+        ]
+    
+    @property
+    def intent_cache(self):
+        """Normalized-query intent memo; the process-wide one unless given"""
+        if self._intent_cache is None:
+            from agents.intent_cache import IntentCache
+            self._intent_cache = IntentCache.shared()
+        return self._intent_cache
     
     def classify_intent(self, user_query: str) -> str:
         """
         Classify user intent to route to appropriate agent
+        Checks the intent cache, then the local classifier, and calls the LLM only
+        when the local classifier is unsure
         
         Args:
             user_query: The user's question or request
@@ -74,6 +221,33 @@ Be precise and choose the most appropriate routing."""
         Returns:
             Intent classification string
         """
+        cached = self.intent_cache.get(user_query)
+        if cached is not None:
+            return cached
+        
+        intent = None
+        if self.use_local_intent_classifier:
+            from agents.intent_classifier import LocalIntentClassifier
+            
+            local_intent, confidence, _ = LocalIntentClassifier.default().predict(user_query)
+            if confidence >= self.intent_confidence_threshold:
+                intent = local_intent
+        
+        if intent is None:
+            intent = self._classify_intent_llm(user_query)
+        
+        if intent is None:
+            # Failed or unclear classification is not cached, so it is retried next time
+            return "CAREER_GUIDANCE"
+        self.intent_cache.put(user_query, intent)
+        return intent
+    
+    def get_intent_cache_stats(self) -> Dict[str, Any]:
+        """Hit rate and size of the intent cache"""
+        return self.intent_cache.get_stats()
+    
+    def _classify_intent_llm(self, user_query: str) -> Optional[str]:
+        """Intent classification with a Nova Pro round trip; None if it fails or is unclear"""
         classification_prompt = f"""Classify this user query:
 
 USER QUERY: "{user_query}"
@@ -91,12 +265,53 @@ Respond with ONLY ONE word: CAREER_GUIDANCE, RESUME_ANALYSIS, JOB_MATCHING, or M
                     if valid in intent:
                         return valid
             
-            # Default to career guidance if unclear
-            return "CAREER_GUIDANCE"
+            # Caller defaults to career guidance if unclear
+            return None
             
         except Exception as e:
             print(f"Error in intent classification: {str(e)}")
-            return "CAREER_GUIDANCE"
+            return None
+    
+    def run_parallel(
+        self,
+        branches: Dict[str, Callable[[], Dict[str, Any]]],
+        timeout_seconds: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run independent agent calls concurrently, each under its own deadline
+        A branch that raises, times out or returns a non-success status does not
+        affect the others; every branch gets an outcome:
+        {"status": "success"|"error"|"timeout", "result"|"error", "elapsed_ms"}
+        
+        A timeout only abandons a branch: one that is already running keeps its
+        worker until the agent call returns. Deadlines count from submission, so
+        branches queued behind hung ones time out and are cancelled before starting
+        """
+        timeout = self.branch_timeout_seconds if timeout_seconds is None else timeout_seconds
+        started = {}
+        for name, call in branches.items():
+            started[name] = (time.monotonic(), self.branch_executor.submit(call))
+        
+        outcomes = {}
+        for name, (submitted_at, future) in started.items():
+            remaining = timeout - (time.monotonic() - submitted_at)
+            try:
+                result = future.result(timeout=max(remaining, 0))
+                if isinstance(result, dict) and result.get('status', 'success') != 'success':
+                    outcome = {"status": "error", "error": result.get('error') or "Agent failed", "result": result}
+                else:
+                    outcome = {"status": "success", "result": result}
+            except FutureTimeoutError:
+                future.cancel()
+                print(f"⏱️ Branch {name} timed out after {timeout}s")
+                outcome = {"status": "timeout", "error": f"Timed out after {timeout} seconds"}
+            except Exception as e:
+                print(f"Error in branch {name}: {str(e)}")
+                outcome = {"status": "error", "error": str(e)}
+            outcome["elapsed_ms"] = (time.monotonic() - submitted_at) * 1000
+            outcomes[name] = outcome
+        
+        return outcomes
     
     def process_query(
         self,
@@ -110,7 +325,8 @@ Respond with ONLY ONE word: CAREER_GUIDANCE, RESUME_ANALYSIS, JOB_MATCHING, or M
         Args:
             user_query: The user's question
             resume_text: Optional resume text for analysis
-            student_skills: Optional list of skills for job matching
+            student_skills: Optional list of skills for job matching; derived from
+                resume_text by the local parser when omitted
             
         Returns:
             Dictionary with response and metadata
@@ -139,7 +355,7 @@ Respond with ONLY ONE word: CAREER_GUIDANCE, RESUME_ANALYSIS, JOB_MATCHING, or M
                         "agent_used": None
                     }
                 
-                result = self.resume_agent.analyze_resume(resume_text)
+                result = self.catalog_resume_agent().analyze_resume(resume_text)
                 return {
                     "status": result['status'],
                     "intent": intent,
@@ -148,19 +364,15 @@ Respond with ONLY ONE word: CAREER_GUIDANCE, RESUME_ANALYSIS, JOB_MATCHING, or M
                 }
             
             elif intent == "JOB_MATCHING":
-                if not student_skills:
+                if not student_skills and not resume_text:
                     return {
                         "status": "error",
                         "intent": intent,
-                        "response": "Please provide your skills list for job matching.",
+                        "response": "Please provide your skills list (or your resume) for job matching.",
                         "agent_used": None
                     }
                 
-                result = self.job_matcher_agent.get_recommendations(
-                    student_skills=student_skills,
-                    experience_level="Entry Level",
-                    top_n=3
-                )
+                result = self.recommend_jobs(student_skills, resume_text)
                 
                 if result['status'] == 'success':
                     return {
@@ -168,7 +380,8 @@ Respond with ONLY ONE word: CAREER_GUIDANCE, RESUME_ANALYSIS, JOB_MATCHING, or M
                         "intent": intent,
                         "response": result['ai_analysis'],
                         "match_data": result['match_data'],
-                        "agent_used": "Job Matcher Agent"
+                        "agent_used": "Job Matcher Agent",
+                        "derived_student_skills": result['derived_student_skills']
                     }
                 else:
                     return {
@@ -179,24 +392,33 @@ Respond with ONLY ONE word: CAREER_GUIDANCE, RESUME_ANALYSIS, JOB_MATCHING, or M
                     }
             
             elif intent == "MULTI_AGENT":
-                # Handle multi-agent workflow
+                # Handle multi-agent workflow: the specialists are independent, so
+                # they run in parallel and the workflow takes as long as the slowest.
+                # Agent construction and skill derivation happen inside the branches,
+                # under their deadlines (construction is guarded by a lock)
+                branches = {}
+                if resume_text:
+                    branches['resume_analysis'] = lambda: self.catalog_resume_agent().analyze_resume(resume_text)
+                if student_skills or resume_text:
+                    branches['job_recommendations'] = lambda: self.recommend_jobs(student_skills, resume_text)
+                
+                outcomes = self.run_parallel(branches)
+                derived_skills = outcomes.get('job_recommendations', {}).get('result', {}).get('derived_student_skills')
                 responses = {}
                 
-                # Analyze resume if provided
-                if resume_text:
-                    resume_result = self.resume_agent.analyze_resume(resume_text)
-                    responses['resume_analysis'] = resume_result['analysis']
+                if outcomes.get('resume_analysis', {}).get('status') == 'success':
+                    responses['resume_analysis'] = outcomes['resume_analysis']['result']['analysis']
                 
-                # Match jobs if skills provided
-                if student_skills:
-                    job_result = self.job_matcher_agent.get_recommendations(
-                        student_skills=student_skills,
-                        experience_level="Entry Level",
-                        top_n=3
-                    )
-                    if job_result['status'] == 'success':
-                        responses['job_recommendations'] = job_result['ai_analysis']
-                        responses['match_data'] = job_result['match_data']
+                if outcomes.get('job_recommendations', {}).get('status') == 'success':
+                    job_result = outcomes['job_recommendations']['result']
+                    responses['job_recommendations'] = job_result['ai_analysis']
+                    responses['match_data'] = job_result['match_data']
+                
+                # Keep whatever finished; name what did not
+                failed_branches = {
+                    name: outcome['error'] for name, outcome in outcomes.items()
+                    if outcome['status'] != 'success'
+                }
                 
                 # Combine responses
                 combined_response = "## Multi-Agent Analysis"
@@ -204,13 +426,18 @@ Respond with ONLY ONE word: CAREER_GUIDANCE, RESUME_ANALYSIS, JOB_MATCHING, or M
                     combined_response += "### Resume Analysis" + responses['resume_analysis'] + ""
                 if 'job_recommendations' in responses:
                     combined_response += "### Job Recommendations" + responses['job_recommendations']
+                for name, error in failed_branches.items():
+                    combined_response += f"_{name.replace('_', ' ').title()} unavailable: {error}_"
                 
                 return {
-                    "status": "success",
+                    "status": "success" if responses or not outcomes else "error",
                     "intent": intent,
                     "response": combined_response,
                     "agent_used": "Multiple Agents",
-                    "detailed_responses": responses
+                    "detailed_responses": responses,
+                    "failed_branches": failed_branches,
+                    "derived_student_skills": derived_skills,
+                    "branch_timings_ms": {name: outcome['elapsed_ms'] for name, outcome in outcomes.items()}
                 }
             
             else:
@@ -233,9 +460,27 @@ Respond with ONLY ONE word: CAREER_GUIDANCE, RESUME_ANALYSIS, JOB_MATCHING, or M
         """Direct access to Career Guidance Agent"""
         return self.career_agent.chat(query)
     
+    def stream_career_advice(self, query: str) -> Iterator[str]:
+        """Career Guidance Agent answer as a stream of text deltas"""
+        return self.career_agent.chat_stream(query)
+    
     def analyze_resume(self, resume_text: str) -> Dict[str, Any]:
         """Direct access to Resume Analyzer Agent"""
-        return self.resume_agent.analyze_resume(resume_text)
+        return self.catalog_resume_agent().analyze_resume(resume_text)
+    
+    def rank_catalog_for_resume(self, resume_text: str, top_k: int = 5) -> Dict[str, Any]:
+        """
+        Resume-to-jobs report over the whole catalog: a local TF-IDF shortlist of
+        top_k postings, then one batched model call to rerank them
+        """
+        from agents.job_shortlist import JobShortlister
+        
+        job_index = self.job_matcher_agent.load_job_index()
+        version = (id(job_index), job_index.version)
+        shortlister = self._catalog_shortlister
+        if shortlister is None or shortlister.version != version:
+            shortlister = self._catalog_shortlister = JobShortlister.from_job_index(job_index)
+        return self.catalog_resume_agent().compare_with_jobs(resume_text, shortlister, top_k=top_k)
     
     def match_jobs(self, student_skills: List[str]) -> Dict[str, Any]:
         """Direct access to Job Matcher Agent"""
@@ -0,0 +1,87 @@
+import os
+import sys
+import time
+import random
+import argparse
+from types import SimpleNamespace
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.resume_batch import BulkResumeScorer, iter_resumes
+from agents.resume_analyzer_agent import ResumeAnalysis, SectionAnalysis
+
+
+class StubResumeModel:
+    """
+    Stand-in for the Strands agent inside ResumeAnalyzerAgent: fixed latency, a score
+    derived from the prompt, and an optional failure rate to exercise retries
+    """
+
+    def __init__(self, latency_seconds: float = 0.2, failure_rate: float = 0.0, seed: int = 7):
+        self.latency_seconds = latency_seconds
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.calls = 0
+
+    def __call__(self, prompt, structured_output_model=None):
+        self.calls += 1
+        time.sleep(self.latency_seconds)
+        if self.random.random() < self.failure_rate:
+            raise RuntimeError("ThrottlingException (stub)")
+        score = 5.0 + (sum(map(ord, prompt)) % 50) / 10
+        return SimpleNamespace(structured_output=ResumeAnalysis(
+            score=score,
+            summary="Stub analysis.",
+            strengths=["Relevant projects"],
+            gaps=["Few quantified results"],
+            sections=[SectionAnalysis(name="Projects", assessment="Stub.")],
+            recommendations=["Quantify impact"]
+        ))
+
+
+def build_analyzer(region: str, stub: bool, stub_latency: float, stub_failure_rate: float):
+    from agents.resume_analyzer_agent import ResumeAnalyzerAgent
+    from agents.response_cache import ResponseCache
+
+    analyzer = ResumeAnalyzerAgent(region=region, response_cache=ResponseCache() if stub else None)
+    if stub:
+        analyzer.agent = StubResumeModel(stub_latency, stub_failure_rate)
+    return analyzer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a directory or JSONL file of resumes")
+    parser.add_argument("source", help="Directory of .txt/.md resumes, or JSONL with id/text rows")
+    parser.add_argument("--output", default="resume_scores.jsonl", help="Results JSONL, also the resume checkpoint")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rps", type=float, default=1.0, help="Model calls started per second")
+    parser.add_argument("--burst", type=float, default=None)
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--region", default="us-west-2")
+    parser.add_argument("--stub", action="store_true", help="Use a stub model instead of Bedrock")
+    parser.add_argument("--stub-latency", type=float, default=0.2)
+    parser.add_argument("--stub-failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    analyzer = build_analyzer(args.region, args.stub, args.stub_latency, args.stub_failure_rate)
+    scorer = BulkResumeScorer(
+        analyzer,
+        args.output,
+        max_concurrency=args.concurrency,
+        requests_per_second=args.rps,
+        burst=args.burst,
+        max_retries=args.retries
+    )
+    stats = scorer.run(iter_resumes(args.source))
+
+    print("=" * 70)
+    print(f"BULK RESUME SCORING -> {args.output}")
+    print("=" * 70)
+    for key, value in stats.items():
+        print(f"{key:<22} {value}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
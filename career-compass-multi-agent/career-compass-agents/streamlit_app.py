@@ -53,18 +53,22 @@ if page == "💬 Chat Assistant":
     
     if st.button("Ask", type="primary"):
         if user_query:
-            with st.spinner("🤔 Thinking..."):
-                result = st.session_state.orchestrator.get_career_advice(user_query)
-                
-                # Add to chat history
-                st.session_state.chat_history.append({
-                    "query": user_query,
-                    "response": result
-                })
-                
-                # Display response
-                st.success("✅ Response:")
-                st.markdown(result)
+            st.success("✅ Response:")
+            placeholder = st.empty()
+            placeholder.markdown("🤔 Thinking...")
+            
+            # Render the answer token by token as the model streams it
+            result = ""
+            for delta in st.session_state.orchestrator.stream_career_advice(user_query):
+                result += delta
+                placeholder.markdown(result + "▌")
+            placeholder.markdown(result)
+            
+            # Add to chat history
+            st.session_state.chat_history.append({
+                "query": user_query,
+                "response": result
+            })
         else:
             st.warning("Please enter a question!")
     
@@ -103,6 +107,7 @@ elif page == "📄 Resume Analyzer":
             st.success("✅ Resume uploaded successfully!")
         
         analyze_button = st.button("Analyze Resume", type="primary")
+        rank_button = st.button("Rank Jobs for My Resume")
     
     with col2:
         st.subheader("Analysis Results")
@@ -119,6 +124,26 @@ elif page == "📄 Resume Analyzer":
                         st.error(f"❌ Error: {result.get('error', 'Analysis failed')}")
             else:
                 st.warning("Please upload or paste your resume first!")
+        
+        if rank_button:
+            if resume_text:
+                with st.spinner("🔍 Ranking the job catalog against your resume..."):
+                    report = st.session_state.orchestrator.rank_catalog_for_resume(resume_text, top_k=5)
+                    
+                    st.success(f"✅ Ranked {report['jobs_considered']} jobs")
+                    if not report['llm_reranked']:
+                        st.info("Showing the quick local ranking (AI rerank unavailable)")
+                    for ranking in report['rankings']:
+                        score = f"{ranking['fit_score']:g}/10" if ranking['fit_score'] is not None else f"{ranking['shortlist_score']:.2f}"
+                        with st.expander(f"{ranking['title']} at {ranking['company']} ({score})"):
+                            if ranking['rationale']:
+                                st.markdown(ranking['rationale'])
+                            st.markdown(f"**Matching skills:** {', '.join(ranking['matching_skills']) or 'None'}")
+                            st.markdown(f"**Missing skills:** {', '.join(ranking['missing_skills']) or 'None'}")
+                            if ranking['next_step']:
+                                st.markdown(f"**Next step:** {ranking['next_step']}")
+            else:
+                st.warning("Please upload or paste your resume first!")
 
 # Page 3: Job Matcher
 elif page == "💼 Job Matcher":
@@ -208,16 +233,16 @@ elif page == "🎯 Complete Analysis":
     )
     
     # Skills input
-    st.subheader("2. Your Skills")
+    st.subheader("2. Your Skills (optional)")
     skills_input = st.text_input(
-        "Enter your skills (comma-separated):",
+        "Enter your skills (comma-separated), or leave blank to use the skills found in your resume:",
         placeholder="e.g., Python, React, AWS, Docker"
     )
     
     # Analyze button
     if st.button("Run Complete Analysis", type="primary"):
-        if resume_text and skills_input:
-            skills_list = [s.strip() for s in skills_input.split(',') if s.strip()]
+        if resume_text:
+            skills_list = [s.strip() for s in skills_input.split(',') if s.strip()] or None
             
             with st.spinner("🔍 Running comprehensive analysis..."):
                 result = st.session_state.orchestrator.process_query(
@@ -227,14 +252,21 @@ elif page == "🎯 Complete Analysis":
                 )
                 
                 if result['status'] == 'success':
-                    st.success("✅ Complete Analysis Ready!")
+                    if result.get('derived_student_skills'):
+                        st.info("🧩 Skills found in your resume: " + ", ".join(result['derived_student_skills']))
+                    if result.get('failed_branches'):
+                        st.warning("⚠️ Partial analysis: " + ", ".join(
+                            f"{name.replace('_', ' ')} ({error})" for name, error in result['failed_branches'].items()
+                        ))
+                    else:
+                        st.success("✅ Complete Analysis Ready!")
                     
                     # Display combined response
                     st.markdown(result['response'])
                 else:
                     st.error(f"❌ Error: {result.get('response', 'Analysis failed')}")
         else:
-            st.warning("Please provide both your resume and skills!")
+            st.warning("Please provide your resume!")
 
 # Footer
 st.markdown("---")
@@ -0,0 +1,46 @@
+import os
+import sys
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.agent_template import AgentTemplate
+from benchmark_agent_history import StubTokenModel, run_benchmark, run_calls
+
+
+def test_per_call_tokens_and_rss_stay_flat():
+    model = StubTokenModel()
+    template = AgentTemplate(model=model, system_prompt="You are a resume analyzer.", callback_handler=None)
+    result = run_calls(template, model, 1000)
+
+    assert result["first_input_tokens"] == result["last_input_tokens"]
+    assert result["rss_growth_mb"] < 20
+    print(f"✅ 1000 calls at {result['last_input_tokens']:.0f} input tokens each, RSS +{result['rss_growth_mb']:.1f} MB")
+
+
+def test_stateless_beats_long_lived_agent():
+    legacy, stateless = run_benchmark(calls=100, legacy_calls=100)
+    assert legacy["last_input_tokens"] > 10 * stateless["last_input_tokens"]
+    print("✅ Long-lived agent re-sends history; the template does not")
+
+
+def test_scoped_conversation():
+    model = StubTokenModel()
+    template = AgentTemplate(model=model, system_prompt="You are a career coach.", callback_handler=None)
+
+    with template.conversation() as agent:
+        agent("What does a cloud engineer do?")
+        agent("And what should I learn first?")
+        assert len(agent.messages) == 4
+    assert agent.messages == []
+    assert model.input_tokens[1] > model.input_tokens[0]  # follow-up sees the first turn
+
+    template("A new, unrelated question")
+    assert model.input_tokens[2] < model.input_tokens[1]
+    print("✅ Multi-turn history only inside an explicit conversation scope")
+
+
+if __name__ == "__main__":
+    test_per_call_tokens_and_rss_stay_flat()
+    test_stateless_beats_long_lived_agent()
+    test_scoped_conversation()
@@ -0,0 +1,87 @@
+import os
+import sys
+import asyncio
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.async_career_guidance_agent import AsyncCareerGuidanceAgent
+from agents.mcp_tools import async_knowledge_base_tool
+from load_test_async_agent import AsyncStubRuntime, StubBedrockServer, run_async
+
+
+class LoopBoundRuntime(AsyncStubRuntime):
+    """Fails like an aioboto3 client when used from a loop other than the one that opened it"""
+
+    def __init__(self, server: StubBedrockServer):
+        super().__init__(server)
+        self.loop = asyncio.get_running_loop()
+
+    def _check_loop(self):
+        if asyncio.get_running_loop() is not self.loop:
+            raise RuntimeError("attached to a different loop")
+
+    async def converse(self, messages, **kwargs):
+        self._check_loop()
+        return await super().converse(messages, **kwargs)
+
+    async def retrieve_and_generate(self, **request):
+        self._check_loop()
+        return await super().retrieve_and_generate(**request)
+
+
+def test_async_process_query_matches_sync_contract():
+    async def scenario():
+        runtime = AsyncStubRuntime(StubBedrockServer(converse_seconds=0, retrieve_seconds=0))
+        async with AsyncCareerGuidanceAgent("STUBKB", bedrock_runtime=runtime, bedrock_agent_runtime=runtime) as agent:
+            agent.kb_tool.semantic_cache = None
+            return await agent.process_query("What does a cloud engineer do?")
+
+    result = asyncio.run(scenario())
+    assert set(result) == {"response", "conversation_history", "iterations", "status"}
+    assert result["status"] == "success" and result["iterations"] == 2
+    tool_result = result["conversation_history"][2]["content"][0]["toolResult"]
+    assert tool_result["content"][0]["json"]["answer"].startswith("Knowledge base answer")
+    print("✅ Async process_query returns the sync result shape")
+
+
+def test_agent_reused_across_event_loops():
+    """A second asyncio.run() opens fresh clients instead of reusing the first loop's"""
+    server = StubBedrockServer(converse_seconds=0, retrieve_seconds=0)
+    opened = []
+
+    async def open_client(exit_stack, service_name, region):
+        opened.append(service_name)
+        return LoopBoundRuntime(server)
+
+    original = async_knowledge_base_tool.open_async_client
+    async_knowledge_base_tool.open_async_client = open_client
+    try:
+        agent = AsyncCareerGuidanceAgent("STUBKB")
+        first = asyncio.run(agent.process_query("What does a cloud engineer do?", conversation_history=[]))
+        second = asyncio.run(agent.process_query("What does a data analyst do?", conversation_history=[]))
+        asyncio.run(agent.close())
+    finally:
+        async_knowledge_base_tool.open_async_client = original
+
+    assert first["status"] == "success" and second["status"] == "success"
+    tool_result = second["conversation_history"][2]["content"][0]["toolResult"]
+    assert "status" not in tool_result, tool_result
+    assert sorted(opened) == ["bedrock-agent-runtime"] * 2 + ["bedrock-runtime"] * 2
+    print("✅ One agent served two asyncio.run() calls with per-loop clients")
+
+
+def test_sessions_overlap_on_one_event_loop():
+    server = StubBedrockServer(converse_seconds=0.05, retrieve_seconds=0.02)
+    elapsed = asyncio.run(run_async(sessions=40, concurrency=20, server=server))
+
+    assert server.peak_in_flight == 20
+    # Back to back these 40 sessions would take 40 * 0.12s = 4.8s
+    assert elapsed < 1.5
+    print(f"✅ 40 sessions in {elapsed:.2f}s with {server.peak_in_flight} calls in flight")
+
+
+if __name__ == "__main__":
+    test_async_process_query_matches_sync_contract()
+    test_agent_reused_across_event_loops()
+    test_sessions_overlap_on_one_event_loop()
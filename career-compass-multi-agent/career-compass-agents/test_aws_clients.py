@@ -0,0 +1,39 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.aws_clients import ClientRegistry
+
+
+def test_clients_are_pooled_and_reused_across_threads():
+    registry = ClientRegistry()
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        clients = list(pool.map(lambda _: registry.client("bedrock-runtime", "us-west-2"), range(64)))
+
+    assert all(client is clients[0] for client in clients)
+    assert registry.client("bedrock-runtime", "us-east-1") is not clients[0]
+    assert registry.get_stats()["clients_created"] == 2
+
+    config = clients[0].meta.config
+    assert config.max_pool_connections == 50
+    assert config.tcp_keepalive is True
+    assert config.retries["mode"] == "adaptive"
+    print("✅ One pooled client per service and region, shared by 64 calls on 16 threads")
+
+
+def test_bedrock_models_are_shared_per_settings():
+    registry = ClientRegistry()
+    first = registry.bedrock_model("us-west-2", max_tokens=3000)
+    assert registry.bedrock_model("us-west-2", max_tokens=3000) is first
+    assert registry.bedrock_model("us-west-2", max_tokens=2000) is not first
+    assert first.client.meta.config.max_pool_connections == 50
+    assert registry.get_stats()["models_created"] == 2
+    print("✅ BedrockModel reused for identical inference settings")
+
+
+if __name__ == "__main__":
+    test_clients_are_pooled_and_reused_across_threads()
+    test_bedrock_models_are_shared_per_settings()
@@ -0,0 +1,177 @@
+import os
+import sys
+import time
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.career_guidance_agent import CareerGuidanceAgent
+from agents.mcp_tools.knowledge_base_tool import KnowledgeBaseToolOutput
+
+DELAYS = {"cloud careers": 0.4, "data science careers": 0.2, "interview tips": 0.3, "slow query": 5.0}
+
+
+class SlowKnowledgeBase:
+    """Each query sleeps for its configured delay"""
+
+    def execute(self, query, max_results=5):
+        time.sleep(DELAYS[query])
+        return KnowledgeBaseToolOutput(answer=f"answer: {query}", sources=[], confidence="medium")
+
+
+class MultiToolRuntime:
+    """First turn asks for several tools at once, second turn ends"""
+
+    def __init__(self, queries):
+        self.queries = queries
+        self.tool_results = None
+
+    def converse(self, messages, **kwargs):
+        if self.tool_results is None and messages[-1]["content"][0].get("text"):
+            return {
+                "stopReason": "tool_use",
+                "output": {"message": {"role": "assistant", "content": [
+                    {"toolUse": {"toolUseId": f"t{i}", "name": "query_knowledge_base", "input": {"query": query}}}
+                    for i, query in enumerate(self.queries)
+                ]}}
+            }
+        self.tool_results = [block["toolResult"] for block in messages[-1]["content"]]
+        return {"stopReason": "end_turn", "output": {"message": {"role": "assistant", "content": [{"text": "done"}]}}}
+
+
+class StreamingRuntime:
+    """converse_stream stand-in: a tool call split across deltas, then a streamed answer"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def converse_stream(self, messages, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            events = [
+                {"messageStart": {"role": "assistant"}},
+                {"contentBlockDelta": {"contentBlockIndex": 0, "delta": {"text": "Let me check. "}}},
+                {"contentBlockStart": {"contentBlockIndex": 1, "start": {"toolUse": {"toolUseId": "t0", "name": "query_knowledge_base"}}}},
+                {"contentBlockDelta": {"contentBlockIndex": 1, "delta": {"toolUse": {"input": '{"query": "interv'}}}},
+                {"contentBlockDelta": {"contentBlockIndex": 1, "delta": {"toolUse": {"input": 'iew tips"}'}}}},
+                {"contentBlockStop": {"contentBlockIndex": 1}},
+                {"messageStop": {"stopReason": "tool_use"}}
+            ]
+        else:
+            assert messages[-1]["content"][0]["toolResult"]["toolUseId"] == "t0"
+            events = [{"contentBlockDelta": {"contentBlockIndex": 0, "delta": {"text": word}}} for word in ["Use ", "the ", "STAR ", "method."]]
+            events.append({"messageStop": {"stopReason": "end_turn"}})
+        return {"stream": iter(events)}
+
+
+class TruncatedToolRuntime:
+    """converse_stream stand-in whose tool input is cut off by a max_tokens stop"""
+
+    def __init__(self):
+        self.tool_results = None
+
+    def converse_stream(self, messages, **kwargs):
+        if self.tool_results is None:
+            self.tool_results = []
+            events = [
+                {"contentBlockStart": {"contentBlockIndex": 0, "start": {"toolUse": {"toolUseId": "t0", "name": "query_knowledge_base"}}}},
+                {"contentBlockDelta": {"contentBlockIndex": 0, "delta": {"toolUse": {"input": '{"query": "interv'}}}},
+                {"messageStop": {"stopReason": "max_tokens"}}
+            ]
+        else:
+            self.tool_results = [block["toolResult"] for block in messages[-1]["content"]]
+            events = [
+                {"contentBlockDelta": {"contentBlockIndex": 0, "delta": {"text": "Sorry, try again."}}},
+                {"messageStop": {"stopReason": "end_turn"}}
+            ]
+        return {"stream": iter(events)}
+
+
+def make_agent(queries, timeout, max_tool_workers=4):
+    agent = CareerGuidanceAgent(knowledge_base_id="STUBKB", tool_timeout_seconds=timeout, max_tool_workers=max_tool_workers)
+    agent.bedrock_runtime = MultiToolRuntime(queries)
+    agent.kb_tool.execute = SlowKnowledgeBase().execute
+    return agent
+
+
+def test_tools_run_concurrently_in_order():
+    queries = ["cloud careers", "data science careers", "interview tips"]
+    agent = make_agent(queries, timeout=5)
+
+    start = time.perf_counter()
+    result = agent.process_query("compare cloud and data science careers and interview tips")
+    elapsed = time.perf_counter() - start
+
+    assert result["status"] == "success"
+    tool_results = agent.bedrock_runtime.tool_results
+    assert [r["toolUseId"] for r in tool_results] == ["t0", "t1", "t2"]
+    assert [r["content"][0]["json"]["answer"] for r in tool_results] == [f"answer: {q}" for q in queries]
+    assert elapsed < sum(DELAYS[q] for q in queries) - 0.2
+    print(f"✅ 3 tools in {elapsed:.2f}s (sequential would be {sum(DELAYS[q] for q in queries):.2f}s)")
+
+
+def test_slow_tool_times_out_without_blocking_others():
+    agent = make_agent(["slow query", "interview tips"], timeout=0.6)
+
+    start = time.perf_counter()
+    agent.process_query("a question with one slow lookup")
+    elapsed = time.perf_counter() - start
+
+    slow, fast = agent.bedrock_runtime.tool_results
+    assert slow["status"] == "error" and "timed out" in slow["content"][0]["text"]
+    assert fast["content"][0]["json"]["answer"] == "answer: interview tips"
+    assert elapsed < 1.5
+    print("✅ Timed-out tool reported as an error result")
+
+
+def test_close_abandons_running_tools():
+    agent = make_agent(["slow query", "slow query", "interview tips"], timeout=0.3, max_tool_workers=1)
+    agent.process_query("two hung lookups")
+
+    slow, queued, fast = agent.bedrock_runtime.tool_results
+    assert all(r["status"] == "error" for r in (slow, queued, fast)), "tools queued behind a hung one time out"
+
+    start = time.perf_counter()
+    agent.close()
+    assert time.perf_counter() - start < 0.5, "close() does not wait for the hung tool"
+    print("✅ close() shuts the tool pool down without waiting for abandoned tools")
+
+
+def test_stream_query_yields_deltas_and_handles_tool_use():
+    agent = make_agent([], timeout=5)
+    agent.bedrock_runtime = StreamingRuntime()
+
+    events = list(agent.stream_query("interview tips?"))
+    types = [event["type"] for event in events]
+    assert types == ["text", "tool_use", "text", "text", "text", "text", "done"]
+    assert events[1]["input"] == {"query": "interview tips"}
+
+    done = events[-1]
+    assert done["status"] == "success" and done["response"] == "Use the STAR method."
+    assert done["conversation_history"][1]["content"][1]["toolUse"]["input"] == {"query": "interview tips"}
+
+    agent.bedrock_runtime = StreamingRuntime()
+    assert "".join(agent.chat_stream("interview tips?")) == "Let me check. Use the STAR method."
+    print("✅ Streaming yields text deltas around a mid-stream tool call")
+
+
+def test_stream_query_survives_truncated_tool_input():
+    agent = make_agent([], timeout=5)
+    agent.bedrock_runtime = TruncatedToolRuntime()
+
+    events = list(agent.stream_query("interview tips?"))
+    assert [event["type"] for event in events] == ["text", "done"], "the truncated call is not run"
+
+    (result,) = agent.bedrock_runtime.tool_results
+    assert result["toolUseId"] == "t0" and result["status"] == "error"
+    assert "incomplete tool input" in result["content"][0]["text"]
+    assert events[-1]["status"] == "success"
+    print("✅ Truncated streamed tool input becomes a tool error result")
+
+
+if __name__ == "__main__":
+    test_tools_run_concurrently_in_order()
+    test_slow_tool_times_out_without_blocking_others()
+    test_close_abandons_running_tools()
+    test_stream_query_yields_deltas_and_handles_tool_use()
+    test_stream_query_survives_truncated_tool_input()
@@ -0,0 +1,146 @@
+import os
+import sys
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import boto3
+import pytest
+
+from agents.aws_clients import ClientRegistry
+from agents.intent_cache import IntentCache
+from agents.job_catalog import JobCatalog
+from agents.job_shortlist import JobShortlister
+from agents.response_cache import ResponseCache
+from agents.resume_analyzer_agent import ResumeAnalyzerAgent
+from benchmark_catalog_ranking import StubRerankModel, make_catalog
+from orchestrator_agent import OrchestratorAgent
+
+CLOUD_RESUME = """
+SKILLS
+AWS, Python, Docker, Terraform, Linux
+PROJECTS
+- Automated cloud infrastructure as code with Terraform on AWS for 3 teams
+"""
+
+
+def make_analyzer(latency: float = 0.0):
+    analyzer = ResumeAnalyzerAgent(response_cache=ResponseCache())
+    analyzer.agent = StubRerankModel(latency)
+    return analyzer
+
+
+def test_shortlist_relevance():
+    shortlister = JobShortlister(make_catalog(300))
+    shortlist = shortlister.shortlist(CLOUD_RESUME, ["AWS", "Python", "Docker", "Terraform", "Linux"], top_k=5)
+    assert len(shortlist) == 5
+    assert all("Cloud" in item["job"]["title"] or "DevOps" in item["job"]["title"] for item in shortlist)
+    assert [item["score"] for item in shortlist] == sorted((item["score"] for item in shortlist), reverse=True)
+    print(f"✅ Shortlist: {', '.join(item['job']['title'] for item in shortlist)}")
+
+
+def test_one_batched_call_and_rerank():
+    analyzer = make_analyzer()
+    shortlister = JobShortlister(make_catalog(1000))
+    report = analyzer.compare_with_jobs(CLOUD_RESUME, shortlister, top_k=5)
+
+    assert analyzer.agent.calls == 1 and report["llm_reranked"] and report["jobs_considered"] == 1000
+    assert [ranking["fit_score"] for ranking in report["rankings"]] == [9.0, 8.5, 8.0, 7.5, 7.0]
+    # The stub scores shortlist order in reverse, so the rerank is visible
+    assert report["rankings"][0]["shortlist_rank"] == 5
+    assert all(skill not in ("AWS", "Python") for ranking in report["rankings"] for skill in ranking["missing_skills"])
+
+    again = analyzer.compare_with_jobs(CLOUD_RESUME, shortlister, top_k=5)
+    assert again["cached"] and analyzer.agent.calls == 1
+    print(f"✅ 1000 jobs ranked with one model call (shortlist {report['shortlist_ms']:.1f} ms)")
+
+
+def test_local_ranking_when_model_fails():
+    analyzer = make_analyzer()
+
+    def failing(prompt, structured_output_model=None):
+        raise RuntimeError("ModelTimeout")
+
+    analyzer.agent = failing
+    report = analyzer.compare_with_jobs(CLOUD_RESUME, JobShortlister(make_catalog(50)), top_k=3)
+    assert report["status"] == "success" and not report["llm_reranked"]
+    assert report["error"] == "ModelTimeout"
+    assert [ranking["shortlist_rank"] for ranking in report["rankings"]] == [1, 2, 3]
+    print("✅ Falls back to the local shortlist ranking")
+
+
+def test_orchestrator_reuses_shortlister_per_catalog_version():
+    class StubJobMatcher:
+        catalog = JobCatalog(loader=lambda: make_catalog(100))
+
+        def load_job_index(self):
+            return self.catalog.get_index()
+
+    orchestrator = OrchestratorAgent(intent_cache=IntentCache())
+    orchestrator._job_matcher_agent = StubJobMatcher()
+    orchestrator._resume_agent = make_analyzer()
+
+    first = orchestrator.rank_catalog_for_resume(CLOUD_RESUME, top_k=3)
+    shortlister = orchestrator._catalog_shortlister
+    orchestrator.rank_catalog_for_resume(CLOUD_RESUME, top_k=3)
+    assert orchestrator._catalog_shortlister is shortlister
+
+    orchestrator.job_matcher_agent.load_job_index().upsert({"job_id": "NEW1", "title": "Cloud Engineer", "required_skills": ["AWS"], "description": "Cloud"})
+    orchestrator.rank_catalog_for_resume(CLOUD_RESUME, top_k=3)
+    assert orchestrator._catalog_shortlister is not shortlister
+    assert len(first["rankings"]) == 3
+    print("✅ Shortlister rebuilt only when the catalog changes")
+
+
+def test_descriptions_survive_catalog_projection():
+    """Jobs loaded through the matcher's projected scan still carry descriptions for both stages"""
+    mock_aws = pytest.importorskip("moto").mock_aws
+    descriptions = {
+        "J1": "Build Terraform modules and automate AWS cloud infrastructure as code",
+        "J2": "Design mobile user interfaces and prototypes in Figma",
+        "J3": "Write firmware for embedded sensors"
+    }
+
+    with mock_aws():
+        ClientRegistry.reset_default()
+        JobCatalog.clear_shared()
+        try:
+            from agents.job_matcher_agent import JobMatcherAgent
+
+            table = boto3.resource('dynamodb', region_name="us-west-2").create_table(
+                TableName="career-compass-jobs",
+                KeySchema=[{"AttributeName": "job_id", "KeyType": "HASH"}],
+                AttributeDefinitions=[{"AttributeName": "job_id", "AttributeType": "S"}],
+                BillingMode="PAY_PER_REQUEST"
+            )
+            for job_id, description in descriptions.items():
+                # Same title and skills everywhere: only the description tells them apart
+                table.put_item(Item={
+                    "job_id": job_id, "title": "Software Engineer", "company": "TechCorp",
+                    "required_skills": ["Python"], "preferred_skills": [], "description": description
+                })
+
+            job_index = JobMatcherAgent(table_name="career-compass-jobs").load_job_index()
+            assert {job["job_id"]: job.get("description") for job in job_index.all_jobs()} == descriptions
+
+            shortlist = JobShortlister.from_job_index(job_index).shortlist(CLOUD_RESUME, top_k=3)
+            assert shortlist[0]["job"]["job_id"] == "J1"
+            assert shortlist[0]["similarity"] > shortlist[1]["similarity"]
+
+            analyzer = make_analyzer()
+            prompt = analyzer.build_job_fit_prompt(
+                CLOUD_RESUME, analyzer.extract_features(CLOUD_RESUME), [item["job"] for item in shortlist]
+            )
+            assert f"about: {descriptions['J1']}" in prompt
+        finally:
+            ClientRegistry.reset_default()
+            JobCatalog.clear_shared()
+    print("✅ Descriptions reach the TF-IDF shortlist and the rerank prompt through the real loader")
+
+
+if __name__ == "__main__":
+    test_shortlist_relevance()
+    test_one_batched_call_and_rerank()
+    test_local_ranking_when_model_fails()
+    test_orchestrator_reuses_shortlister_per_catalog_version()
+    test_descriptions_survive_catalog_projection()
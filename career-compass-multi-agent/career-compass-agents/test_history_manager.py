@@ -0,0 +1,92 @@
+import os
+import sys
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.career_guidance_agent import CareerGuidanceAgent
+from agents.history_manager import ConversationHistoryManager, estimate_tokens
+from agents.mcp_tools.knowledge_base_tool import KnowledgeBaseToolOutput
+
+
+class RecordingRuntime:
+    """Calls the tool once per question, answers citing source [2], records prompt size"""
+
+    def __init__(self):
+        self.prompt_tokens = []
+
+    def converse(self, messages, **kwargs):
+        self.prompt_tokens.append(estimate_tokens(messages))
+        if "toolResult" in messages[-1]["content"][0]:
+            text = "Based on the knowledge base [2], here is a detailed answer. " * 10
+            return {"stopReason": "end_turn", "output": {"message": {"role": "assistant", "content": [{"text": text}]}}}
+        return {
+            "stopReason": "tool_use",
+            "output": {"message": {"role": "assistant", "content": [{
+                "toolUse": {"toolUseId": f"t{len(self.prompt_tokens)}", "name": "query_knowledge_base",
+                            "input": {"query": messages[-1]["content"][0]["text"]}}
+            }]}}
+        }
+
+
+def stub_kb(query, max_results=5):
+    return KnowledgeBaseToolOutput(
+        answer="Retrieved passages ranked by relevance.",
+        sources=[
+            {"id": i, "content": f"Passage {i} about {query}. " * 30, "location": {"uri": f"file:///doc{i}.txt"}, "score": 1.0 / i}
+            for i in range(1, 6)
+        ],
+        confidence="high"
+    )
+
+
+def test_prompt_size_stays_flat_over_a_long_session():
+    manager = ConversationHistoryManager(max_input_tokens=4000, keep_recent_turns=2)
+    agent = CareerGuidanceAgent(knowledge_base_id="STUBKB", history_manager=manager)
+    agent.bedrock_runtime = RecordingRuntime()
+    agent.kb_tool.execute = stub_kb
+
+    history = []
+    for turn in range(40):
+        result = agent.process_query(f"Question number {turn} about careers?", conversation_history=history)
+        history = result["conversation_history"]
+
+    sizes = agent.bedrock_runtime.prompt_tokens
+    late = sizes[40:]
+    assert max(late) <= 4000 + 2500  # budget plus the in-flight turn's tool payload
+    # Each turn makes two calls (tool request, final answer); compare like with like
+    first_calls = sizes[-20::2]
+    assert max(first_calls) - min(first_calls) < 500
+    assert estimate_tokens(history) <= 4000 * 1.5
+    assert history[0]["content"][0]["text"].startswith(ConversationHistoryManager.SUMMARY_PREFIX)
+    assert "Question number 39" in history[-4]["content"][0]["text"]
+    print(f"✅ Prompt tokens: turn 2 = {sizes[3]}, turn 40 = {sizes[-1]} (uncompacted grows ~{sizes[3] - sizes[1]}/turn)")
+
+
+def test_old_tool_results_keep_only_cited_source_ids():
+    manager = ConversationHistoryManager(max_input_tokens=1, keep_recent_turns=1, max_summary_chars=10 ** 6)
+    manager.summarizer = lambda turns: "(summary)"
+    agent = CareerGuidanceAgent(knowledge_base_id="STUBKB", history_manager=ConversationHistoryManager(max_input_tokens=10 ** 6))
+    agent.bedrock_runtime = RecordingRuntime()
+    agent.kb_tool.execute = stub_kb
+
+    history = []
+    for turn in range(2):
+        history = agent.process_query(f"Question {turn}?", conversation_history=history)["conversation_history"]
+
+    old_turn = [dict(m, content=[dict(b) for b in m["content"]]) for m in history]
+    manager._trim_tool_results(old_turn[:4])
+    trimmed = old_turn[2]["content"][0]["toolResult"]["content"][0]["json"]
+    assert trimmed["source_ids"] == [2]
+    assert "sources" not in trimmed
+
+    # Over budget: everything but the newest turn is folded into the summary
+    manager.compact(history)
+    assert history[0]["content"][0]["text"].endswith("(summary)")
+    assert history[2]["content"][0]["text"] == "Question 1?"
+    print("✅ Old tool results reduced to cited source IDs")
+
+
+if __name__ == "__main__":
+    test_prompt_size_stays_flat_over_a_long_session()
+    test_old_tool_results_keep_only_cited_source_ids()
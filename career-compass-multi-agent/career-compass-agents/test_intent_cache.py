@@ -0,0 +1,62 @@
+import os
+import sys
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.intent_cache import IntentCache, normalize_query
+from orchestrator_agent import OrchestratorAgent
+
+
+def test_normalized_keys():
+    assert normalize_query("  How do I prepare for INTERVIEWS?? ") == "how do i prepare for interviews"
+    assert normalize_query("How do I prepare for interviews", stem=True) == \
+        normalize_query("how do i prepare for interview!", stem=True)
+    assert normalize_query("C++ or C# jobs") == "c++ or c# jobs"
+    print("✅ Case, punctuation and whitespace fold to one key")
+
+
+def test_lru_eviction_and_hit_rate():
+    cache = IntentCache(max_entries=2)
+    cache.put("first question", "CAREER_GUIDANCE")
+    cache.put("second question", "JOB_MATCHING")
+    assert cache.get("First question?") == "CAREER_GUIDANCE"  # now most recent
+    cache.put("third question", "RESUME_ANALYSIS")
+    assert cache.get("second question") is None
+    assert cache.get("first question") == "CAREER_GUIDANCE"
+
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1 and stats["entries"] == 2
+    assert stats["hits"] == 2 and stats["misses"] == 1
+    assert abs(stats["hit_rate"] - 2 / 3) < 1e-9
+    print(f"✅ LRU eviction with hit rate {stats['hit_rate']:.0%}")
+
+
+def test_shared_across_orchestrators():
+    IntentCache.clear_shared()
+    classifications = []
+
+    def make_session():
+        orchestrator = OrchestratorAgent(use_local_intent_classifier=False)
+        orchestrator._classify_intent_llm = lambda query: classifications.append(query) or "CAREER_GUIDANCE"
+        return orchestrator
+
+    first_session, second_session = make_session(), make_session()
+    assert first_session.classify_intent("How do I prepare for interviews?") == "CAREER_GUIDANCE"
+    assert second_session.classify_intent("how do i prepare for interviews") == "CAREER_GUIDANCE"
+    assert len(classifications) == 1
+    assert second_session.get_intent_cache_stats()["hits"] == 1
+
+    # Failed classifications fall back without being cached
+    failing = OrchestratorAgent(use_local_intent_classifier=False)
+    failing._classify_intent_llm = lambda query: None
+    assert failing.classify_intent("Tell me about UX research") == "CAREER_GUIDANCE"
+    assert failing.intent_cache.get("Tell me about UX research") is None
+    IntentCache.clear_shared()
+    print("✅ Popular questions skip classification across sessions")
+
+
+if __name__ == "__main__":
+    test_normalized_keys()
+    test_lru_eviction_and_hit_rate()
+    test_shared_across_orchestrators()
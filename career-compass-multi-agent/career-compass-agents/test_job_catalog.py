@@ -0,0 +1,373 @@
+import os
+import sys
+import tempfile
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import boto3
+import pytest
+
+from agents.job_catalog import (
+    JOB_ATTRIBUTES,
+    DynamoDBStreamChangeFeed,
+    FileChangeFeed,
+    JobCatalog,
+    iter_table_items,
+    query_categories
+)
+
+CATEGORIES = ["Cloud", "DevOps", "Data Science"]
+
+# Point at DynamoDB Local instead with: export DYNAMODB_ENDPOINT=http://localhost:8000
+DYNAMODB_ENDPOINT = os.getenv("DYNAMODB_ENDPOINT")
+
+
+def create_jobs_table(dynamodb, count: int):
+    """Create a career-compass-jobs shaped table with synthetic postings"""
+    table = dynamodb.create_table(
+        TableName="career-compass-jobs-test",
+        KeySchema=[{"AttributeName": "job_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[
+            {"AttributeName": "job_id", "AttributeType": "S"},
+            {"AttributeName": "category", "AttributeType": "S"}
+        ],
+        GlobalSecondaryIndexes=[{
+            "IndexName": "category-index",
+            "KeySchema": [{"AttributeName": "category", "KeyType": "HASH"}],
+            "Projection": {"ProjectionType": "ALL"}
+        }],
+        BillingMode="PAY_PER_REQUEST"
+    )
+    table.wait_until_exists()
+
+    with table.batch_writer() as batch:
+        for i in range(count):
+            batch.put_item(Item={
+                "job_id": f"JOB{i:05d}",
+                "title": f"Engineer {i}",
+                "company": f"Company {i % 20}",
+                "location": "Bangalore, India",
+                "category": CATEGORIES[i % len(CATEGORIES)],
+                "experience_level": "Entry Level",
+                "required_skills": ["AWS", "Python"],
+                "preferred_skills": ["Docker"],
+                "salary_range": "8-12 LPA",
+                "job_type": "Full-time",
+                "description": "x" * 2000
+            })
+    return table
+
+
+def check_parallel_scan(dynamodb):
+    count = 1500
+    table = create_jobs_table(dynamodb, count)
+    client = table.meta.client
+
+    try:
+        serial = list(iter_table_items(client, table.name, total_segments=1))
+        parallel = list(iter_table_items(client, table.name, total_segments=4, attributes=JOB_ATTRIBUTES))
+
+        assert len(serial) == count
+        assert sorted(j['job_id'] for j in parallel) == sorted(j['job_id'] for j in serial)
+
+        # Projection drops attributes nothing reads
+        assert all('job_type' not in j and j['description'] == "x" * 2000 for j in parallel)
+        assert all(j['required_skills'] == ["AWS", "Python"] for j in parallel)
+
+        # Category pushdown: parallel, fully paginated GSI queries
+        per_category = count // len(CATEGORIES)
+        cloud_devops = query_categories(client, table.name, ["Cloud", "DevOps"], attributes=JOB_ATTRIBUTES)
+        assert len(cloud_devops) == 2 * per_category
+        assert {j['category'] for j in cloud_devops} == {"Cloud", "DevOps"}
+
+        # Abandoning the stream early must not hang the scan threads
+        stream = iter_table_items(client, table.name, total_segments=4)
+        next(stream)
+        stream.close()
+
+        print(f"✅ Parallel scan and category queries returned all {count} jobs with projected attributes")
+    finally:
+        table.delete()
+
+
+def test_parallel_scan():
+    """Parallel segmented scan against moto or DynamoDB Local"""
+    print("📝 Parallel segmented scan of the jobs table")
+
+    if DYNAMODB_ENDPOINT:
+        dynamodb = boto3.resource('dynamodb', region_name="us-west-2", endpoint_url=DYNAMODB_ENDPOINT)
+        check_parallel_scan(dynamodb)
+        return
+
+    # Local DynamoDB stand-in from requirements-dev.txt
+    mock_aws = pytest.importorskip("moto").mock_aws
+
+    # Dummy credentials only for the mocked session, so other tests are unaffected
+    session = boto3.session.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name="us-west-2"
+    )
+    with mock_aws():
+        check_parallel_scan(session.resource('dynamodb'))
+
+
+def check_category_pushdown(dynamodb):
+    from agents.aws_clients import ClientRegistry
+    from agents.job_matcher_agent import JobMatcherAgent
+
+    table = create_jobs_table(dynamodb, 90)
+    results = {}
+    try:
+        for scoring_mode in JobMatcherAgent.SCORING_MODES:
+            ClientRegistry.reset_default()
+            JobCatalog.clear_shared()
+            agent = JobMatcherAgent(table_name=table.name, scoring_mode=scoring_mode)
+
+            def match():
+                result = agent.match_jobs(["AWS", "Docker"], preferred_categories=["Cloud"], top_n=5)
+                return result["total_jobs_analyzed"], [(m["job"]["job_id"], m["match_score"]) for m in result["top_matches"]]
+
+            assert not agent.catalog.is_loaded()
+            cold = match()
+            # The cold request started the catalog load; wait for it, then ask again from memory
+            agent.catalog.get_index()
+            warm = match()
+
+            assert cold == warm, f"{scoring_mode}: cold {cold} != warm {warm}"
+            assert cold[0] == 30 and all(job_id in {f"JOB{i:05d}" for i in range(0, 90, 3)} for job_id, _ in cold[1])
+            stats = agent.get_catalog_stats()
+            assert stats["full_loads"] == 1 and stats["hits"] >= 1, "warm request is served from memory"
+            results[scoring_mode] = cold
+    finally:
+        ClientRegistry.reset_default()
+        JobCatalog.clear_shared()
+        table.delete()
+
+    assert results["index"] == results["vectorized"]
+    print(f"✅ Category pushdown gives the same top matches cold and warm: {results['index'][1][:3]}")
+
+
+def test_category_pushdown_cold_and_warm():
+    """Filtered match_jobs gives the same answer before and after the catalog warms, in both scoring modes"""
+    print("📝 Category pushdown on a cold and a warm catalog")
+    mock_aws = pytest.importorskip("moto").mock_aws
+    with mock_aws():
+        check_category_pushdown(boto3.resource('dynamodb', region_name="us-west-2"))
+
+
+def make_job(job_id: str, skills, posted_date: str = "2026-01-05"):
+    return {
+        "job_id": job_id,
+        "title": f"Engineer {job_id}",
+        "company": "TechCorp",
+        "category": "Cloud",
+        "experience_level": "Entry Level",
+        "required_skills": list(skills),
+        "preferred_skills": [],
+        "posted_date": posted_date
+    }
+
+
+def test_catalog_cache_with_change_feed():
+    """TTL cache applies only feed changes on refresh"""
+    print("📝 Job catalog cache with a file-based change feed")
+
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return [make_job("JOB1", ["AWS"]), make_job("JOB2", ["Python"])]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        feed = FileChangeFeed(os.path.join(tmp, "changes.jsonl"))
+        catalog = JobCatalog(loader=loader, change_feed=feed, ttl_seconds=0)
+
+        index = catalog.get_index()
+        assert len(index) == 2
+
+        feed.append("INSERT", "JOB3", make_job("JOB3", ["AWS", "Docker"]))
+        feed.append("MODIFY", "JOB2", make_job("JOB2", ["Python", "AWS"]))
+        feed.append("REMOVE", "JOB1")
+
+        refreshed = catalog.get_index()
+        assert refreshed is not index and len(index) == 2, "readers keep their snapshot"
+        assert sorted(j['job_id'] for j in refreshed.jobs_with_skill("aws")) == ["JOB2", "JOB3"]
+        assert refreshed.get("JOB1") is None
+
+        stats = catalog.get_stats()
+        assert len(loads) == 1
+        assert stats["misses"] == 1 and stats["refreshes"] == 1
+        assert stats["upserts_applied"] == 2 and stats["deletes_applied"] == 1
+
+    print(f"✅ Feed changes applied incrementally: {stats}")
+
+
+def check_stream_change_feed(dynamodb):
+    from agents.aws_clients import ClientRegistry
+
+    ClientRegistry.reset_default()
+    table = dynamodb.create_table(
+        TableName="career-compass-jobs-stream",
+        KeySchema=[{"AttributeName": "job_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "job_id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+        StreamSpecification={"StreamEnabled": True, "StreamViewType": "NEW_IMAGE"}
+    )
+    keys_only = dynamodb.create_table(
+        TableName="career-compass-jobs-keys-only",
+        KeySchema=[{"AttributeName": "job_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "job_id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+        StreamSpecification={"StreamEnabled": True, "StreamViewType": "KEYS_ONLY"}
+    )
+    try:
+        with pytest.raises(ValueError):
+            DynamoDBStreamChangeFeed(keys_only.latest_stream_arn)
+
+        # History from before the snapshot is already in the full load
+        for i in range(5):
+            table.put_item(Item=make_job(f"JOB{i}", ["AWS"]))
+
+        feed = DynamoDBStreamChangeFeed(table.latest_stream_arn)
+        catalog = JobCatalog(
+            loader=lambda: table.scan()['Items'],
+            change_feed=feed,
+            ttl_seconds=0
+        )
+        assert len(catalog.get_index()) == 5
+
+        table.put_item(Item=make_job("JOB5", ["Python"]))
+        table.delete_item(Key={"job_id": "JOB0"})
+        index = catalog.get_index()
+
+        stats = catalog.get_stats()
+        assert stats["upserts_applied"] == 1 and stats["deletes_applied"] == 1, stats
+        assert index.get("JOB0") is None and index.get("JOB5")["required_skills"] == ["Python"]
+
+        # Nothing new: the next refresh applies nothing
+        catalog.get_index()
+        assert catalog.get_stats()["upserts_applied"] == 1
+    finally:
+        ClientRegistry.reset_default()
+        table.delete()
+        keys_only.delete()
+
+
+def test_stream_change_feed_starts_at_snapshot():
+    """A full load checkpoints the stream so refreshes apply only later records"""
+    print("📝 DynamoDB Streams change feed after a full load")
+    mock_aws = pytest.importorskip("moto").mock_aws
+    with mock_aws():
+        check_stream_change_feed(boto3.resource('dynamodb', region_name="us-west-2"))
+    print("✅ Stream refresh started from the snapshot, KEYS_ONLY streams are rejected")
+
+
+def test_catalog_cache_with_watermark():
+    """Without a feed, refreshes fetch only postings at or after the last posted_date"""
+    print("📝 Job catalog cache with a posted_date watermark")
+
+    seen_watermarks = []
+
+    def incremental_loader(watermark):
+        seen_watermarks.append(watermark)
+        return [make_job("JOB2", ["Python"], "2026-01-08"), make_job("JOB3", ["Go"], "2026-01-09")]
+
+    catalog = JobCatalog(
+        loader=lambda: [make_job("JOB1", ["AWS"], "2026-01-05"), make_job("JOB2", ["Python"], "2026-01-08")],
+        incremental_loader=incremental_loader,
+        ttl_seconds=0
+    )
+    catalog.get_index()
+    index = catalog.get_index()
+
+    assert seen_watermarks == ["2026-01-08"]
+    assert len(index) == 3 and catalog.watermark == "2026-01-09"
+    assert catalog.get_stats()["upserts_applied"] == 1, "unchanged JOB2 is not re-applied"
+
+    catalog.ttl_seconds = 3600
+    catalog.get_index()
+    assert catalog.get_stats()["hits"] == 1
+    print("✅ Watermark refresh applied only new postings")
+
+
+def test_failed_refresh_keeps_index():
+    """A loader error during a reload keeps the last good index instead of emptying it"""
+    print("📝 Job catalog cache when DynamoDB fails")
+
+    healthy = [True]
+
+    def loader():
+        if not healthy[0]:
+            raise RuntimeError("ProvisionedThroughputExceededException")
+        return [make_job("JOB1", ["AWS"]), make_job("JOB2", ["Python"])]
+
+    catalog = JobCatalog(loader=loader, ttl_seconds=0, full_reload_seconds=0)
+    index = catalog.get_index()
+
+    healthy[0] = False
+    assert catalog.get_index() is index and len(index) == 2
+    assert catalog.reload() is index
+    assert catalog.get_stats()["failed_refreshes"] == 2
+
+    # A cold catalog stays cold after a failed load, so the next read retries
+    cold = JobCatalog(loader=loader)
+    assert len(cold.get_index()) == 0 and not cold.is_loaded()
+    healthy[0] = True
+    assert len(cold.get_index()) == 2
+    print("✅ Failed refreshes keep serving the previous index")
+
+
+def test_change_feed_compacts_tombstones():
+    """Removes through the change feed do not leave empty slots behind forever"""
+    print("📝 Tombstone compaction under the change feed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        feed = FileChangeFeed(os.path.join(tmp, "changes.jsonl"))
+        catalog = JobCatalog(
+            loader=lambda: [make_job(f"JOB{i}", ["AWS"]) for i in range(8)],
+            change_feed=feed,
+            ttl_seconds=0
+        )
+        catalog.get_index()
+
+        for round_number in range(20):
+            key = f"NEW{round_number}"
+            feed.append("INSERT", key, make_job(key, ["Python"]))
+            feed.append("REMOVE", key)
+            index = catalog.get_index()
+            assert index.tombstones <= catalog.compact_ratio * len(index.jobs)
+
+        assert len(index) == 8 and len(index.jobs_with_skill("aws")) == 8
+        assert index.get("JOB3")["job_id"] == "JOB3"
+        assert catalog.get_stats()["compactions"] > 0
+    print(f"✅ {catalog.get_stats()['compactions']} compactions kept the index at {len(index.jobs)} slots")
+
+
+def test_shared_catalog_keyed_on_config():
+    """Agents with different catalog settings do not silently share one catalog"""
+    JobCatalog.clear_shared()
+    try:
+        first = JobCatalog.shared("us-west-2", "jobs", loader=list, ttl_seconds=300)
+        assert JobCatalog.shared("us-west-2", "jobs", loader=tuple, ttl_seconds=300) is first
+        assert JobCatalog.shared("us-west-2", "jobs", loader=list, ttl_seconds=60) is not first
+        assert JobCatalog.shared("us-west-2", "jobs", loader=list, ttl_seconds=300, change_feed=object()) is not first
+        # Settings bound into the loaders (scan segments) are part of the key too
+        segmented = JobCatalog.shared("us-west-2", "jobs", loader_settings=(8,), loader=list, ttl_seconds=300)
+        assert segmented is not first
+        assert JobCatalog.shared("us-west-2", "jobs", loader_settings=(8,), loader=list, ttl_seconds=300) is segmented
+    finally:
+        JobCatalog.clear_shared()
+    print("✅ Shared catalogs are keyed on their configuration")
+
+
+if __name__ == "__main__":
+    test_parallel_scan()
+    test_category_pushdown_cold_and_warm()
+    test_catalog_cache_with_change_feed()
+    test_stream_change_feed_starts_at_snapshot()
+    test_catalog_cache_with_watermark()
+    test_failed_refresh_keeps_index()
+    test_change_feed_compacts_tombstones()
+    test_shared_catalog_keyed_on_config()
@@ -0,0 +1,198 @@
+import os
+import sys
+import random
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.job_index import JobIndex
+from agents.job_scoring import VectorizedJobScorer
+
+SKILLS = [
+    "Python", "Java", "React", "Node.js", "AWS", "Docker", "Kubernetes", "SQL",
+    "Linux", "Git", "Terraform", "Machine Learning", "Pandas", "TensorFlow"
+]
+CATEGORIES = ["Software Development", "Cloud", "DevOps", "Data Science", "AI/ML", "Security"]
+LEVELS = ["Entry Level", "Mid Level", "Senior Level"]
+
+
+def make_jobs(count: int, seed: int = 7):
+    """Generate synthetic job items shaped like the DynamoDB table"""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        jobs.append({
+            "job_id": f"JOB{i:05d}",
+            "title": f"Engineer {i}",
+            "company": f"Company {i % 50}",
+            "category": rng.choice(CATEGORIES),
+            "experience_level": rng.choice(LEVELS),
+            "required_skills": rng.sample(SKILLS, rng.randint(0, 5)),
+            "preferred_skills": [s.upper() + " " for s in rng.sample(SKILLS, rng.randint(0, 3))]
+        })
+    return jobs
+
+
+def reference_match(jobs, student_skills, experience_level, preferred_categories, top_n):
+    """The original per-job loop from JobMatcherAgent.match_jobs"""
+    def calculate_skill_match(student, job_skills):
+        if not job_skills:
+            return 0.0
+        matching = set(s.lower().strip() for s in student) & set(s.lower().strip() for s in job_skills)
+        return round((len(matching) / len(job_skills)) * 100, 2)
+
+    job_matches = []
+    for job in jobs:
+        required_match = calculate_skill_match(student_skills, job.get('required_skills', []))
+        preferred_match = calculate_skill_match(student_skills, job.get('preferred_skills', []))
+        overall_match = (required_match * 0.7) + (preferred_match * 0.3)
+        exp_match = 1.0 if job.get('experience_level') == experience_level else 0.5
+        cat_match = 1.0
+        if preferred_categories:
+            cat_match = 1.2 if job.get('category') in preferred_categories else 0.8
+        job_matches.append({
+            "job": job,
+            "match_score": round(overall_match * exp_match * cat_match, 2),
+            "required_match": required_match,
+            "preferred_match": preferred_match
+        })
+    job_matches.sort(key=lambda x: x['match_score'], reverse=True)
+    return job_matches[:top_n]
+
+
+def test_job_index_matches_reference():
+    """The indexed heap path must return exactly what the full sort returned"""
+    jobs = make_jobs(500)
+    index = JobIndex(jobs)
+    rng = random.Random(11)
+
+    print("📝 Comparing indexed matching against the original loop")
+    for _ in range(50):
+        student = rng.sample(SKILLS, rng.randint(0, 6))
+        level = rng.choice(LEVELS)
+        categories = rng.choice([None, rng.sample(CATEGORIES, 2)])
+        top_n = rng.choice([1, 5, 20])
+
+        expected = reference_match(jobs, student, level, categories, top_n)
+        actual = index.top_matches(student, level, categories, top_n)
+
+        assert [m['job']['job_id'] for m in actual] == [m['job']['job_id'] for m in expected]
+        for a, e in zip(actual, expected):
+            assert a['match_score'] == e['match_score']
+            assert a['required_match'] == e['required_match']
+            assert a['preferred_match'] == e['preferred_match']
+
+    print("✅ Indexed results identical to the full scan")
+
+
+def test_vectorized_scorer_matches_reference():
+    """The NumPy scorer must be numerically identical to the original loop"""
+    jobs = make_jobs(800, seed=3)
+    scorer = VectorizedJobScorer(JobIndex(jobs))
+    rng = random.Random(5)
+
+    print("📝 Comparing vectorized scoring against the original loop")
+    for _ in range(50):
+        student = rng.sample(SKILLS, rng.randint(0, 6))
+        level = rng.choice(LEVELS)
+        categories = rng.choice([None, rng.sample(CATEGORIES, 2)])
+        top_n = rng.choice([1, 5, 20, 1000])
+
+        expected = reference_match(jobs, student, level, categories, top_n)
+        actual = scorer.top_matches(student, level, categories, top_n)
+
+        assert [m['job']['job_id'] for m in actual] == [m['job']['job_id'] for m in expected]
+        for a, e in zip(actual, expected):
+            assert a['match_score'] == e['match_score']
+            assert a['required_match'] == e['required_match']
+            assert a['preferred_match'] == e['preferred_match']
+
+    print("✅ Vectorized results identical to the full scan")
+
+
+def test_batch_matches_single_student_results():
+    """Batch scoring (in-process and via a process pool) equals per-student scoring"""
+    jobs = make_jobs(300, seed=9)
+    scorer = VectorizedJobScorer(JobIndex(jobs))
+    rng = random.Random(13)
+
+    profiles = [
+        {
+            "student_skills": rng.sample(SKILLS, rng.randint(0, 6)),
+            "experience_level": rng.choice(LEVELS),
+            "preferred_categories": rng.choice([None, rng.sample(CATEGORIES, 2)]),
+            "top_n": rng.choice([3, 5])
+        }
+        for _ in range(40)
+    ]
+
+    print("📝 Comparing batch scoring against single-student scoring")
+    for workers in (None, 2):
+        batch = scorer.top_matches_batch(profiles, max_workers=workers)
+        for profile, matches in zip(profiles, batch):
+            expected = reference_match(
+                jobs,
+                profile['student_skills'],
+                profile['experience_level'],
+                profile['preferred_categories'],
+                profile['top_n']
+            )
+            assert [(m['job']['job_id'], m['match_score']) for m in matches] == \
+                [(m['job']['job_id'], m['match_score']) for m in expected]
+
+    print("✅ Batch results identical to single-student results")
+
+
+def test_skill_demand_aggregates_stay_current():
+    """Incrementally maintained aggregates equal a fresh one-pass build"""
+    jobs = make_jobs(200, seed=21)
+    for i, job in enumerate(jobs):
+        job["salary_range"] = f"{4 + i % 5}-{9 + i % 7} LPA"
+    index = JobIndex(jobs)
+
+    print("📝 Checking skill demand aggregates")
+    python_jobs = [
+        j for j in jobs
+        if "python" in {s.lower().strip() for s in j['required_skills'] + j['preferred_skills']}
+    ]
+    demand = index.skill_demand("Python")
+    assert demand["total_jobs"] == len(python_jobs)
+    assert sum(demand["categories"].values()) == len(python_jobs)
+
+    # Apply updates and deletes, then compare with a rebuild from scratch
+    rng = random.Random(2)
+    for job in rng.sample(jobs, 30):
+        index.remove(job["job_id"])
+    for job in rng.sample(jobs, 30):
+        updated = dict(job, required_skills=rng.sample(SKILLS, 3), category=rng.choice(CATEGORIES))
+        index.upsert(updated)
+
+    def normalized(demand):
+        # Display spelling depends on which posting was seen first
+        for item in demand["complementary_skills"]:
+            item["skill"] = item["skill"].lower()
+        return demand
+
+    rebuilt = JobIndex(index.all_jobs())
+    for skill in SKILLS:
+        assert normalized(index.skill_demand(skill)) == normalized(rebuilt.skill_demand(skill)), skill
+
+    print("✅ Aggregates match a fresh build after incremental changes")
+
+
+def test_sparse_candidates_are_padded():
+    """Fewer candidates than top_n are padded with zero-score jobs in catalog order"""
+    jobs = make_jobs(30)
+    index = JobIndex(jobs)
+    result = index.top_matches(["Cobol"], top_n=3)
+    assert [m['job']['job_id'] for m in result] == ["JOB00000", "JOB00001", "JOB00002"]
+    assert all(m['match_score'] == 0 for m in result)
+    print("✅ Zero-overlap queries padded in catalog order")
+
+
+if __name__ == "__main__":
+    test_job_index_matches_reference()
+    test_vectorized_scorer_matches_reference()
+    test_batch_matches_single_student_results()
+    test_skill_demand_aggregates_stay_current()
+    test_sparse_candidates_are_padded()
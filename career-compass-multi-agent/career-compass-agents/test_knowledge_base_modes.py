@@ -0,0 +1,44 @@
+import os
+import sys
+import tempfile
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.mcp_tools.knowledge_base_tool import select_passages
+from agents.mcp_tools.local_retriever import LocalRetriever
+from benchmark_knowledge_base_modes import DOCUMENTS_DIR, QUERIES, run_mode
+
+
+def test_select_passages_deduplicates_and_budgets():
+    sources = [
+        {"content": "A line one\nA line two\nShared line", "location": {"uri": "a"}, "score": 0.9},
+        {"content": "shared   LINE\nA line two", "location": {"uri": "b"}, "score": 0.8},
+        {"content": "Shared line\nB fresh line", "location": {"uri": "c"}, "score": 0.7},
+        {"content": "word " * 200, "location": {"uri": "d"}, "score": 0.6}
+    ]
+    passages = select_passages(sources, max_chunks=5, max_chunk_chars=100, max_total_chars=150)
+
+    assert [p["location"]["uri"] for p in passages] == ["a", "c", "d"]
+    assert passages[1]["content"] == "B fresh line"  # line already sent with "a" is trimmed
+    assert sum(len(p["content"]) for p in passages) <= 150 + len(" ...")
+    assert passages[2]["content"].endswith(" ...")
+    print("✅ Overlapping passages deduplicated within the chunk budget")
+
+
+def test_retrieve_mode_skips_the_inner_generation():
+    with tempfile.TemporaryDirectory() as index_dir:
+        retriever = LocalRetriever(DOCUMENTS_DIR, index_dir=index_dir)
+        generate = run_mode("retrieve_and_generate", retriever, QUERIES[:2], latency_scale=0)
+        retrieve = run_mode("retrieve", retriever, QUERIES[:2], latency_scale=0)
+
+    assert generate["kb_calls"]["retrieve_and_generate"] == 2
+    assert retrieve["kb_calls"] == {"retrieve": 2, "retrieve_and_generate": 0}
+    assert retrieve["generations"] == generate["generations"] - 2
+    assert retrieve["input_tokens"] < generate["input_tokens"]
+    print(f"✅ Retrieve-only: {retrieve['input_tokens']} vs {generate['input_tokens']} input tokens")
+
+
+if __name__ == "__main__":
+    test_select_passages_deduplicates_and_budgets()
+    test_retrieve_mode_skips_the_inner_generation()
@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.mcp_tools.knowledge_base_tool import KnowledgeBaseTool
+from agents.mcp_tools.local_retriever import LocalRetriever, chunk_document
+
+DOCUMENTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "knowledge-base-documents")
+
+
+def test_chunks_overlap_on_line_boundaries():
+    text = "\n".join(f"line {i} " + "word " * 8 for i in range(20))
+    chunks = chunk_document(text, chunk_words=40, overlap_words=10)
+    assert len(chunks) > 1
+    for previous, current in zip(chunks, chunks[1:]):
+        assert previous.splitlines()[-1] == current.splitlines()[0]
+    print(f"✅ {len(chunks)} overlapping chunks")
+
+
+def test_search_returns_knowledge_base_sources():
+    with tempfile.TemporaryDirectory() as index_dir:
+        retriever = LocalRetriever(DOCUMENTS_DIR, index_dir=index_dir)
+        sources = retriever.search("skills for data scientist", max_results=3)
+
+        assert len(sources) == 3
+        assert set(sources[0]) == {"content", "location", "score"}
+        assert "Data Visualization" in sources[0]["content"]
+        assert sources[0]["location"]["uri"].endswith("job_descriptions_career_paths.txt")
+        assert [s["score"] for s in sources] == sorted((s["score"] for s in sources), reverse=True)
+        assert retriever.search("zzzz qqqq") == []
+
+        # The tool's retrieve() parses the local response like a Bedrock one
+        tool = KnowledgeBaseTool("LOCAL", use_semantic_cache=False, local_retriever=retriever)
+        assert tool.retrieve("skills for data scientist", max_results=3) == sources
+
+        start = time.perf_counter()
+        for _ in range(200):
+            retriever.search("cloud engineer salary")
+        print(f"✅ Local retrieval: {(time.perf_counter() - start) * 1000 / 200:.3f} ms/query")
+
+
+def test_incremental_rebuild_only_reindexes_changed_documents():
+    with tempfile.TemporaryDirectory() as workspace:
+        documents_dir = os.path.join(workspace, "docs")
+        shutil.copytree(DOCUMENTS_DIR, documents_dir, ignore=shutil.ignore_patterns(".kb_index"))
+        retriever = LocalRetriever(documents_dir, check_interval_seconds=0)
+
+        assert retriever.build()["reindexed"] == 3
+        assert retriever.build()["reindexed"] == 0
+        assert retriever.search("quantum basket weaving") == []
+
+        with open(os.path.join(documents_dir, "interview_preparation_guide.txt"), "a", encoding="utf-8") as handle:
+            handle.write("\nQUANTUM BASKET WEAVING\n• Niche hobby interviews\n")
+        assert retriever.is_stale()
+
+        # search() notices the change and rebuilds before answering
+        sources = retriever.search("quantum basket weaving", max_results=1)
+        assert "QUANTUM BASKET WEAVING" in sources[0]["content"]
+        assert not retriever.is_stale()
+
+        os.remove(os.path.join(documents_dir, "university_guidance_higher_studies.txt"))
+        stats = retriever.build()
+        assert stats["documents"] == 2 and stats["reindexed"] == 0
+    print("✅ Only changed documents are re-chunked")
+
+
+if __name__ == "__main__":
+    test_chunks_overlap_on_line_boundaries()
+    test_search_returns_knowledge_base_sources()
+    test_incremental_rebuild_only_reindexes_changed_documents()
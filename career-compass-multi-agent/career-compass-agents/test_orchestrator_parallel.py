@@ -0,0 +1,131 @@
+import os
+import sys
+import time
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.intent_cache import IntentCache
+from agents.job_catalog import JobCatalog
+from agents.job_index import JobIndex
+from orchestrator_agent import OrchestratorAgent
+
+
+class SlowResumeAgent:
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def analyze_resume(self, resume_text):
+        time.sleep(self.seconds)
+        return {"status": "success", "analysis": "Strong projects section."}
+
+
+class SlowJobMatcher:
+    def __init__(self, seconds: float, fail: bool = False):
+        self.seconds = seconds
+        self.fail = fail
+        self.catalog = JobCatalog(loader=list)
+        self.catalog.get_index()
+
+    def load_job_index(self):
+        return self.catalog.get_index()
+
+    def get_recommendations(self, student_skills, experience_level, top_n):
+        time.sleep(self.seconds)
+        if self.fail:
+            raise RuntimeError("DynamoDB unavailable")
+        return {"status": "success", "ai_analysis": "Apply to Cloud Engineer roles.", "match_data": {"top_matches": []}}
+
+
+def make_orchestrator(resume_seconds, job_seconds, fail_jobs=False, timeout=5.0):
+    orchestrator = OrchestratorAgent(intent_cache=IntentCache(), branch_timeout_seconds=timeout)
+    orchestrator._resume_agent = SlowResumeAgent(resume_seconds)
+    orchestrator._job_matcher_agent = SlowJobMatcher(job_seconds, fail_jobs)
+    return orchestrator
+
+
+def run_multi_agent(orchestrator):
+    return orchestrator.process_query(
+        "Analyze my resume and recommend suitable jobs",
+        resume_text="Python developer",
+        student_skills=["Python", "AWS"]
+    )
+
+
+def test_branches_run_in_parallel():
+    orchestrator = make_orchestrator(0.4, 0.4)
+    start = time.perf_counter()
+    result = run_multi_agent(orchestrator)
+    elapsed = time.perf_counter() - start
+
+    assert result["intent"] == "MULTI_AGENT" and result["status"] == "success"
+    assert set(result["detailed_responses"]) == {"resume_analysis", "job_recommendations", "match_data"}
+    assert result["failed_branches"] == {}
+    assert elapsed < 0.7, elapsed  # slowest branch, not the sum
+    print(f"✅ Complete analysis in {elapsed:.2f}s with two 0.4s agents")
+
+
+def test_partial_results():
+    failing = run_multi_agent(make_orchestrator(0.05, 0.05, fail_jobs=True))
+    assert failing["status"] == "success"
+    assert "resume_analysis" in failing["detailed_responses"]
+    assert failing["failed_branches"] == {"job_recommendations": "DynamoDB unavailable"}
+
+    start = time.perf_counter()
+    timed_out = run_multi_agent(make_orchestrator(0.05, 2.0, timeout=0.3))
+    assert time.perf_counter() - start < 1.0
+    assert "resume_analysis" in timed_out["detailed_responses"]
+    assert "Timed out" in timed_out["failed_branches"]["job_recommendations"]
+    assert "Job Recommendations unavailable" in timed_out["response"]
+    print("✅ A failed or slow branch leaves the other branch's result intact")
+
+
+def test_skill_derivation_runs_inside_the_job_branch():
+    orchestrator = make_orchestrator(0.05, 0.05, timeout=0.3)
+
+    def slow_derivation(resume_text):
+        time.sleep(2.0)
+        return ["Python"]
+
+    orchestrator.derive_student_skills = slow_derivation
+    start = time.perf_counter()
+    result = orchestrator.process_query("Analyze my resume and recommend suitable jobs", resume_text="Python developer")
+    assert time.perf_counter() - start < 1.0, "derivation is covered by the branch deadline"
+    assert "resume_analysis" in result["detailed_responses"]
+    assert "Timed out" in result["failed_branches"]["job_recommendations"]
+
+    def failing_derivation(resume_text):
+        raise RuntimeError("ProvisionedThroughputExceededException")
+
+    orchestrator.derive_student_skills = failing_derivation
+    failed = orchestrator.process_query("Find jobs that match my profile", resume_text="Python developer")
+    assert failed["status"] == "error" and failed["intent"] == "JOB_MATCHING"
+    assert "ProvisionedThroughputExceededException" in failed["response"]
+    print("✅ Resume skill derivation runs under the branch deadline and fails into an error dict")
+
+
+def test_close_shuts_down_branch_pool():
+    orchestrator = OrchestratorAgent(intent_cache=IntentCache(), max_branch_workers=1)
+    outcomes = orchestrator.run_parallel(
+        {"hung": lambda: time.sleep(2.0), "queued": lambda: {"status": "success"}},
+        timeout_seconds=0.2
+    )
+    assert outcomes["hung"]["status"] == "timeout"
+    assert outcomes["queued"]["status"] == "timeout", "a branch queued behind a hung one fails fast"
+
+    start = time.perf_counter()
+    orchestrator.close()
+    assert time.perf_counter() - start < 0.5, "close() does not wait for the hung branch"
+    try:
+        orchestrator.branch_executor.submit(lambda: None)
+        assert False, "pool should be shut down"
+    except RuntimeError:
+        pass
+    print("✅ close() shuts the branch pool down without waiting for abandoned branches")
+
+
+if __name__ == "__main__":
+    test_branches_run_in_parallel()
+    test_partial_results()
+    test_skill_derivation_runs_inside_the_job_branch()
+    test_close_shuts_down_branch_pool()
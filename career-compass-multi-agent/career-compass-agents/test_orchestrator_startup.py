@@ -0,0 +1,32 @@
+import os
+import sys
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_startup import run_scenario
+
+LAZY_SCENARIO = r"""
+import json, sys
+sys.path.insert(0, {here!r})
+from orchestrator_agent import OrchestratorAgent
+orchestrator = OrchestratorAgent()
+state = {{"after_construct": [m for m in ("strands", "boto3", "numpy") if m in sys.modules]}}
+agent = orchestrator.career_agent
+state["same_instance"] = agent is orchestrator.career_agent
+state["constructed"] = orchestrator.constructed_agents()
+print(json.dumps(state))
+"""
+
+
+def test_specialists_are_built_on_first_use():
+    state = run_scenario(LAZY_SCENARIO)
+    assert "error" not in state, state
+    assert state["after_construct"] == []
+    assert state["same_instance"] is True
+    assert state["constructed"] == ["career_agent"]
+    print("✅ Orchestrator construction imports no strands/boto3; only the used specialist is built")
+
+
+if __name__ == "__main__":
+    test_specialists_are_built_on_first_use()
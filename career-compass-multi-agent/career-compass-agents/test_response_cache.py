@@ -0,0 +1,90 @@
+import os
+import sys
+import time
+import tempfile
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.response_cache import (
+    InMemoryCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+    make_cache_key
+)
+
+
+def test_cache_key_is_content_addressed():
+    """Key ignores dict ordering but changes with content or prompt version"""
+    first = make_cache_key({"skills": ["aws", "python"], "level": "Entry Level"}, "v1")
+    reordered = make_cache_key({"level": "Entry Level", "skills": ["aws", "python"]}, "v1")
+    assert first == reordered
+    assert first != make_cache_key({"skills": ["aws"], "level": "Entry Level"}, "v1")
+    assert first != make_cache_key({"skills": ["aws", "python"], "level": "Entry Level"}, "v2")
+    print("✅ Cache keys are content-addressed")
+
+
+def check_backend(backend):
+    cache = ResponseCache(backend=backend, ttl_seconds=60, max_bytes=30)
+
+    cache.put("a", "x" * 10)
+    cache.put("b", "y" * 10)
+    assert cache.get("a") == "x" * 10  # "a" is now most recently used
+    cache.put("c", "z" * 15)            # 35 bytes > 30: evicts "b"
+    assert cache.get("b") is None
+    assert cache.get("a") == "x" * 10
+    assert cache.get("c") == "z" * 15
+
+    cache.put("huge", "h" * 100)        # Larger than the whole budget: not stored
+    assert cache.get("huge") is None
+
+    stats = cache.get_stats()
+    assert stats["entries"] == 2 and stats["size_bytes"] == 25
+    assert stats["evictions"] == 1 and stats["hits"] == 3 and stats["misses"] == 2
+
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+    assert cache.get("a") is None
+    assert cache.get_stats()["expired"] == 1
+
+
+def test_in_memory_backend_lru_ttl_and_size():
+    check_backend(InMemoryCacheBackend())
+    print("✅ In-memory backend evicts by LRU, TTL and byte budget")
+
+
+def test_sqlite_backend_lru_ttl_and_size():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "responses.db")
+        check_backend(SQLiteCacheBackend(path))
+
+        # Entries survive reopening the file
+        ResponseCache(backend=SQLiteCacheBackend(path)).put("persisted", "analysis")
+        assert ResponseCache(backend=SQLiteCacheBackend(path)).get("persisted") == "analysis"
+    print("✅ SQLite backend evicts by LRU, TTL and byte budget and persists entries")
+
+
+def test_sqlite_byte_total_tracks_writes():
+    """The trigger-maintained byte total matches the rows across replaces, deletes and processes"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "responses.db")
+        backend = SQLiteCacheBackend(path)
+        cache = ResponseCache(backend=backend, max_bytes=2000)
+
+        for i in range(400):
+            cache.put(f"key-{i % 150}", "r" * (10 + i % 37))
+        backend.delete("key-3")
+        # A second connection (as another process would) writes to the same file
+        SQLiteCacheBackend(path).put("other-process", "o" * 40, time.time())
+
+        actual = backend.connection.execute("SELECT COALESCE(SUM(size), 0) FROM response_cache").fetchone()[0]
+        assert backend.size_bytes() == actual and actual <= 2000 + 40
+        assert cache.get_stats()["evictions"] > 0
+    print(f"✅ SQLite byte total stays exact ({actual} bytes) without summing on every eviction")
+
+
+if __name__ == "__main__":
+    test_cache_key_is_content_addressed()
+    test_in_memory_backend_lru_ttl_and_size()
+    test_sqlite_backend_lru_ttl_and_size()
+    test_sqlite_byte_total_tracks_writes()
@@ -0,0 +1,150 @@
+import os
+import sys
+import json
+import time
+import tempfile
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.resume_batch import BulkResumeScorer, TokenBucket, iter_resumes
+from score_resumes import build_analyzer
+
+
+def resume(number: int) -> str:
+    return f"CANDIDATE {number}\nSKILLS\nPython, AWS, Docker\nPROJECTS\n- Built service {number} serving 10k users\n"
+
+
+def read_records(path: str):
+    with open(path, encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle]
+
+
+def read_records_lenient(path: str):
+    records = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                pass
+    return records
+
+
+def test_dedup_concurrency_and_output():
+    with tempfile.TemporaryDirectory() as directory:
+        for number in range(12):
+            with open(os.path.join(directory, f"r{number:02d}.txt"), "w") as handle:
+                handle.write(resume(number % 8))  # r08..r11 repeat r00..r03
+        with open(os.path.join(directory, "notes.pdf"), "w") as handle:
+            handle.write("ignored")
+
+        analyzer = build_analyzer("us-west-2", stub=True, stub_latency=0.1, stub_failure_rate=0.0)
+        output = os.path.join(directory, "scores.jsonl")
+        start = time.perf_counter()
+        stats = BulkResumeScorer(analyzer, output, max_concurrency=4, requests_per_second=100).run(iter_resumes(directory))
+        elapsed = time.perf_counter() - start
+
+        records = read_records(output)
+        assert stats["read"] == 12 and stats["scored"] == 8 and stats["duplicates"] == 4
+        assert analyzer.agent.calls == 8
+        assert len(records) == 12 and all(record["status"] == "success" for record in records)
+        assert {record["duplicate_of"] for record in records if "duplicate_of" in record} == {"r00.txt", "r01.txt", "r02.txt", "r03.txt"}
+        assert elapsed < 0.8 * 8 * 0.1 + 0.3  # calls overlap
+        print(f"✅ 12 resumes, 8 model calls, {elapsed:.2f}s")
+
+
+def test_checkpoint_resumes_after_failures():
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "resumes.jsonl")
+        with open(source, "w") as handle:
+            for number in range(20):
+                handle.write(json.dumps({"id": f"s{number}", "text": resume(number)}) + "\n")
+        output = os.path.join(directory, "scores.jsonl")
+
+        flaky = build_analyzer("us-west-2", stub=True, stub_latency=0.0, stub_failure_rate=0.5)
+        first = BulkResumeScorer(flaky, output, max_concurrency=4, requests_per_second=1000, max_retries=0).run(iter_resumes(source))
+        assert first["failed"] > 0 and first["scored"] + first["failed"] == 20
+
+        with open(output, "a") as handle:
+            handle.write('{"resume_id": "torn')  # crash mid-write
+
+        healthy = build_analyzer("us-west-2", stub=True, stub_latency=0.0, stub_failure_rate=0.0)
+        second = BulkResumeScorer(healthy, output, requests_per_second=1000).run(iter_resumes(source))
+        assert second["skipped"] == first["scored"] and second["scored"] == first["failed"]
+        assert healthy.agent.calls == first["failed"]
+        successes = [record for record in read_records_lenient(output) if record["status"] == "success"]
+        assert sorted(record["resume_id"] for record in successes) == sorted(f"s{number}" for number in range(20))
+        print(f"✅ Re-run skipped {second['skipped']} finished resumes and retried {second['scored']}")
+
+
+def test_malformed_rows_and_repeated_runs():
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "resumes.jsonl")
+        with open(source, "w") as handle:
+            handle.write(json.dumps({"id": "a", "text": resume(1)}) + "\n")
+            handle.write('{"id": "b", "text": "unterminated\n')
+            handle.write('["not", "an", "object"]\n')
+            handle.write(json.dumps({"id": "c", "text": resume(2)}) + "\n")
+        output = os.path.join(directory, "scores.jsonl")
+
+        analyzer = build_analyzer("us-west-2", stub=True, stub_latency=0.0, stub_failure_rate=0.0)
+        scorer = BulkResumeScorer(analyzer, output, requests_per_second=1000)
+        first = scorer.run(iter_resumes(source))
+        assert first["read"] == 4 and first["scored"] == 2 and first["failed"] == 2
+
+        errors = [record for record in read_records(output) if record["status"] == "error"]
+        assert [record["resume_id"] for record in errors] == ["line-2", "line-3"]
+        assert all(record["error"] == "malformed input row" for record in errors)
+
+        # Same scorer again: stats describe this run only
+        second = scorer.run(iter_resumes(source))
+        assert second["read"] == 4 and second["skipped"] == 2 and second["scored"] == 0 and second["failed"] == 2
+        print("✅ Malformed rows recorded as errors; each run reports its own stats")
+
+
+def test_token_bucket_rate():
+    bucket = TokenBucket(rate=20, capacity=2)
+    start = time.perf_counter()
+    for _ in range(12):
+        bucket.acquire()
+    elapsed = time.perf_counter() - start
+    assert 0.4 <= elapsed < 0.8, elapsed  # 2 burst tokens, then 10 at 20/s
+    print(f"✅ Token bucket held 12 calls to {elapsed:.2f}s")
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    for rate in (0, -1):
+        try:
+            TokenBucket(rate=rate)
+        except ValueError:
+            continue
+        raise AssertionError(f"rate={rate} accepted")
+    print("✅ Token bucket rejects a zero rate instead of dividing by it")
+
+
+def test_model_calls_exclude_analysis_cache_hits():
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "resumes.jsonl")
+        with open(source, "w") as handle:
+            for number in range(3):
+                handle.write(json.dumps({"id": f"s{number}", "text": resume(number)}) + "\n")
+
+        analyzer = build_analyzer("us-west-2", stub=True, stub_latency=0.0, stub_failure_rate=0.0)
+        first = BulkResumeScorer(analyzer, os.path.join(directory, "first.jsonl"), requests_per_second=1000).run(iter_resumes(source))
+        assert first["model_calls"] == 3 and first["analysis_cache_hits"] == 0
+
+        # A fresh output file rescores everything, but the analyzer's cache answers it
+        second = BulkResumeScorer(analyzer, os.path.join(directory, "second.jsonl"), requests_per_second=1000).run(iter_resumes(source))
+        assert second["scored"] == 3 and second["model_calls"] == 0 and second["analysis_cache_hits"] == 3
+        assert analyzer.agent.calls == 3
+        print("✅ Results served from the analysis cache are not counted as model calls")
+
+
+if __name__ == "__main__":
+    test_dedup_concurrency_and_output()
+    test_checkpoint_resumes_after_failures()
+    test_malformed_rows_and_repeated_runs()
+    test_token_bucket_rate()
+    test_token_bucket_rejects_non_positive_rate()
+    test_model_calls_exclude_analysis_cache_hits()
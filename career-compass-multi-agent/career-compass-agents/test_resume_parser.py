@@ -0,0 +1,115 @@
+import os
+import sys
+import threading
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.intent_cache import IntentCache
+from agents.job_catalog import JobCatalog
+from agents.job_index import JobIndex
+from agents.resume_parser import ResumeParser
+from orchestrator_agent import OrchestratorAgent
+from test_resume_analyzer import SAMPLE_RESUME
+
+
+def test_parse_sample_resume():
+    features = ResumeParser.default().parse(SAMPLE_RESUME)
+
+    assert {"education", "skills", "projects", "experience", "certifications"} <= set(features.sections)
+    assert {"Python", "C++", "Node.js", "AWS", "Docker", "Scikit-learn"} <= set(features.skills)
+    assert "AWS SageMaker" not in features.skills
+    assert features.emails == ["priya.sharma@email.com"]
+    assert "github.com/priyasharma" in features.links
+    assert "Jun 2024 - Aug 2024" in features.date_ranges
+    assert features.gpa == "8.5/10"
+    assert features.education[0].startswith("Bachelor of Engineering")
+    assert features.missing_sections == []
+    assert "Only 3 of 18 bullet points are quantified" in features.structural_issues
+    assert not set(features.ats_keywords) & set(features.skills)
+    print(f"✅ Parsed {len(features.skills)} skills, ATS suggestions: {', '.join(features.ats_keywords[:5])}")
+
+
+def test_catalog_vocabulary_and_ats_keywords():
+    job_index = JobIndex([
+        {"job_id": "J1", "required_skills": ["Python", "FastAPI", "Kubernetes"], "preferred_skills": ["Helm"]},
+        {"job_id": "J2", "required_skills": ["Figma", "User Research"], "preferred_skills": []},
+    ])
+    parser = ResumeParser.from_job_index(job_index)
+    features = parser.parse("SKILLS\nPython, FastAPI and SQL")
+
+    assert features.skills == ["Python", "FastAPI", "SQL"]
+    assert features.ats_keywords[:2] == ["Kubernetes", "Helm"]
+    assert "Figma" not in features.ats_keywords  # posting shares nothing with the resume
+    assert parser.fingerprint != ResumeParser.default().fingerprint
+    print("✅ Catalog skills recognized; ATS keywords come from overlapping postings")
+
+
+class StubJobMatcher:
+    """Job matcher over a JobCatalog whose loader can be held back"""
+
+    def __init__(self, jobs, released=True):
+        self.released = threading.Event()
+        if released:
+            self.released.set()
+        self.received = {}
+
+        def loader():
+            self.released.wait(5)
+            return jobs
+
+        self.catalog = JobCatalog(loader=loader)
+
+    def load_job_index(self):
+        return self.catalog.get_index()
+
+    def get_recommendations(self, student_skills, experience_level, top_n):
+        self.received["skills"] = student_skills
+        return {"status": "success", "ai_analysis": "Matches.", "match_data": {}}
+
+
+CATALOG_JOBS = [{"job_id": "J1", "required_skills": ["Python", "Flask"], "preferred_skills": ["Jupyter"]}]
+
+
+def test_orchestrator_derives_student_skills():
+    orchestrator = OrchestratorAgent(intent_cache=IntentCache())
+    job_matcher = orchestrator._job_matcher_agent = StubJobMatcher(CATALOG_JOBS)
+    job_matcher.load_job_index()
+
+    result = orchestrator.process_query("Find jobs that match my profile", resume_text=SAMPLE_RESUME + "\nTools: Jupyter")
+    received = job_matcher.received
+
+    assert result["intent"] == "JOB_MATCHING" and result["status"] == "success"
+    assert "Python" in received["skills"] and result["derived_student_skills"] == received["skills"]
+    assert "Jupyter" in received["skills"], "catalog-only skills are recognized"
+
+    # The resume analyzer is handed the very same catalog-backed parser
+    resume_agent = orchestrator.catalog_resume_agent()
+    assert resume_agent.resume_parser is orchestrator.resume_parser
+    assert resume_agent.extract_features(SAMPLE_RESUME + "\nTools: Jupyter").skills == orchestrator.derive_student_skills(SAMPLE_RESUME + "\nTools: Jupyter")
+    print(f"✅ student_skills derived from the resume: {len(received['skills'])} skills")
+
+
+def test_cold_catalog_is_warmed_in_the_background():
+    orchestrator = OrchestratorAgent(intent_cache=IntentCache())
+
+    # Resume-only sessions never build the job matcher
+    assert orchestrator.resume_parser is ResumeParser.default()
+    assert "job_matcher_agent" not in orchestrator.constructed_agents()
+
+    job_matcher = orchestrator._job_matcher_agent = StubJobMatcher(CATALOG_JOBS, released=False)
+    assert orchestrator.resume_parser is ResumeParser.default(), "a cold catalog does not block the caller"
+    assert not job_matcher.catalog.is_loaded()
+
+    job_matcher.released.set()
+    job_matcher.catalog.get_index()
+    assert "Jupyter" in orchestrator.derive_student_skills("Tools: Jupyter, Python")
+    assert job_matcher.catalog.get_stats()["full_loads"] == 1
+    print("✅ Resume parsing uses the default vocabulary until the catalog has warmed")
+
+
+if __name__ == "__main__":
+    test_parse_sample_resume()
+    test_catalog_vocabulary_and_ats_keywords()
+    test_orchestrator_derives_student_skills()
+    test_cold_catalog_is_warmed_in_the_background()
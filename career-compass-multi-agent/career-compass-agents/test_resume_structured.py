@@ -0,0 +1,136 @@
+import os
+import sys
+from types import SimpleNamespace
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.response_cache import ResponseCache
+from agents.resume_analyzer_agent import ResumeAnalysis, ResumeAnalyzerAgent, SectionAnalysis
+
+RESUME = """
+PRIYA SHARMA
+TECHNICAL SKILLS
+Programming: Python, Java, JavaScript
+Cloud: AWS (EC2, S3, Lambda), Git, Docker
+"""
+
+JOB_DESCRIPTION = """Cloud Engineer Intern
+Requirements: Python, AWS, Kubernetes and Terraform.
+Experience with Docker; familiarity with CI/CD."""
+
+
+class StubStructuredAgent:
+    """Counts generations and returns a fixed structured analysis"""
+
+    def __init__(self):
+        self.prompts = []
+
+    def __call__(self, prompt, structured_output_model=None):
+        self.prompts.append(prompt)
+        assert structured_output_model is ResumeAnalysis
+        return SimpleNamespace(structured_output=ResumeAnalysis(
+            score=7.5,
+            summary="Solid cloud fundamentals with one strong internship.",
+            skills=["Python", "Java", "JavaScript", "AWS", "Git", "Docker"],
+            strengths=["Quantified impact", "Cloud certification", "Full-stack projects"],
+            gaps=["No testing experience", "Thin summary", "No links to live demos"],
+            sections=[
+                SectionAnalysis(name="Projects", assessment="Clear and relevant.", suggestions=["Add metrics"]),
+                SectionAnalysis(name="Experience", assessment="One cloud internship with measured impact.")
+            ],
+            ats_keywords=["CI/CD", "Kubernetes"],
+            recommendations=["Add a testing project", "Link GitHub repos"]
+        ))
+
+
+def make_agent():
+    agent = ResumeAnalyzerAgent(response_cache=ResponseCache())
+    agent.agent = StubStructuredAgent()
+    return agent
+
+
+def test_one_generation_for_every_projection():
+    agent = make_agent()
+    full = agent.analyze_resume(RESUME)
+    score = agent.quick_score("  " + RESUME.replace("Python, Java", "Python,   Java") + "\n\n")
+    comparison = agent.compare_with_job(RESUME, JOB_DESCRIPTION)
+
+    assert len(agent.agent.prompts) == 1
+    assert full["status"] == "success" and not full["cached"]
+    assert "### Projects" in full["analysis"] and full["structured"]["score"] == 7.5
+    assert score["cached"] and score["score"] == 7.5 and "Quantified impact" in score["score_analysis"]
+    assert comparison["cached"]
+    assert comparison["matching_skills"] == ["Python", "AWS", "Docker"]
+    assert comparison["missing_skills"] == ["Kubernetes", "Terraform", "CI/CD"]
+    assert comparison["job_requirements"] == ["intern"]
+    assert "Your experience: One cloud internship with measured impact." in comparison["comparison"]
+    print(f"✅ Analysis, score and job comparison from one generation (match {comparison['match_score']}/10)")
+
+
+def test_prose_job_description_compares_only_skills():
+    agent = make_agent()
+    job_description = (
+        "About the role: You will join our platform team to build and operate services on AWS. "
+        "Responsibilities: write tests, review code and mentor interns. "
+        "Requirements: Python and Kubernetes; Terraform is a plus. "
+        "Location: Seattle, WA. Duration: 12 weeks."
+    )
+    comparison = agent.compare_with_job(RESUME, job_description)
+
+    assert comparison["matching_skills"] == ["AWS", "Python"]
+    assert comparison["missing_skills"] == ["Kubernetes", "Terraform"]
+    assert comparison["match_score"] == 5.0
+    assert "location" not in comparison["comparison"].lower()
+    print(f"✅ Prose job description compared on skills only: {comparison['missing_skills']} missing")
+
+
+def test_job_description_without_known_skills_is_not_scored():
+    agent = make_agent()
+    comparison = agent.compare_with_job(
+        RESUME,
+        "Senior Customer Success Manager. 5+ years building client relationships; strong communication."
+    )
+
+    assert comparison["status"] == "success"
+    assert comparison["match_score"] is None and comparison["matching_skills"] == []
+    assert "0/10" not in comparison["comparison"] and "None found" not in comparison["comparison"]
+    assert comparison["job_requirements"] == ["senior", "5+ years of experience"]
+    print("✅ A job description with no vocabulary skills is reported as unscored, not as a poor fit")
+
+
+def test_skill_match_survives_analysis_failure():
+    agent = make_agent()
+
+    def failing(prompt, structured_output_model=None):
+        raise RuntimeError("throttled")
+
+    agent.agent = failing
+    comparison = agent.compare_with_job(RESUME, JOB_DESCRIPTION)
+
+    assert comparison["status"] == "partial_success" and comparison["error"] == "throttled"
+    assert comparison["matching_skills"] == ["Python", "AWS", "Docker"]
+    assert comparison["missing_skills"] == ["Kubernetes", "Terraform", "CI/CD"]
+    assert comparison["match_score"] == 5.0
+    print("✅ Local skill matching is returned when the model analysis fails")
+
+
+def test_failure_is_not_cached():
+    agent = make_agent()
+
+    def failing(prompt, structured_output_model=None):
+        raise RuntimeError("throttled")
+
+    agent.agent = failing
+    assert agent.quick_score(RESUME)["status"] == "error"
+    assert agent.analyze_resume(RESUME)["error"] == "throttled"
+    assert agent.get_response_cache_stats()["entries"] == 0
+    print("✅ Failed analyses return an error dict and are retried next time")
+
+
+if __name__ == "__main__":
+    test_one_generation_for_every_projection()
+    test_prose_job_description_compares_only_skills()
+    test_job_description_without_known_skills_is_not_scored()
+    test_skill_match_survives_analysis_failure()
+    test_failure_is_not_cached()
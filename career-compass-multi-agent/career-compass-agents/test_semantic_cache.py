@@ -0,0 +1,117 @@
+import os
+import sys
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.mcp_tools.knowledge_base_tool import KnowledgeBaseTool
+from agents.mcp_tools.semantic_cache import HashingEmbedder, SemanticCache
+
+
+class StubAgentRuntime:
+    """Counts retrieve_and_generate calls instead of hitting Bedrock"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def retrieve_and_generate(self, **kwargs):
+        self.calls += 1
+        return {
+            "output": {"text": f"Answer {self.calls} for {kwargs['input']['text']}"},
+            "citations": [{
+                "retrievedReferences": [{
+                    "content": {"text": "Data scientists need Python, SQL and statistics."},
+                    "location": {"s3Location": {"uri": "s3://kb/job_descriptions.txt"}},
+                    "metadata": {"score": 0.82}
+                }]
+            }]
+        }
+
+
+def test_paraphrases_hit_and_unrelated_queries_miss():
+    embedder = HashingEmbedder()
+    tool = KnowledgeBaseTool("KB123", semantic_cache=SemanticCache(embedder=embedder))
+    tool.bedrock_agent_runtime = StubAgentRuntime()
+
+    first = tool.execute("skills for data scientist")
+    second = tool.execute("What skills does a data scientist need?")
+    assert tool.bedrock_agent_runtime.calls == 1
+    assert second.answer == first.answer and second.sources == first.sources
+
+    tool.execute("how to prepare for a system design interview")
+    assert tool.bedrock_agent_runtime.calls == 2
+
+    # A different result budget is not served from the cache
+    tool.execute("skills for data scientist", max_results=10)
+    assert tool.bedrock_agent_runtime.calls == 3
+
+    stats = tool.semantic_cache.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 3 and stats["entries"] == 3
+    top_entry = tool.semantic_cache.get_entry_stats()[0]
+    assert top_entry["query"] == "skills for data scientist" and top_entry["hits"] == 1
+    print("✅ Paraphrased questions served from the semantic cache")
+
+
+def test_one_differing_qualifier_misses():
+    """Near-miss questions score above the threshold on the bag of words but need their own answer"""
+    embedder = HashingEmbedder()
+    tool = KnowledgeBaseTool("KB123", semantic_cache=SemanticCache(embedder=embedder))
+    tool.bedrock_agent_runtime = StubAgentRuntime()
+
+    near_misses = [
+        (
+            "What skills and certifications do I need to start a career in cloud computing as a beginner?",
+            "What skills and certifications do I need to start a career in cloud computing as an expert?"
+        ),
+        (
+            "How should I prepare for technical interviews and coding rounds for a software engineer role at a startup?",
+            "How should I prepare for technical interviews and coding rounds for a software engineer role at a bank?"
+        )
+    ]
+    for first, second in near_misses:
+        assert float(embedder.embed(first) @ embedder.embed(second)) >= tool.semantic_cache.similarity_threshold
+        first_answer = tool.execute(first)
+        second_answer = tool.execute(second)
+        assert second_answer.answer != first_answer.answer, second
+
+    assert tool.bedrock_agent_runtime.calls == 4
+    assert tool.semantic_cache.get_stats()["hits"] == 0
+    print("✅ Questions differing in one qualifier are not served each other's answers")
+
+
+def test_semantic_cache_is_opt_in():
+    SemanticCache.clear_shared()
+    assert KnowledgeBaseTool("KB123", bedrock_agent_runtime=StubAgentRuntime()).semantic_cache is None
+    enabled = KnowledgeBaseTool("KB123", bedrock_agent_runtime=StubAgentRuntime(), use_semantic_cache=True)
+    assert enabled.semantic_cache is not None
+    SemanticCache.clear_shared()
+    print("✅ The semantic cache is off unless requested")
+
+
+def test_entry_cap_evicts_least_recently_used():
+    cache = SemanticCache(max_entries=2)
+    cache.put("python developer salary", "salary")
+    cache.put("cloud engineer roadmap", "roadmap")
+    assert cache.get("salary of a python developer") == "salary"
+    cache.put("best universities for masters", "universities")
+
+    assert cache.get("cloud engineer roadmap") is None
+    assert cache.get("python developer salary") == "salary"
+    assert cache.get_stats()["evictions"] == 1
+    print("✅ Entry cap evicts the least recently used query")
+
+
+def test_ttl_expires_entries():
+    cache = SemanticCache(ttl_seconds=-1)
+    cache.put("devops interview tips", "tips")
+    assert cache.get("devops interview tips") is None
+    assert cache.get_stats()["expired"] == 1
+    print("✅ Expired entries are dropped")
+
+
+if __name__ == "__main__":
+    test_paraphrases_hit_and_unrelated_queries_miss()
+    test_one_differing_qualifier_misses()
+    test_semantic_cache_is_opt_in()
+    test_entry_cap_evicts_least_recently_used()
+    test_ttl_expires_entries()
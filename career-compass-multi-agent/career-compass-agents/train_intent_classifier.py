@@ -0,0 +1,126 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.intent_classifier import (
+    DEFAULT_SAMPLES_PATH,
+    INTENTS,
+    LocalIntentClassifier,
+    load_samples
+)
+
+
+def stratified_folds(samples, folds: int, seed: int = 13):
+    """Split samples into folds with every label spread evenly"""
+    rng = random.Random(seed)
+    by_label = {}
+    for sample in samples:
+        by_label.setdefault(sample[1], []).append(sample)
+    buckets = [[] for _ in range(folds)]
+    for label_samples in by_label.values():
+        rng.shuffle(label_samples)
+        for position, sample in enumerate(label_samples):
+            buckets[position % folds].append(sample)
+    return buckets
+
+
+def cross_validate(samples, folds: int = 5, thresholds=(0.4, 0.5, 0.6, 0.7, 0.8, 0.9)):
+    """Out-of-fold (intent, confidence, source) for every sample, plus per-query latency"""
+    predictions = []
+    latencies = []
+    buckets = stratified_folds(samples, folds)
+    for held_out in range(folds):
+        train = [sample for index, bucket in enumerate(buckets) if index != held_out for sample in bucket]
+        classifier = LocalIntentClassifier.train(train)
+        for query, label in buckets[held_out]:
+            start = time.perf_counter()
+            intent, confidence, source = classifier.predict(query)
+            latencies.append((time.perf_counter() - start) * 1e6)
+            predictions.append((query, label, intent, confidence, source))
+
+    report = {}
+    for threshold in thresholds:
+        covered = [p for p in predictions if p[3] >= threshold]
+        correct = sum(1 for p in covered if p[1] == p[2])
+        report[threshold] = {
+            "coverage": len(covered) / len(predictions),
+            "accuracy": correct / len(covered) if covered else 0.0
+        }
+    return predictions, latencies, report
+
+
+def run_llm_baseline(samples, region: str):
+    """Accuracy and latency of the existing LLM-only classify_intent (needs AWS access)"""
+    from orchestrator_agent import OrchestratorAgent
+
+    orchestrator = OrchestratorAgent(region=region)
+    results = {}
+    for query, label in samples:
+        start = time.perf_counter()
+        intent = orchestrator._classify_intent_llm(query) or "CAREER_GUIDANCE"
+        results[query] = (intent, (time.perf_counter() - start) * 1000)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train and evaluate the local intent classifier")
+    parser.add_argument("--samples", default=DEFAULT_SAMPLES_PATH)
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.6)
+    parser.add_argument("--llm", action="store_true", help="Also run the LLM-only path (calls Bedrock)")
+    parser.add_argument("--llm-latency-ms", type=float, default=900.0,
+                        help="Assumed LLM classification latency when --llm is not given")
+    parser.add_argument("--region", default="us-west-2")
+    args = parser.parse_args()
+
+    samples = load_samples(args.samples)
+    predictions, latencies, report = cross_validate(samples, args.folds)
+    latencies.sort()
+
+    print("=" * 70)
+    print(f"LOCAL INTENT CLASSIFIER ({len(samples)} labeled queries, {args.folds}-fold cross-validation)")
+    print("=" * 70)
+    for label in INTENTS:
+        rows = [p for p in predictions if p[1] == label]
+        correct = sum(1 for p in rows if p[2] == label)
+        print(f"{label:<16} {correct:>3}/{len(rows):<3} correct (top-1, no fallback)")
+    rules = [p for p in predictions if p[4] == "rules"]
+    print(f"keyword rule features fired on {len(rules) / len(predictions):.0%} of queries, "
+          f"model accuracy on those {sum(1 for p in rules if p[1] == p[2]) / max(len(rules), 1):.1%}")
+    print(f"latency: median {latencies[len(latencies) // 2]:.0f} µs, p95 {latencies[int(len(latencies) * 0.95)]:.0f} µs")
+    print("-" * 70)
+    print(f"{'threshold':>9} | {'handled locally':>15} | {'local accuracy':>14}")
+    for threshold, row in report.items():
+        marker = "  <- default" if abs(threshold - args.threshold) < 1e-9 else ""
+        print(f"{threshold:>9.1f} | {row['coverage']:>15.1%} | {row['accuracy']:>14.1%}{marker}")
+    print("-" * 70)
+
+    chosen = report.get(args.threshold) or next(iter(report.values()))
+    local_ms = latencies[len(latencies) // 2] / 1000
+    if args.llm:
+        llm = run_llm_baseline(samples, args.region)
+        llm_accuracy = sum(1 for query, label in samples if llm[query][0] == label) / len(samples)
+        llm_ms = sum(latency for _, latency in llm.values()) / len(llm)
+        hybrid_correct = sum(
+            1 for query, label, intent, confidence, _ in predictions
+            if (intent if confidence >= args.threshold else llm[query][0]) == label
+        )
+        print(f"LLM only:   accuracy {llm_accuracy:.1%}, mean latency {llm_ms:.0f} ms")
+        print(f"local + LLM fallback: accuracy {hybrid_correct / len(samples):.1%}, "
+              f"mean latency {chosen['coverage'] * local_ms + (1 - chosen['coverage']) * llm_ms:.0f} ms")
+    else:
+        llm_ms = args.llm_latency_ms
+        print(f"LLM only (assumed {llm_ms:.0f} ms/query; run with --llm to measure)")
+        print(f"local + LLM fallback: mean routing latency ≈ "
+              f"{chosen['coverage'] * local_ms + (1 - chosen['coverage']) * llm_ms:.0f} ms "
+              f"({chosen['coverage']:.0%} of queries skip the LLM)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()